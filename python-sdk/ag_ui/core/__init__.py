@@ -2,46 +2,139 @@
 This module contains the core types and events for the Agent User Interaction Protocol.
 """
 
-from ag_ui.core.events import (
-    EventType,
-    BaseEvent,
-    TextMessageStartEvent,
-    TextMessageContentEvent,
-    TextMessageEndEvent,
-    TextMessageChunkEvent,
-    ToolCallStartEvent,
-    ToolCallArgsEvent,
-    ToolCallEndEvent,
-    ToolCallChunkEvent,
-    StateSnapshotEvent,
-    StateDeltaEvent,
-    MessagesSnapshotEvent,
-    RawEvent,
-    CustomEvent,
-    RunStartedEvent,
-    RunFinishedEvent,
-    RunErrorEvent,
-    StepStartedEvent,
-    StepFinishedEvent,
-    Event
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from ag_ui.core.types import (
-    FunctionCall,
-    ToolCall,
-    BaseMessage,
-    DeveloperMessage,
-    SystemMessage,
-    AssistantMessage,
-    UserMessage,
-    ToolMessage,
-    Message,
-    Role,
-    Context,
-    Tool,
-    RunAgentInput,
-    State
-)
+if TYPE_CHECKING:
+    from ag_ui.core.event_type import EventType
+    from ag_ui.core.events import (
+        BaseEvent,
+        TextMessageStartEvent,
+        TextMessageContentEvent,
+        TextMessageEndEvent,
+        TextMessageChunkEvent,
+        ToolCallStartEvent,
+        ToolCallArgsEvent,
+        ToolCallEndEvent,
+        ToolCallChunkEvent,
+        StateSnapshotEvent,
+        StateDeltaEvent,
+        MessagesSnapshotEvent,
+        RawEvent,
+        CustomEvent,
+        RunStartedEvent,
+        RunFinishedEvent,
+        RunErrorEvent,
+        StepStartedEvent,
+        StepFinishedEvent,
+        Event
+    )
+
+    from ag_ui.core.types import (
+        FunctionCall,
+        ToolCall,
+        BaseMessage,
+        DeveloperMessage,
+        SystemMessage,
+        AssistantMessage,
+        UserMessage,
+        ToolMessage,
+        Message,
+        Role,
+        Context,
+        Tool,
+        RunAgentInput,
+        State
+    )
+    from ag_ui.core.fast_events import (
+        FastEvent,
+        FastTextMessageStartEvent,
+        FastTextMessageContentEvent,
+        FastTextMessageEndEvent,
+        FastTextMessageChunkEvent,
+        FastToolCallStartEvent,
+        FastToolCallArgsEvent,
+        FastToolCallEndEvent,
+        FastToolCallChunkEvent,
+        FastStateSnapshotEvent,
+        FastStateDeltaEvent,
+        FastMessagesSnapshotEvent,
+        FastRawEvent,
+        FastCustomEvent,
+        FastRunStartedEvent,
+        FastRunFinishedEvent,
+        FastRunErrorEvent,
+        FastStepStartedEvent,
+        FastStepFinishedEvent
+    )
+    from ag_ui.core.ids import IdGenerator, StreamIds, generate_id
+
+# The submodule that defines each public name. Submodules are imported on
+# first access, so importing the package does not build the pydantic models
+# and `EventType` can be used without them.
+_LAZY_IMPORTS = {
+    # Events
+    "EventType": "ag_ui.core.event_type",
+    "BaseEvent": "ag_ui.core.events",
+    "TextMessageStartEvent": "ag_ui.core.events",
+    "TextMessageContentEvent": "ag_ui.core.events",
+    "TextMessageEndEvent": "ag_ui.core.events",
+    "TextMessageChunkEvent": "ag_ui.core.events",
+    "ToolCallStartEvent": "ag_ui.core.events",
+    "ToolCallArgsEvent": "ag_ui.core.events",
+    "ToolCallEndEvent": "ag_ui.core.events",
+    "ToolCallChunkEvent": "ag_ui.core.events",
+    "StateSnapshotEvent": "ag_ui.core.events",
+    "StateDeltaEvent": "ag_ui.core.events",
+    "MessagesSnapshotEvent": "ag_ui.core.events",
+    "RawEvent": "ag_ui.core.events",
+    "CustomEvent": "ag_ui.core.events",
+    "RunStartedEvent": "ag_ui.core.events",
+    "RunFinishedEvent": "ag_ui.core.events",
+    "RunErrorEvent": "ag_ui.core.events",
+    "StepStartedEvent": "ag_ui.core.events",
+    "StepFinishedEvent": "ag_ui.core.events",
+    "Event": "ag_ui.core.events",
+    # Types
+    "FunctionCall": "ag_ui.core.types",
+    "ToolCall": "ag_ui.core.types",
+    "BaseMessage": "ag_ui.core.types",
+    "DeveloperMessage": "ag_ui.core.types",
+    "SystemMessage": "ag_ui.core.types",
+    "AssistantMessage": "ag_ui.core.types",
+    "UserMessage": "ag_ui.core.types",
+    "ToolMessage": "ag_ui.core.types",
+    "Message": "ag_ui.core.types",
+    "Role": "ag_ui.core.types",
+    "Context": "ag_ui.core.types",
+    "Tool": "ag_ui.core.types",
+    "RunAgentInput": "ag_ui.core.types",
+    "State": "ag_ui.core.types",
+    # Fast events
+    "FastEvent": "ag_ui.core.fast_events",
+    "FastTextMessageStartEvent": "ag_ui.core.fast_events",
+    "FastTextMessageContentEvent": "ag_ui.core.fast_events",
+    "FastTextMessageEndEvent": "ag_ui.core.fast_events",
+    "FastTextMessageChunkEvent": "ag_ui.core.fast_events",
+    "FastToolCallStartEvent": "ag_ui.core.fast_events",
+    "FastToolCallArgsEvent": "ag_ui.core.fast_events",
+    "FastToolCallEndEvent": "ag_ui.core.fast_events",
+    "FastToolCallChunkEvent": "ag_ui.core.fast_events",
+    "FastStateSnapshotEvent": "ag_ui.core.fast_events",
+    "FastStateDeltaEvent": "ag_ui.core.fast_events",
+    "FastMessagesSnapshotEvent": "ag_ui.core.fast_events",
+    "FastRawEvent": "ag_ui.core.fast_events",
+    "FastCustomEvent": "ag_ui.core.fast_events",
+    "FastRunStartedEvent": "ag_ui.core.fast_events",
+    "FastRunFinishedEvent": "ag_ui.core.fast_events",
+    "FastRunErrorEvent": "ag_ui.core.fast_events",
+    "FastStepStartedEvent": "ag_ui.core.fast_events",
+    "FastStepFinishedEvent": "ag_ui.core.fast_events",
+    # IDs
+    "IdGenerator": "ag_ui.core.ids",
+    "StreamIds": "ag_ui.core.ids",
+    "generate_id": "ag_ui.core.ids"
+}
 
 __all__ = [
     # Events
@@ -80,5 +173,42 @@ __all__ = [
     "Context",
     "Tool",
     "RunAgentInput",
-    "State"
+    "State",
+    # Fast events
+    "FastEvent",
+    "FastTextMessageStartEvent",
+    "FastTextMessageContentEvent",
+    "FastTextMessageEndEvent",
+    "FastTextMessageChunkEvent",
+    "FastToolCallStartEvent",
+    "FastToolCallArgsEvent",
+    "FastToolCallEndEvent",
+    "FastToolCallChunkEvent",
+    "FastStateSnapshotEvent",
+    "FastStateDeltaEvent",
+    "FastMessagesSnapshotEvent",
+    "FastRawEvent",
+    "FastCustomEvent",
+    "FastRunStartedEvent",
+    "FastRunFinishedEvent",
+    "FastRunErrorEvent",
+    "FastStepStartedEvent",
+    "FastStepFinishedEvent",
+    # IDs
+    "IdGenerator",
+    "StreamIds",
+    "generate_id"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
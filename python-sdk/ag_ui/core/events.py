@@ -2,37 +2,13 @@
 This module contains the event types for the Agent User Interaction Protocol Python SDK.
 """
 
-from enum import Enum
 from typing import Any, List, Literal, Optional, Union, Annotated
 from pydantic import Field
 
+from .event_type import EventType
 from .types import Message, State, ConfiguredBaseModel
 
 
-class EventType(str, Enum):
-    """
-    The type of event.
-    """
-    TEXT_MESSAGE_START = "TEXT_MESSAGE_START"
-    TEXT_MESSAGE_CONTENT = "TEXT_MESSAGE_CONTENT"
-    TEXT_MESSAGE_END = "TEXT_MESSAGE_END"
-    TEXT_MESSAGE_CHUNK = "TEXT_MESSAGE_CHUNK"
-    TOOL_CALL_START = "TOOL_CALL_START"
-    TOOL_CALL_ARGS = "TOOL_CALL_ARGS"
-    TOOL_CALL_END = "TOOL_CALL_END"
-    TOOL_CALL_CHUNK = "TOOL_CALL_CHUNK"
-    STATE_SNAPSHOT = "STATE_SNAPSHOT"
-    STATE_DELTA = "STATE_DELTA"
-    MESSAGES_SNAPSHOT = "MESSAGES_SNAPSHOT"
-    RAW = "RAW"
-    CUSTOM = "CUSTOM"
-    RUN_STARTED = "RUN_STARTED"
-    RUN_FINISHED = "RUN_FINISHED"
-    RUN_ERROR = "RUN_ERROR"
-    STEP_STARTED = "STEP_STARTED"
-    STEP_FINISHED = "STEP_FINISHED"
-
-
 class BaseEvent(ConfiguredBaseModel):
     """
     Base event for all events in the Agent User Interaction Protocol.
@@ -183,6 +159,7 @@ class RunErrorEvent(BaseEvent):
     type: Literal[EventType.RUN_ERROR]
     message: str
     code: Optional[str] = None
+    retryable: Optional[bool] = None
 
 
 class StepStartedEvent(BaseEvent):
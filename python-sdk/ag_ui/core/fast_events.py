@@ -0,0 +1,188 @@
+"""
+This module contains compact representations of the events, for buffers and
+recorders that hold many events in memory.
+
+There is one FastEvent class for every event model, e.g.
+FastTextMessageContentEvent for TextMessageContentEvent. Their instances
+store the fields of the event in `__slots__` instead of a pydantic model,
+and convert cheaply to and from the models. The EventEncoder encodes them
+directly.
+"""
+
+import typing
+from typing import Any, ClassVar, Dict, FrozenSet, Tuple, Type, Union
+
+from pydantic import BaseModel
+from pydantic.alias_generators import to_camel
+from pydantic_core import from_json, to_json
+
+from .event_type import EventType
+from .events import (
+    BaseEvent,
+    TextMessageStartEvent,
+    TextMessageContentEvent,
+    TextMessageEndEvent,
+    TextMessageChunkEvent,
+    ToolCallStartEvent,
+    ToolCallArgsEvent,
+    ToolCallEndEvent,
+    ToolCallChunkEvent,
+    StateSnapshotEvent,
+    StateDeltaEvent,
+    MessagesSnapshotEvent,
+    RawEvent,
+    CustomEvent,
+    RunStartedEvent,
+    RunFinishedEvent,
+    RunErrorEvent,
+    StepStartedEvent,
+    StepFinishedEvent
+)
+
+
+class FastEvent:
+    """
+    Base class of the compact events.
+
+    Fast events are created from keyword arguments named like the fields of
+    their model, and are not validated: use `to_model(validate=True)` to
+    check one. `type` is a class attribute.
+    """
+    __slots__ = ("timestamp", "raw_event")
+
+    type: ClassVar[EventType]
+    model: ClassVar[Type[BaseEvent]]
+    # Field names in model order, without `type`, and their JSON names
+    fields: ClassVar[Tuple[str, ...]] = ("timestamp", "raw_event")
+    aliases: ClassVar[Tuple[str, ...]] = ("timestamp", "rawEvent")
+    _required: ClassVar[FrozenSet[str]] = frozenset()
+    # Whether the model has nested models, which must be validated into models
+    _nested: ClassVar[bool] = False
+
+    def __init__(self, **values: Any):
+        for name in self.fields:
+            if name in values:
+                setattr(self, name, values.pop(name))
+            elif name in self._required:
+                raise TypeError(f"{type(self).__name__} is missing the field {name!r}")
+            else:
+                setattr(self, name, None)
+        if values:
+            raise TypeError(f"{type(self).__name__} has no field {next(iter(values))!r}")
+
+    @staticmethod
+    def from_model(event: BaseEvent) -> "FastEvent":
+        """
+        Returns the fast event of an event model.
+        """
+        cls = FAST_EVENT_CLASSES[event.type]
+        fast = cls.__new__(cls)
+        for name in cls.fields:
+            setattr(fast, name, getattr(event, name))
+        return fast
+
+    @staticmethod
+    def from_json(data: Union[str, bytes]) -> "FastEvent":
+        """
+        Decodes an event from its JSON encoding without building its model.
+        Nested values, like the messages of a MESSAGES_SNAPSHOT, are kept as
+        parsed JSON.
+        """
+        values = from_json(data)
+        cls = FAST_EVENT_CLASSES[EventType(values.pop("type"))]
+        fast = cls.__new__(cls)
+        for name, alias in zip(cls.fields, cls.aliases):
+            setattr(fast, name, values.pop(alias, None))
+        if values:
+            raise ValueError(f"{cls.type.value} event has no field {next(iter(values))!r}")
+        return fast
+
+    def to_model(self, validate: bool = False) -> BaseEvent:
+        """
+        Returns the event model of the fast event. Without `validate` the
+        model is constructed without validation, unless it has nested models.
+        """
+        values = {name: getattr(self, name) for name in self.fields}
+        if validate or self._nested:
+            return self.model(type=self.type, **values)
+        return self.model.model_construct(type=self.type, **values)
+
+    def to_json(self) -> str:
+        """
+        Returns the JSON encoding of the event, the same as the model's
+        `model_dump_json(by_alias=True, exclude_none=True)`.
+        """
+        values: Dict[str, Any] = {"type": self.type}
+        for name, alias in zip(self.fields, self.aliases):
+            value = getattr(self, name)
+            if value is not None:
+                values[alias] = value
+        return to_json(values, by_alias=True, exclude_none=True).decode()
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.fields)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.fields
+            if getattr(self, name) is not None
+        )
+        return f"{type(self).__name__}({values})"
+
+
+def _has_models(annotation: Any) -> bool:
+    """
+    Returns whether a type annotation contains pydantic models.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_has_models(argument) for argument in typing.get_args(annotation))
+
+
+def _fast_event_class(model: Type[BaseEvent]) -> Type[FastEvent]:
+    """
+    Creates the fast event class of an event model.
+    """
+    model_fields = {name: field for name, field in model.model_fields.items() if name != "type"}
+    own_fields = tuple(name for name in model_fields if name not in FastEvent.fields)
+    fields = FastEvent.fields + own_fields
+    return type(f"Fast{model.__name__}", (FastEvent,), {
+        "__slots__": own_fields,
+        "__doc__": f"Compact representation of {model.__name__}.",
+        "__module__": __name__,
+        "type": typing.get_args(model.model_fields["type"].annotation)[0],
+        "model": model,
+        "fields": fields,
+        "aliases": tuple(to_camel(name) for name in fields),
+        "_required": frozenset(name for name, field in model_fields.items() if field.is_required()),
+        "_nested": any(_has_models(field.annotation) for field in model_fields.values()),
+    })
+
+
+FastTextMessageStartEvent = _fast_event_class(TextMessageStartEvent)
+FastTextMessageContentEvent = _fast_event_class(TextMessageContentEvent)
+FastTextMessageEndEvent = _fast_event_class(TextMessageEndEvent)
+FastTextMessageChunkEvent = _fast_event_class(TextMessageChunkEvent)
+FastToolCallStartEvent = _fast_event_class(ToolCallStartEvent)
+FastToolCallArgsEvent = _fast_event_class(ToolCallArgsEvent)
+FastToolCallEndEvent = _fast_event_class(ToolCallEndEvent)
+FastToolCallChunkEvent = _fast_event_class(ToolCallChunkEvent)
+FastStateSnapshotEvent = _fast_event_class(StateSnapshotEvent)
+FastStateDeltaEvent = _fast_event_class(StateDeltaEvent)
+FastMessagesSnapshotEvent = _fast_event_class(MessagesSnapshotEvent)
+FastRawEvent = _fast_event_class(RawEvent)
+FastCustomEvent = _fast_event_class(CustomEvent)
+FastRunStartedEvent = _fast_event_class(RunStartedEvent)
+FastRunFinishedEvent = _fast_event_class(RunFinishedEvent)
+FastRunErrorEvent = _fast_event_class(RunErrorEvent)
+FastStepStartedEvent = _fast_event_class(StepStartedEvent)
+FastStepFinishedEvent = _fast_event_class(StepFinishedEvent)
+
+# The fast event class of every event type
+FAST_EVENT_CLASSES: Dict[EventType, Type[FastEvent]] = {
+    cls.type: cls for cls in FastEvent.__subclasses__()
+}
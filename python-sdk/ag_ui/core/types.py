@@ -9,12 +9,16 @@ from pydantic.alias_generators import to_camel
 class ConfiguredBaseModel(BaseModel):
     """
     A configurable base model.
+
+    Validators and serializers are built when a model is first used rather
+    than when it is defined, so importing the SDK stays cheap.
     """
     model_config = ConfigDict(
         extra="forbid",
         alias_generator=to_camel,
         populate_by_name=True,
-        ser_json_by_alias=True
+        ser_json_by_alias=True,
+        defer_build=True
     )
 
 
@@ -117,6 +121,10 @@ class RunAgentInput(ConfiguredBaseModel):
     """
     Input for running an agent.
     """
+    # Built eagerly: every request validates it, and FastAPI warns about the
+    # Body() metadata of request models whose schema is deferred
+    model_config = ConfigDict(defer_build=False)
+
     thread_id: str
     run_id: str
     state: Any
@@ -124,6 +132,11 @@ class RunAgentInput(ConfiguredBaseModel):
     tools: List[Tool]
     context: List[Context]
     forwarded_props: Any
+    # Reference to a tool list, from the AG-UI-Tools-Ref header of an earlier run, sent with empty tools
+    tools_ref: Optional[str] = None
+    # Number of messages of the thread the server already has; messages then
+    # only holds the messages that follow them
+    base_version: Optional[int] = Field(default=None, ge=0)
 
 
 # State can be any type
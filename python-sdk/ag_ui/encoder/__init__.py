@@ -3,5 +3,29 @@ This module contains the EventEncoder class.
 """
 
 from ag_ui.encoder.encoder import EventEncoder, AGUI_MEDIA_TYPE
+from ag_ui.encoder.instrumentation import (
+    EncodeSample,
+    Instrumentation,
+    PrometheusInstrumentation,
+    OpenTelemetryInstrumentation
+)
+from ag_ui.encoder.offload import OffloadPolicy, encode_event
+from ag_ui.encoder.snapshot_cache import FrozenState, SnapshotCache, freeze_state
+from ag_ui.encoder.timeline import TimelineRecorder, TimelineEntry, StepSpan
 
-__all__ = ["EventEncoder", "AGUI_MEDIA_TYPE"]
+__all__ = [
+    "EventEncoder",
+    "AGUI_MEDIA_TYPE",
+    "EncodeSample",
+    "Instrumentation",
+    "PrometheusInstrumentation",
+    "OpenTelemetryInstrumentation",
+    "OffloadPolicy",
+    "encode_event",
+    "SnapshotCache",
+    "FrozenState",
+    "freeze_state",
+    "TimelineRecorder",
+    "TimelineEntry",
+    "StepSpan"
+]
@@ -2,16 +2,74 @@
 This module contains the EventEncoder class
 """
 
-from ag_ui.core.events import BaseEvent
+import time
+from json.encoder import encode_basestring
+from typing import Callable, Optional, Union
+
+from ag_ui.core.events import BaseEvent, EventType
+from ag_ui.core.fast_events import FastEvent
+from ag_ui.core.ids import StreamIds
+from ag_ui.encoder.instrumentation import EncodeSample, Instrumentation
+from ag_ui.encoder.offload import OffloadPolicy, encode_event
+from ag_ui.encoder.snapshot_cache import SnapshotCache
 
 AGUI_MEDIA_TYPE = "application/vnd.ag-ui.event+proto"
 
+# The JSON that starts each chunk event, and the field with its ID
+_CHUNK_EVENTS = {
+    EventType.TEXT_MESSAGE_CONTENT: ('data: {"type":"TEXT_MESSAGE_CONTENT","messageId":', "message_id"),
+    EventType.TOOL_CALL_ARGS: ('data: {"type":"TOOL_CALL_ARGS","toolCallId":', "tool_call_id"),
+}
+
+# The field with the ID that ends with each event
+_END_EVENTS = {
+    EventType.TEXT_MESSAGE_END: "message_id",
+    EventType.TOOL_CALL_END: "tool_call_id",
+}
+
+# The events that start and end a run, rather than being produced by the agent
+_LIFECYCLE_EVENTS = frozenset((EventType.RUN_STARTED, EventType.RUN_FINISHED, EventType.RUN_ERROR))
+
 class EventEncoder:
     """
     Encodes Agent User Interaction events.
+
+    Events can be event models or FastEvents. An encoder is created per run.
+    With `instrumentation`, the encode time and size of the events, the time
+    to the first event and the duration of the run are reported to it,
+    labelled with `agent`. Without it, encoding is not measured at all.
+    Run times are measured from `started`, a `time.perf_counter()` value such
+    as the arrival of the request, or from the creation of the encoder. The
+    time to the first event is measured to the first event the agent
+    produced; the RUN_STARTED, RUN_FINISHED and RUN_ERROR events around it do
+    not count.
+
+    Text message and tool call chunks are the bulk of a stream, so they are
+    encoded from a template, with the JSON form of their message or tool
+    call ID cached until the message or tool call ends.
+
+    With an `offload` policy, `encode_async` encodes large events in an
+    executor so they do not block the event loop. With a `snapshot_cache`,
+    state snapshots that were sent before are not encoded again.
     """
-    def __init__(self, accept: str = None):
-        pass
+    def __init__(
+        self,
+        accept: str = None,
+        instrumentation: Optional[Instrumentation] = None,
+        agent: Optional[str] = None,
+        offload: Optional[OffloadPolicy] = None,
+        snapshot_cache: Optional[SnapshotCache] = None,
+        started: Optional[float] = None
+    ):
+        self._instrumentation = instrumentation
+        self._agent = agent
+        self.offload = offload
+        self.snapshot_cache = snapshot_cache
+        self._ids = StreamIds()
+        if instrumentation is not None:
+            self._started = started if started is not None else time.perf_counter()
+            self._events = 0
+            self._first_event = True
 
     def get_content_type(self) -> str:
         """
@@ -19,14 +77,106 @@ class EventEncoder:
         """
         return "text/event-stream"
 
-    def encode(self, event: BaseEvent) -> str:
+    def encode(self, event: Union[BaseEvent, FastEvent]) -> str:
         """
         Encodes an event.
         """
-        return self._encode_sse(event)
+        if self._instrumentation is None:
+            return self._encode_sse(event)
+        return self._encode_instrumented(event)
+
+    async def encode_async(self, event: Union[BaseEvent, FastEvent]) -> str:
+        """
+        Encodes an event, in the executor of the offload policy if it is
+        large. Await each event before encoding the next one to keep them in
+        order. Offloaded events are reported to the instrumentation with the
+        time the event loop spent on them.
+        """
+        offload = self.offload
+        cache = self.snapshot_cache
+        if (
+            offload is None
+            or (cache is not None and cache.get(event) is not None)
+            or not offload.should_offload(event)
+        ):
+            return self.encode(event)
+        encoded = await offload.encode(event)
+        if cache is not None:
+            cache.put(event, encoded)
+        if self._instrumentation is None:
+            return encoded
+        return self._encode_instrumented(event, lambda _: encoded)
 
-    def _encode_sse(self, event: BaseEvent) -> str:
+    def _encode_instrumented(
+        self,
+        event: Union[BaseEvent, FastEvent],
+        encode: Optional[Callable[[Union[BaseEvent, FastEvent]], str]] = None
+    ) -> str:
+        """
+        Encodes an event and reports its measurements.
+        """
+        encode = encode if encode is not None else self._encode_sse
+        instrumentation = self._instrumentation
+        self._events += 1
+        if self._first_event and event.type not in _LIFECYCLE_EVENTS:
+            self._first_event = False
+            instrumentation.on_first_event(self._agent, time.perf_counter() - self._started)
+
+        if self._events % instrumentation.sample_every:
+            encoded = encode(event)
+        else:
+            started = time.perf_counter()
+            encoded = encode(event)
+            instrumentation.on_encode(EncodeSample(
+                event_type=event.type,
+                agent=self._agent,
+                seconds=time.perf_counter() - started,
+                size=len(encoded.encode("utf-8")),
+                weight=instrumentation.sample_every
+            ))
+
+        if event.type in (EventType.RUN_FINISHED, EventType.RUN_ERROR):
+            instrumentation.on_run_finished(
+                self._agent,
+                time.perf_counter() - self._started,
+                self._events,
+                event.type == EventType.RUN_ERROR
+            )
+        return encoded
+
+    def _encode_sse(self, event: Union[BaseEvent, FastEvent]) -> str:
         """
         Encodes an event into an SSE string.
         """
-        return f"data: {event.model_dump_json(by_alias=True, exclude_none=True)}\n\n"
+        chunk = _CHUNK_EVENTS.get(event.type)
+        if chunk is not None and event.timestamp is None and event.raw_event is None:
+            start, id_field = chunk
+            value = getattr(event, id_field)
+            delta = event.delta
+            # Strings with lone surrogates are left to the model, which rejects them
+            if _is_utf8(value) and _is_utf8(delta):
+                return f'{start}{self._ids.json(value)},"delta":{encode_basestring(delta)}}}\n\n'
+
+        end = _END_EVENTS.get(event.type)
+        if end is not None:
+            self._ids.release(getattr(event, end))
+
+        cache = self.snapshot_cache
+        if cache is not None and event.type == EventType.STATE_SNAPSHOT:
+            encoded = cache.get(event)
+            if encoded is None:
+                encoded = encode_event(event)
+                cache.put(event, encoded)
+            return encoded
+
+        return encode_event(event)
+
+
+def _is_utf8(value: str) -> bool:
+    if value.isascii():
+        return True
+    try:
+        value.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
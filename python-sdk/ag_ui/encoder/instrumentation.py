@@ -0,0 +1,180 @@
+"""
+This module contains the instrumentation hooks of the EventEncoder.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+from ag_ui.core.events import EventType
+
+
+class EncodeSample(NamedTuple):
+    """
+    The measurement of one encoded event.
+
+    `weight` is the number of events the sample stands for, so counters can be
+    scaled back to totals when only one in `weight` events is measured.
+    """
+    event_type: EventType
+    agent: Optional[str]
+    seconds: float
+    size: int
+    weight: int
+
+
+class Instrumentation:
+    """
+    Receives measurements from the EventEncoder.
+
+    Subclasses override the hooks they need; the default implementations do
+    nothing. With a `sample_rate` below 1, only one in every 1 / `sample_rate`
+    events is timed and passed to `on_encode`, while run measurements are
+    always reported.
+
+    Hooks are called on the hot path of the stream, so they should only
+    record the values and leave aggregation to the metrics backend.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self.sample_every = max(round(1 / sample_rate), 1)
+
+    def on_encode(self, sample: EncodeSample) -> None:
+        """
+        Called with the measurement of a sampled event.
+        """
+
+    def on_first_event(self, agent: Optional[str], seconds: float) -> None:
+        """
+        Called when the first event produced by the agent is encoded, with
+        the time since the run started.
+        """
+
+    def on_run_finished(
+        self,
+        agent: Optional[str],
+        seconds: float,
+        events: int,
+        error: bool
+    ) -> None:
+        """
+        Called when a RUN_FINISHED or RUN_ERROR event is encoded, with the
+        duration of the run and the number of events it sent.
+        """
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """
+    Exports the measurements as Prometheus metrics, labelled by agent and
+    event type. Needs the `prometheus_client` package.
+    """
+
+    def __init__(
+        self,
+        registry: Any = None,
+        namespace: str = "ag_ui",
+        sample_rate: float = 1.0
+    ):
+        super().__init__(sample_rate)
+        try:
+            import prometheus_client
+        except ImportError as error:
+            raise ImportError(
+                "PrometheusInstrumentation needs prometheus_client: pip install prometheus-client"
+            ) from error
+
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        options = {"namespace": namespace, "registry": registry}
+
+        self.events = prometheus_client.Counter(
+            "events", "Encoded events", ["agent", "event_type"], **options
+        )
+        self.bytes = prometheus_client.Counter(
+            "event_bytes", "Encoded bytes", ["agent", "event_type"], **options
+        )
+        self.encode_seconds = prometheus_client.Histogram(
+            "encode_seconds", "Time spent encoding an event", ["agent", "event_type"],
+            buckets=(1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2), **options
+        )
+        self.first_event_seconds = prometheus_client.Histogram(
+            "time_to_first_event_seconds", "Time until the first event of a run", ["agent"],
+            **options
+        )
+        self.run_seconds = prometheus_client.Histogram(
+            "run_duration_seconds", "Duration of a run", ["agent", "outcome"], **options
+        )
+
+    def on_encode(self, sample: EncodeSample) -> None:
+        labels = (sample.agent or "", sample.event_type.value)
+        self.events.labels(*labels).inc(sample.weight)
+        self.bytes.labels(*labels).inc(sample.size * sample.weight)
+        self.encode_seconds.labels(*labels).observe(sample.seconds)
+
+    def on_first_event(self, agent: Optional[str], seconds: float) -> None:
+        self.first_event_seconds.labels(agent or "").observe(seconds)
+
+    def on_run_finished(
+        self,
+        agent: Optional[str],
+        seconds: float,
+        events: int,
+        error: bool
+    ) -> None:
+        self.run_seconds.labels(agent or "", "error" if error else "finished").observe(seconds)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Exports the measurements as OpenTelemetry metrics, with the agent and
+    event type as attributes. Needs the `opentelemetry-api` package; uses the
+    global meter provider unless a meter is given.
+    """
+
+    def __init__(self, meter: Any = None, sample_rate: float = 1.0):
+        super().__init__(sample_rate)
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError as error:
+                raise ImportError(
+                    "OpenTelemetryInstrumentation needs opentelemetry-api: "
+                    "pip install opentelemetry-api"
+                ) from error
+            meter = metrics.get_meter("ag_ui.encoder")
+
+        self.events = meter.create_counter(
+            "ag_ui.events", unit="{event}", description="Encoded events"
+        )
+        self.bytes = meter.create_counter(
+            "ag_ui.event.bytes", unit="By", description="Encoded bytes"
+        )
+        self.encode_duration = meter.create_histogram(
+            "ag_ui.encode.duration", unit="s", description="Time spent encoding an event"
+        )
+        self.first_event_duration = meter.create_histogram(
+            "ag_ui.run.time_to_first_event", unit="s", description="Time until the first event of a run"
+        )
+        self.run_duration = meter.create_histogram(
+            "ag_ui.run.duration", unit="s", description="Duration of a run"
+        )
+
+    def on_encode(self, sample: EncodeSample) -> None:
+        attributes = {"agent": sample.agent or "", "event_type": sample.event_type.value}
+        self.events.add(sample.weight, attributes)
+        self.bytes.add(sample.size * sample.weight, attributes)
+        self.encode_duration.record(sample.seconds, attributes)
+
+    def on_first_event(self, agent: Optional[str], seconds: float) -> None:
+        self.first_event_duration.record(seconds, {"agent": agent or ""})
+
+    def on_run_finished(
+        self,
+        agent: Optional[str],
+        seconds: float,
+        events: int,
+        error: bool
+    ) -> None:
+        self.run_duration.record(
+            seconds, {"agent": agent or "", "outcome": "error" if error else "finished"}
+        )
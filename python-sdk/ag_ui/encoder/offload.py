@@ -0,0 +1,125 @@
+"""
+This module contains the OffloadPolicy of the EventEncoder, which encodes
+large events in an executor instead of on the event loop.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Collection, Dict, Optional, Union
+
+from pydantic import BaseModel
+
+from ag_ui.core.events import BaseEvent, EventType
+from ag_ui.core.fast_events import FastEvent
+
+# The field holding the payload of each event type that can be large
+PAYLOAD_FIELDS: Dict[EventType, str] = {
+    EventType.STATE_SNAPSHOT: "snapshot",
+    EventType.MESSAGES_SNAPSHOT: "messages",
+    EventType.STATE_DELTA: "delta",
+    EventType.CUSTOM: "value",
+    EventType.RAW: "event",
+}
+
+# The number of items of a list or dict that its size is estimated from
+ESTIMATE_SAMPLE = 16
+
+_default_executor: Optional[ThreadPoolExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ag-ui-encode")
+        return _default_executor
+
+
+def encode_event(event: Union[BaseEvent, FastEvent]) -> str:
+    """
+    Encodes an event into an SSE string. Runs in executors, so it only
+    depends on the event.
+    """
+    if isinstance(event, FastEvent):
+        return f"data: {event.to_json()}\n\n"
+    return f"data: {event.model_dump_json(by_alias=True, exclude_none=True)}\n\n"
+
+
+def estimate_size(value: Any, limit: int) -> int:
+    """
+    Estimates the size of a value encoded as JSON, in bytes. Long lists and
+    dicts are estimated from their first items, and the estimate stops
+    growing once it exceeds `limit`, so it stays cheap whatever the size of
+    the value.
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, BaseModel):
+        value = value.__dict__
+    elif isinstance(value, FastEvent):
+        value = {key: getattr(value, key) for key in value.fields}
+    if isinstance(value, dict):
+        items = len(value)
+        size = 2 + 4 * items
+        sample = islice(value.items(), ESTIMATE_SAMPLE)
+    elif isinstance(value, (list, tuple)):
+        items = len(value)
+        size = 2 + items
+        sample = (("", item) for item in islice(value, ESTIMATE_SAMPLE))
+    else:
+        return 8
+    sampled = 0
+    for key, item in sample:
+        sampled += len(key) + estimate_size(item, limit)
+        if size + sampled > limit:
+            return limit + 1
+    if items > ESTIMATE_SAMPLE:
+        sampled = sampled * items // ESTIMATE_SAMPLE
+    return min(size + sampled, limit + 1)
+
+
+class OffloadPolicy:
+    """
+    Decides which events an EventEncoder encodes off the event loop.
+
+    Events whose payload is estimated to be larger than `threshold` bytes,
+    such as big state or messages snapshots, are encoded in `executor` by
+    `EventEncoder.encode_async`, so that one large event does not stall
+    every other stream served by the event loop.
+
+    Without an executor, a thread pool shared by all encoders is used, which
+    lets the loop interleave other work with large events but still shares
+    the GIL with it. A ProcessPoolExecutor encodes in parallel, at the cost
+    of pickling the events; its workers must be able to import the SDK.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 256 * 1024,
+        executor: Optional[Executor] = None,
+        event_types: Optional[Collection[EventType]] = None
+    ):
+        self.threshold = threshold
+        self.executor = executor
+        self.event_types = frozenset(event_types if event_types is not None else PAYLOAD_FIELDS)
+
+    def should_offload(self, event: Union[BaseEvent, FastEvent]) -> bool:
+        """
+        Returns whether an event is large enough to be encoded off the loop.
+        """
+        event_type = event.type
+        if event_type not in self.event_types:
+            return False
+        field = PAYLOAD_FIELDS.get(event_type)
+        payload = getattr(event, field) if field is not None else event
+        return estimate_size(payload, self.threshold) > self.threshold
+
+    async def encode(self, event: Union[BaseEvent, FastEvent]) -> str:
+        """
+        Encodes an event in the executor.
+        """
+        executor = self.executor if self.executor is not None else _get_default_executor()
+        return await asyncio.get_running_loop().run_in_executor(executor, encode_event, event)
@@ -0,0 +1,113 @@
+"""
+This module contains the SnapshotCache of the EventEncoder, which keeps the
+encoded form of recent state snapshots, and the frozen states it caches.
+"""
+
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, Union
+
+from pydantic import ConfigDict, RootModel
+from pydantic_core import from_json, to_json
+
+from ag_ui.core.events import BaseEvent, EventType
+from ag_ui.core.fast_events import FastEvent
+
+
+class FrozenState(RootModel[Any]):
+    """
+    A copy of a state that is encoded like the state itself, built by
+    `freeze_state`. The copy is owned by the FrozenState: changes to the
+    original state do not reach it, and `root` must not be modified.
+    """
+    model_config = ConfigDict(frozen=True)
+
+
+def freeze_state(value: Any) -> FrozenState:
+    """
+    Returns a frozen copy of a JSON state, to send in state snapshots that
+    a SnapshotCache encodes once.
+    """
+    return FrozenState(from_json(to_json(value)))
+
+
+class SnapshotCache:
+    """
+    Keeps the encoded state snapshots of recent runs, so that a snapshot
+    sent again is not encoded again.
+
+        RECIPE = freeze_state({"recipe": ...})
+
+        cache = SnapshotCache()
+        encoder = EventEncoder(snapshot_cache=cache)
+
+    Only snapshots of states frozen with `freeze_state` are cached, since
+    they are recognized by identity: an agent that sends the same frozen
+    state again, such as a module-level constant or a state it keeps
+    between runs, gets the bytes encoded the first time. To change the
+    state, freeze a new one. Cached states are kept alive by the cache, so
+    their identity cannot be taken by another state. Other snapshots, and
+    snapshots with a timestamp or raw event, are encoded as usual.
+
+    The most recently used snapshots are kept, up to `max_entries` of them
+    and `max_bytes` of encoded events, in UTF-8, in total. Snapshots encoded
+    to more than `max_bytes` are not cached. A cache can be shared by all
+    encoders.
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[int, Tuple[FrozenState, str, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, event: Union[BaseEvent, FastEvent]) -> Optional[str]:
+        """
+        Returns the encoded form of an event, if it is a cached snapshot.
+        """
+        if not _cacheable(event):
+            return None
+        key = id(event.snapshot)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, event: Union[BaseEvent, FastEvent], encoded: str) -> None:
+        """
+        Caches the encoded form of an event, if it is a snapshot of a frozen
+        state.
+        """
+        if not _cacheable(event):
+            return
+        size = len(encoded) if encoded.isascii() else len(encoded.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        key = id(event.snapshot)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous[2]
+        self._entries[key] = (event.snapshot, encoded, size)
+        self.size += size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+
+    def clear(self) -> None:
+        """
+        Removes all snapshots.
+        """
+        self._entries.clear()
+        self.size = 0
+
+
+def _cacheable(event: Union[BaseEvent, FastEvent]) -> bool:
+    return (
+        event.type == EventType.STATE_SNAPSHOT
+        and isinstance(event.snapshot, FrozenState)
+        and event.timestamp is None
+        and event.raw_event is None
+    )
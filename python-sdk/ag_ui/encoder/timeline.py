@@ -0,0 +1,231 @@
+"""
+This module contains the TimelineRecorder, which records where the wall time
+of a run is spent and exports it as a Chrome trace or a speedscope profile.
+"""
+
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, NamedTuple, Optional
+
+from ag_ui.core.events import BaseEvent, EventType
+from ag_ui.encoder.encoder import EventEncoder
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class TimelineEntry(NamedTuple):
+    """
+    The timestamps of one event, in seconds of the recorder's clock.
+
+    `flushed` is None if the stream was closed before the event was consumed.
+    """
+    event_type: EventType
+    generated: float
+    encoded: float
+    flushed: Optional[float]
+
+
+class StepSpan(NamedTuple):
+    """
+    A step of the run, from its STEP_STARTED to its STEP_FINISHED event.
+
+    Steps that overlap are placed on different lanes.
+    """
+    name: str
+    start: float
+    end: float
+    lane: int
+
+
+class _Slice(NamedTuple):
+    name: str
+    start: float
+    end: float
+
+
+class TimelineRecorder:
+    """
+    Records a timeline of a run's event stream.
+
+    `stream` encodes the events of a run like the encoder does and records,
+    for every event, when the agent generated it, when it was encoded and
+    when the consumer asked for the next event, which for a streaming
+    response is after the previous event was handed to the socket. The time
+    between flushing an event and generating the next one is spent in the
+    agent, waiting for the model or executing tools; the time between
+    encoding and flushing is spent in socket backpressure. Events without a
+    timestamp get the time at which they were generated.
+
+    The recorder is opt-in and meant for one run:
+
+        recorder = TimelineRecorder(encoder)
+        async for data in recorder.stream(agent(input_data)):
+            yield data
+        json.dump(recorder.to_chrome_trace(), file)
+    """
+
+    def __init__(
+        self,
+        encoder: Optional[EventEncoder] = None,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        self.encoder = encoder if encoder is not None else EventEncoder()
+        self.clock = clock
+        self.entries: List[TimelineEntry] = []
+        self.steps: List[StepSpan] = []
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        # Open steps by name, with their start time and lane
+        self._open_steps: Dict[str, tuple] = {}
+
+    async def stream(self, events: AsyncIterator[BaseEvent]) -> AsyncIterator[str]:
+        """
+        Encodes the events of a run and records their timeline.
+        """
+        clock = self.clock
+        encode = self.encoder.encode
+        self.started = clock()
+        try:
+            async for event in events:
+                generated = clock()
+                if event.timestamp is None:
+                    event.timestamp = int(time.time() * 1000)
+                self._observe_step(event, generated)
+
+                data = encode(event)
+                entry = TimelineEntry(event.type, generated, clock(), None)
+                self.entries.append(entry)
+                yield data
+                self.entries[-1] = entry._replace(flushed=clock())
+        finally:
+            self.finished = clock()
+            for name, (start, lane) in self._open_steps.items():
+                self.steps.append(StepSpan(name, start, self.finished, lane))
+            self._open_steps.clear()
+
+    def _observe_step(self, event: BaseEvent, now: float) -> None:
+        if event.type == EventType.STEP_STARTED:
+            busy = {lane for _, lane in self._open_steps.values()}
+            lane = next(lane for lane in range(len(busy) + 1) if lane not in busy)
+            self._open_steps[event.step_name] = (now, lane)
+        elif event.type == EventType.STEP_FINISHED:
+            opened = self._open_steps.pop(event.step_name, None)
+            if opened is not None:
+                self.steps.append(StepSpan(event.step_name, opened[0], now, opened[1]))
+
+    def _stream_slices(self) -> List[_Slice]:
+        """
+        Returns the consecutive slices of agent, encoding and flush time.
+        """
+        slices = []
+        previous = self.started
+        for entry in self.entries:
+            if entry.generated > previous:
+                slices.append(_Slice("agent", previous, entry.generated))
+            slices.append(_Slice(f"encode {entry.event_type.value}", entry.generated, entry.encoded))
+            if entry.flushed is None:
+                break
+            slices.append(_Slice("flush", entry.encoded, entry.flushed))
+            previous = entry.flushed
+        return slices
+
+    def _end(self) -> float:
+        if self.finished is not None:
+            return self.finished
+        return self.clock()
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Returns the timeline in the Chrome trace event format, for
+        chrome://tracing or Perfetto. The run and its events are on the first
+        track, steps on the tracks below it.
+        """
+        if self.started is None:
+            raise RuntimeError("The recorder has not recorded a stream")
+
+        def micros(seconds: float) -> float:
+            return (seconds - self.started) * 1e6
+
+        def complete(name: str, category: str, start: float, end: float, tid: int) -> Dict[str, Any]:
+            return {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": micros(start),
+                "dur": (end - start) * 1e6,
+                "pid": 1,
+                "tid": tid
+            }
+
+        trace = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "stream"}},
+            complete("run", "run", self.started, self._end(), 0)
+        ]
+        for piece in self._stream_slices():
+            trace.append(complete(piece.name, piece.name.split(" ")[0], piece.start, piece.end, 0))
+
+        for lane in sorted({step.lane for step in self.steps}):
+            trace.append({
+                "name": "thread_name", "ph": "M", "pid": 1, "tid": lane + 1,
+                "args": {"name": f"steps {lane + 1}"}
+            })
+        for step in self.steps:
+            trace.append(complete(step.name, "step", step.start, step.end, step.lane + 1))
+
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self, name: str = "run") -> Dict[str, Any]:
+        """
+        Returns the timeline as a speedscope profile, with one profile for the
+        stream and one per lane of steps.
+        """
+        if self.started is None:
+            raise RuntimeError("The recorder has not recorded a stream")
+
+        frames: List[Dict[str, str]] = []
+        frame_indexes: Dict[str, int] = {}
+
+        def frame(frame_name: str) -> int:
+            if frame_name not in frame_indexes:
+                frame_indexes[frame_name] = len(frames)
+                frames.append({"name": frame_name})
+            return frame_indexes[frame_name]
+
+        def micros(seconds: float) -> float:
+            return (seconds - self.started) * 1e6
+
+        end = micros(self._end())
+
+        def profile(profile_name: str, slices: List[_Slice], root: Optional[str]) -> Dict[str, Any]:
+            events = []
+            if root is not None:
+                events.append({"type": "O", "frame": frame(root), "at": 0.0})
+            for piece in slices:
+                index = frame(piece.name)
+                events.append({"type": "O", "frame": index, "at": micros(piece.start)})
+                events.append({"type": "C", "frame": index, "at": micros(piece.end)})
+            if root is not None:
+                events.append({"type": "C", "frame": frame(root), "at": end})
+            return {
+                "type": "evented",
+                "name": profile_name,
+                "unit": "microseconds",
+                "startValue": 0.0,
+                "endValue": end,
+                "events": events
+            }
+
+        profiles = [profile(name, self._stream_slices(), name)]
+        for lane in sorted({step.lane for step in self.steps}):
+            steps = sorted(
+                (_Slice(step.name, step.start, step.end) for step in self.steps if step.lane == lane),
+                key=lambda piece: piece.start
+            )
+            profiles.append(profile(f"{name} steps {lane + 1}", steps, None))
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "name": name,
+            "exporter": "ag_ui"
+        }
@@ -0,0 +1,16 @@
+"""
+This module contains the columnar event log format for recorded runs, and
+the replay of recorded runs.
+"""
+
+from ag_ui.eventlog.writer import EventLogWriter
+from ag_ui.eventlog.reader import EventLog
+from ag_ui.eventlog.replay import JSONLinesRecording, open_recording, replay
+
+__all__ = [
+    "EventLogWriter",
+    "EventLog",
+    "JSONLinesRecording",
+    "open_recording",
+    "replay"
+]
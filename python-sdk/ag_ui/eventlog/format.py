@@ -0,0 +1,111 @@
+"""
+This module contains the layout of the columnar event log format.
+
+An event log file stores the events of a run column by column:
+
+    header       magic, version, event count and the section table
+    types        uint8 event type code per event, see EVENT_TYPE_CODES
+    timestamps   int64 timestamp per event, NO_TIMESTAMP if it has none
+    ids          int32 index into the ID table per event, NO_ID if it has none
+    delta_offsets, deltas
+                 uint64 offsets (count + 1) into the UTF-8 buffer of the
+                 string deltas of text message and tool call events
+    extra_offsets, extras
+                 uint64 offsets (count + 1) into a buffer of JSON objects
+                 with the remaining fields of each event, empty if none
+    id_offsets, id_strings
+                 uint64 offsets into the UTF-8 buffer of the interned message
+                 and tool call IDs
+
+Numbers are little-endian and every section starts at a multiple of eight
+bytes, so the columns of a memory-mapped file can be used in place.
+"""
+
+import struct
+from typing import Dict, Tuple
+
+from ag_ui.core.event_type import EventType
+
+MAGIC = b"AGUILOG\x00"
+VERSION = 1
+
+# Event type codes, in the order of the codes; only ever appended to
+EVENT_TYPE_CODES: Tuple[EventType, ...] = (
+    EventType.TEXT_MESSAGE_START,
+    EventType.TEXT_MESSAGE_CONTENT,
+    EventType.TEXT_MESSAGE_END,
+    EventType.TEXT_MESSAGE_CHUNK,
+    EventType.TOOL_CALL_START,
+    EventType.TOOL_CALL_ARGS,
+    EventType.TOOL_CALL_END,
+    EventType.TOOL_CALL_CHUNK,
+    EventType.STATE_SNAPSHOT,
+    EventType.STATE_DELTA,
+    EventType.MESSAGES_SNAPSHOT,
+    EventType.RAW,
+    EventType.CUSTOM,
+    EventType.RUN_STARTED,
+    EventType.RUN_FINISHED,
+    EventType.RUN_ERROR,
+    EventType.STEP_STARTED,
+    EventType.STEP_FINISHED,
+)
+EVENT_TYPE_CODE: Dict[EventType, int] = {
+    event_type: code for code, event_type in enumerate(EVENT_TYPE_CODES)
+}
+
+# The field stored in the ID column, per event type
+ID_FIELDS: Dict[EventType, str] = {
+    EventType.TEXT_MESSAGE_START: "message_id",
+    EventType.TEXT_MESSAGE_CONTENT: "message_id",
+    EventType.TEXT_MESSAGE_END: "message_id",
+    EventType.TEXT_MESSAGE_CHUNK: "message_id",
+    EventType.TOOL_CALL_START: "tool_call_id",
+    EventType.TOOL_CALL_ARGS: "tool_call_id",
+    EventType.TOOL_CALL_END: "tool_call_id",
+    EventType.TOOL_CALL_CHUNK: "tool_call_id",
+}
+
+# Event types whose string `delta` is stored in the delta column
+DELTA_TYPES = frozenset({
+    EventType.TEXT_MESSAGE_CONTENT,
+    EventType.TEXT_MESSAGE_CHUNK,
+    EventType.TOOL_CALL_ARGS,
+    EventType.TOOL_CALL_CHUNK,
+})
+
+NO_TIMESTAMP = -(2 ** 63)
+NO_ID = -1
+
+SECTIONS = (
+    "types",
+    "timestamps",
+    "ids",
+    "delta_offsets",
+    "deltas",
+    "extra_offsets",
+    "extras",
+    "id_offsets",
+    "id_strings",
+)
+
+# The array typecode of each section that holds numbers
+SECTION_TYPECODES = {
+    "types": "B",
+    "timestamps": "q",
+    "ids": "i",
+    "delta_offsets": "Q",
+    "extra_offsets": "Q",
+    "id_offsets": "Q",
+}
+
+# Magic, version, event count, ID count, then offset and length per section
+HEADER = struct.Struct("<8sIQI" + "QQ" * len(SECTIONS))
+HEADER_SIZE = (HEADER.size + 7) // 8 * 8
+
+
+def align(offset: int) -> int:
+    """
+    Rounds an offset up to the next multiple of eight.
+    """
+    return (offset + 7) // 8 * 8
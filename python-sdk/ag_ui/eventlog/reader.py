@@ -0,0 +1,232 @@
+"""
+This module contains the EventLog, which reads event logs in place.
+"""
+
+import mmap
+import os
+import re
+import sys
+from typing import Any, Collection, Dict, Iterator, List, Optional, Union
+
+from pydantic_core import from_json
+
+from ag_ui.core.event_type import EventType
+from ag_ui.core.fast_events import FAST_EVENT_CLASSES, FastEvent
+from ag_ui.eventlog.format import (
+    MAGIC,
+    VERSION,
+    EVENT_TYPE_CODES,
+    EVENT_TYPE_CODE,
+    ID_FIELDS,
+    NO_TIMESTAMP,
+    NO_ID,
+    SECTIONS,
+    SECTION_TYPECODES,
+    HEADER,
+    HEADER_SIZE
+)
+
+
+class EventLog:
+    """
+    An event log, read in place from a buffer or a memory-mapped file.
+
+        with EventLog.open("run.aguilog") as log:
+            for event in log.filter(types=[EventType.TOOL_CALL_ARGS]):
+                ...
+
+    The columns are memoryviews of the buffer: scanning event types, IDs or
+    timestamps does not decode the events, and only the events that are read
+    are reconstructed, as FastEvents.
+    """
+
+    def __init__(self, buffer: Any):
+        if sys.byteorder != "little":
+            raise RuntimeError("Event logs can only be read in place on little-endian hosts")
+        self._buffer = memoryview(buffer)
+        if len(self._buffer) < HEADER_SIZE:
+            raise ValueError("Not an event log: the file is too short")
+        magic, version, count, id_count, *table = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise ValueError("Not an event log: wrong magic number")
+        if version != VERSION:
+            raise ValueError(f"Unsupported event log version {version}")
+
+        self._count = count
+        self._id_count = id_count
+        self._sections: Dict[str, memoryview] = {}
+        for index, name in enumerate(SECTIONS):
+            offset, length = table[2 * index], table[2 * index + 1]
+            if offset + length > len(self._buffer):
+                raise ValueError(f"Truncated event log: the {name} section is incomplete")
+            section = self._buffer[offset:offset + length]
+            if name in SECTION_TYPECODES:
+                section = section.cast(SECTION_TYPECODES[name])
+            self._sections[name] = section
+
+        self.types = self._sections["types"]
+        self.timestamps = self._sections["timestamps"]
+        self.ids = self._sections["ids"]
+        self._id_table: Optional[List[str]] = None
+        self._id_lookup: Optional[Dict[str, int]] = None
+        self._mmap: Optional[mmap.mmap] = None
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike]) -> "EventLog":
+        """
+        Memory-maps an event log file. Close the log to unmap it.
+        """
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            log = cls(mapped)
+        except BaseException:
+            mapped.close()
+            raise
+        log._mmap = mapped
+        return log
+
+    def close(self) -> None:
+        """
+        Releases the buffer, and unmaps the file of a log that was opened.
+        """
+        for section in self._sections.values():
+            section.release()
+        self._sections.clear()
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def id_table(self) -> List[str]:
+        """
+        The interned message and tool call IDs, in the order they first occur.
+        """
+        if self._id_table is None:
+            offsets = self._sections["id_offsets"]
+            strings = self._sections["id_strings"]
+            self._id_table = [
+                str(strings[offsets[index]:offsets[index + 1]], "utf-8")
+                for index in range(self._id_count)
+            ]
+        return self._id_table
+
+    def event_type(self, index: int) -> EventType:
+        """
+        Returns the type of an event.
+        """
+        return EVENT_TYPE_CODES[self.types[index]]
+
+    def event_id(self, index: int) -> Optional[str]:
+        """
+        Returns the message or tool call ID of an event.
+        """
+        id_index = self.ids[index]
+        return None if id_index == NO_ID else self.id_table[id_index]
+
+    def delta(self, index: int) -> Optional[str]:
+        """
+        Returns the string delta of a text message or tool call event.
+        """
+        offsets = self._sections["delta_offsets"]
+        start, end = offsets[index], offsets[index + 1]
+        if start == end:
+            return self._extras(index).get("delta")
+        return str(self._sections["deltas"][start:end], "utf-8")
+
+    def _extras(self, index: int) -> Dict[str, Any]:
+        offsets = self._sections["extra_offsets"]
+        start, end = offsets[index], offsets[index + 1]
+        if start == end:
+            return {}
+        return from_json(bytes(self._sections["extras"][start:end]))
+
+    def __getitem__(self, index: int) -> FastEvent:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("event log index out of range")
+
+        event_type = EVENT_TYPE_CODES[self.types[index]]
+        cls = FAST_EVENT_CLASSES[event_type]
+        values = self._extras(index)
+        timestamp = self.timestamps[index]
+        if timestamp != NO_TIMESTAMP:
+            values["timestamp"] = timestamp
+        id_field = ID_FIELDS.get(event_type)
+        if id_field is not None and self.ids[index] != NO_ID:
+            values[id_field] = self.id_table[self.ids[index]]
+        offsets = self._sections["delta_offsets"]
+        if offsets[index] != offsets[index + 1]:
+            values["delta"] = str(self._sections["deltas"][offsets[index]:offsets[index + 1]], "utf-8")
+
+        event = cls.__new__(cls)
+        for name in cls.fields:
+            setattr(event, name, values.get(name))
+        return event
+
+    def __iter__(self) -> Iterator[FastEvent]:
+        for index in range(self._count):
+            yield self[index]
+
+    def select(
+        self,
+        types: Optional[Collection[EventType]] = None,
+        ids: Optional[Collection[str]] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None
+    ) -> Iterator[int]:
+        """
+        Returns the indexes of the events of the given types, with the given
+        message or tool call IDs, and with timestamps in [since, until).
+        Events without a timestamp never match a time range.
+        """
+        if types is not None:
+            codes = bytes(sorted(EVENT_TYPE_CODE[EventType(event_type)] for event_type in types))
+            if not codes:
+                return
+            # Scan the type column in C instead of one event at a time
+            pattern = re.compile(b"[" + b"".join(re.escape(bytes([code])) for code in codes) + b"]")
+            indexes: Iterator[int] = (match.start() for match in pattern.finditer(self.types))
+        else:
+            indexes = iter(range(self._count))
+
+        if ids is not None:
+            if self._id_lookup is None:
+                self._id_lookup = {value: index for index, value in enumerate(self.id_table)}
+            wanted = {self._id_lookup[value] for value in ids if value in self._id_lookup}
+            column = self.ids
+            indexes = (index for index in indexes if column[index] in wanted)
+
+        if since is not None or until is not None:
+            low = NO_TIMESTAMP + 1 if since is None else since
+            timestamps = self.timestamps
+            if until is None:
+                indexes = (index for index in indexes if timestamps[index] >= low)
+            else:
+                indexes = (index for index in indexes if low <= timestamps[index] < until)
+
+        yield from indexes
+
+    def filter(
+        self,
+        types: Optional[Collection[EventType]] = None,
+        ids: Optional[Collection[str]] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None
+    ) -> Iterator[FastEvent]:
+        """
+        Returns the events selected like `select`, in order.
+        """
+        for index in self.select(types, ids, since, until):
+            yield self[index]
@@ -0,0 +1,181 @@
+"""
+This module contains the replay of recorded runs, from event logs or JSON
+lines files, through an EventEncoder.
+"""
+
+import asyncio
+import mmap
+import os
+import re
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, Union
+
+from pydantic_core import from_json
+
+from ag_ui.core.fast_events import FastEvent
+from ag_ui.encoder import EventEncoder
+from ag_ui.eventlog.format import MAGIC, NO_TIMESTAMP
+from ag_ui.eventlog.reader import EventLog
+
+# The timestamp of an event encoded by the SDK, which puts it right after the type
+_TIMESTAMP = re.compile(rb'\{\s*"type"\s*:\s*"[A-Z_]+"\s*,\s*"timestamp"\s*:\s*(-?\d+)')
+
+
+def _line_timestamp(line: bytes) -> Optional[int]:
+    """
+    Returns the timestamp of an encoded event, parsing the event only if its
+    fields are not in the order the SDK encodes them in.
+    """
+    match = _TIMESTAMP.match(line)
+    if match is not None:
+        return int(match.group(1))
+    if b'"timestamp"' not in line:
+        return None
+    return from_json(line).get("timestamp")
+
+
+class JSONLinesRecording:
+    """
+    A recorded run as JSON lines, one event in wire format per line, read
+    in place from a buffer or a memory-mapped file.
+
+    Lines are only copied and parsed when they are read, so a recording is
+    never held in memory as a whole.
+    """
+
+    def __init__(self, buffer: Any):
+        self._buffer = buffer
+        self._mmap: Optional[mmap.mmap] = None
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike]) -> "JSONLinesRecording":
+        """
+        Memory-maps a JSON lines file. Close the recording to unmap it.
+        """
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return cls(b"")
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        recording = cls(mapped)
+        recording._mmap = mapped
+        return recording
+
+    def close(self) -> None:
+        """
+        Unmaps the file of a recording that was opened.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "JSONLinesRecording":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def lines(self) -> Iterator[bytes]:
+        """
+        Returns the encoded events, without line breaks and blank lines.
+        """
+        buffer = self._buffer
+        start = 0
+        end = len(buffer)
+        while start < end:
+            newline = buffer.find(b"\n", start)
+            if newline == -1:
+                newline = end
+            line = buffer[start:newline].strip()
+            if line:
+                yield line
+            start = newline + 1
+
+    def __iter__(self) -> Iterator[FastEvent]:
+        for line in self.lines():
+            yield FastEvent.from_json(line)
+
+
+Recording = Union[EventLog, JSONLinesRecording]
+
+
+def open_recording(path: Union[str, os.PathLike]) -> Recording:
+    """
+    Memory-maps a recorded run, an event log or a JSON lines file.
+    """
+    with open(path, "rb") as file:
+        magic = file.read(len(MAGIC))
+    if magic == MAGIC:
+        return EventLog.open(path)
+    return JSONLinesRecording.open(path)
+
+
+class _Pacer:
+    """
+    Waits until the wall time of an event has come, relative to the first
+    event with a timestamp.
+    """
+
+    def __init__(
+        self,
+        speed: Optional[float],
+        sleep: Callable[[float], Awaitable[Any]],
+        clock: Callable[[], float]
+    ):
+        self.speed = speed
+        self.sleep = sleep
+        self.clock = clock
+        self.first: Optional[int] = None
+        self.started = 0.0
+
+    async def wait(self, timestamp: Optional[int]) -> None:
+        if not self.speed or timestamp is None:
+            return
+        if self.first is None:
+            self.first = timestamp
+            self.started = self.clock()
+            return
+        delay = self.started + (timestamp - self.first) / 1000 / self.speed - self.clock()
+        if delay > 0:
+            await self.sleep(delay)
+
+
+async def replay(
+    recording: Recording,
+    encoder: Optional[EventEncoder] = None,
+    speed: Optional[float] = 1.0,
+    passthrough: bool = True,
+    sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    clock: Callable[[], float] = time.monotonic
+) -> AsyncIterator[bytes]:
+    """
+    Yields the encoded events of a recorded run, for a streaming response.
+
+    Events are sent at the pace they were recorded at, `speed` times faster,
+    or as fast as possible if `speed` is None or 0; events without a
+    timestamp are sent right away.
+
+    Events of an event log are reconstructed one at a time and encoded by
+    `encoder`. With `passthrough`, the lines of a JSON lines recording are
+    sent as they are when the encoder produces server-sent events, without
+    parsing them or going through the encoder, and so without its
+    instrumentation.
+    """
+    encoder = encoder if encoder is not None else EventEncoder()
+    pacer = _Pacer(speed, sleep, clock)
+
+    if isinstance(recording, JSONLinesRecording):
+        if passthrough and encoder.get_content_type() == "text/event-stream":
+            for line in recording.lines():
+                await pacer.wait(_line_timestamp(line))
+                yield b"data: " + line + b"\n\n"
+        else:
+            for event in recording:
+                await pacer.wait(event.timestamp)
+                yield encoder.encode(event).encode("utf-8")
+        return
+
+    timestamps = recording.timestamps
+    for index in range(len(recording)):
+        timestamp = timestamps[index]
+        await pacer.wait(None if timestamp == NO_TIMESTAMP else timestamp)
+        yield encoder.encode(recording[index]).encode("utf-8")
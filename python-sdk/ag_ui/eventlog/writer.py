@@ -0,0 +1,139 @@
+"""
+This module contains the EventLogWriter, which stores events in the columnar
+event log format.
+"""
+
+import os
+import sys
+from array import array
+from typing import Any, BinaryIO, Dict, Iterable, Union
+
+from pydantic_core import to_json
+
+from ag_ui.core.events import BaseEvent
+from ag_ui.core.fast_events import FastEvent
+from ag_ui.eventlog.format import (
+    MAGIC,
+    VERSION,
+    EVENT_TYPE_CODE,
+    ID_FIELDS,
+    DELTA_TYPES,
+    NO_TIMESTAMP,
+    NO_ID,
+    SECTIONS,
+    HEADER,
+    HEADER_SIZE,
+    align
+)
+
+
+class EventLogWriter:
+    """
+    Collects the events of a run in columns and writes them as an event log.
+
+        writer = EventLogWriter()
+        writer.extend(events)
+        writer.write("run.aguilog")
+
+    Message and tool call IDs are interned, and the string deltas of text
+    message and tool call events are stored back to back, so a log is
+    usually much smaller than the same events as JSON lines.
+    """
+
+    def __init__(self):
+        self._types = array("B")
+        self._timestamps = array("q")
+        self._ids = array("i")
+        self._delta_offsets = array("Q", [0])
+        self._deltas = bytearray()
+        self._extra_offsets = array("Q", [0])
+        self._extras = bytearray()
+        self._id_index: Dict[str, int] = {}
+        self._id_offsets = array("Q", [0])
+        self._id_strings = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def append(self, event: Union[BaseEvent, FastEvent]) -> None:
+        """
+        Adds an event to the log.
+        """
+        if not isinstance(event, FastEvent):
+            event = FastEvent.from_model(event)
+        event_type = event.type
+        id_field = ID_FIELDS.get(event_type)
+
+        self._types.append(EVENT_TYPE_CODE[event_type])
+        timestamp = event.timestamp
+        self._timestamps.append(NO_TIMESTAMP if timestamp is None else timestamp)
+
+        extras: Dict[str, Any] = {}
+        event_id = None
+        for name in event.fields:
+            value = getattr(event, name)
+            if value is None or name == "timestamp":
+                continue
+            if name == id_field:
+                event_id = value
+            elif name == "delta" and event_type in DELTA_TYPES and value:
+                self._deltas += value.encode("utf-8")
+            else:
+                extras[name] = value
+
+        self._ids.append(NO_ID if event_id is None else self._intern(event_id))
+        self._delta_offsets.append(len(self._deltas))
+        if extras:
+            self._extras += to_json(extras, by_alias=True)
+        self._extra_offsets.append(len(self._extras))
+
+    def extend(self, events: Iterable[Union[BaseEvent, FastEvent]]) -> None:
+        """
+        Adds events to the log.
+        """
+        for event in events:
+            self.append(event)
+
+    def _intern(self, value: str) -> int:
+        index = self._id_index.get(value)
+        if index is None:
+            index = self._id_index[value] = len(self._id_index)
+            self._id_strings += value.encode("utf-8")
+            self._id_offsets.append(len(self._id_strings))
+        return index
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the event log.
+        """
+        sections = []
+        for name in SECTIONS:
+            column: Union[array, bytearray] = getattr(self, "_" + name)
+            if isinstance(column, array) and sys.byteorder == "big":
+                column = array(column.typecode, column)
+                column.byteswap()
+            sections.append(column if isinstance(column, bytearray) else column.tobytes())
+
+        table = []
+        offset = HEADER_SIZE
+        for section in sections:
+            table += [offset, len(section)]
+            offset = align(offset + len(section))
+
+        data = bytearray(offset)
+        HEADER.pack_into(data, 0, MAGIC, VERSION, len(self), len(self._id_index), *table)
+        for section, start in zip(sections, table[::2]):
+            data[start:start + len(section)] = section
+        return bytes(data)
+
+    def write(self, file: Union[str, os.PathLike, BinaryIO]) -> None:
+        """
+        Writes the event log to a path or a binary file.
+        """
+        data = self.to_bytes()
+        if hasattr(file, "write"):
+            file.write(data)
+        else:
+            with open(file, "wb") as output:
+                output.write(data)
+
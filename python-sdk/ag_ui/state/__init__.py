@@ -0,0 +1,17 @@
+"""
+This module contains utilities for streaming and predicting agent state.
+"""
+
+from ag_ui.state.partial_json import (
+    PartialJSONParser,
+    PartialJSONListener,
+    iter_partial_values
+)
+from ag_ui.state.predict import PredictiveStateEmitter
+
+__all__ = [
+    "PartialJSONParser",
+    "PartialJSONListener",
+    "iter_partial_values",
+    "PredictiveStateEmitter"
+]
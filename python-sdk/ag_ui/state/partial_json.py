@@ -0,0 +1,481 @@
+"""
+This module contains an incremental parser for JSON that arrives in chunks,
+such as tool call arguments streamed in TOOL_CALL_ARGS events.
+"""
+
+import re
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Union
+
+PathElement = Union[str, int]
+
+_WHITESPACE = " \t\n\r"
+# Control characters must be escaped in strings
+_STRING_RUN = re.compile(r'[^"\\\x00-\x1f]+')
+_NUMBER_RUN = re.compile(r"[-+0-9.eE]+")
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?")
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+_LITERALS = {"t": ("true", True), "f": ("false", False), "n": ("null", None)}
+
+# What the parser expects next inside a container
+_VALUE = 0
+_KEY = 1
+_COLON = 2
+_COMMA = 3
+
+# Kinds of token that can span chunks
+_STRING = 1
+_NUMBER_TOKEN = 2
+_LITERAL = 3
+
+
+class _Frame:
+    """
+    An object or array that is still being parsed.
+    """
+    __slots__ = ("container", "is_object", "key", "expect", "empty", "rel")
+
+    def __init__(self, container: Any, rel: int):
+        self.container = container
+        self.is_object = isinstance(container, dict)
+        # Key of the member being parsed, or index of the element being parsed
+        self.key: Optional[PathElement] = None if self.is_object else 0
+        self.expect = _KEY if self.is_object else _VALUE
+        self.empty = True
+        self.rel = rel
+
+
+class PartialJSONListener:
+    """
+    Receives the structure of the value at a parser's path as it is parsed.
+
+    Paths passed to the callbacks are relative to the parser's path.
+    """
+
+    def on_start(self, path: List[PathElement], value: Any) -> None:
+        """
+        Called when an object, array or string starts, with its empty value.
+        """
+
+    def on_key(self, path: List[PathElement]) -> None:
+        """
+        Called when the key of an object member is complete, with the path of
+        the member whose value follows.
+        """
+
+    def on_text(self, path: List[PathElement], text: str) -> None:
+        """
+        Called when text is appended to a string that is still streaming.
+        """
+
+    def on_end(self, path: List[PathElement], value: Any) -> None:
+        """
+        Called when a value is complete.
+        """
+
+
+class PartialJSONParser:
+    """
+    Parses a JSON document incrementally, one chunk at a time.
+
+    Every chunk is scanned exactly once. The parser keeps the partially built
+    document and can report the current value at `path` after each chunk,
+    with strings that are still streaming included up to the last complete
+    character. Numbers and literals only appear once they are complete; a
+    number at the end of the document completes when `finish` is called.
+
+    The returned value shares objects with the parser's document; callers
+    that keep it across chunks should copy it first.
+
+    An optional listener is told about every value inside `path` as it
+    starts, grows and completes.
+    """
+
+    def __init__(
+        self,
+        path: Sequence[PathElement] = (),
+        listener: Optional[PartialJSONListener] = None
+    ):
+        self.path = tuple(path)
+        self.listener = listener
+        self._root: Any = None
+        self._started = False
+        self._done = False
+        self._stack: List[_Frame] = []
+        self._offset = 0
+
+        # State of the token that is currently being read
+        self._token = 0
+        self._rel = 0
+        self._is_key = False
+        self._parts: List[str] = []
+        # The text of the string being read, up to its last joined part
+        self._joined = ""
+        self._escape: Optional[str] = None
+        self._high_surrogate: Optional[int] = None
+        self._literal = ""
+
+        self._changed = False
+        self._appended: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether the whole document has been parsed.
+        """
+        return self._done
+
+    @property
+    def appended(self) -> str:
+        """
+        Text appended by the last chunk when the value at `path` is a string.
+        """
+        return "".join(self._appended)
+
+    @property
+    def value(self) -> Any:
+        """
+        The current, possibly partial, value at `path`, or None if the parser
+        has not reached it yet.
+        """
+        if not self._started:
+            return None
+        if self._token == _STRING and not self._is_key and self._rel >= len(self.path):
+            partial = self._string()
+            if not self._stack:
+                return partial
+            self._store(partial)
+
+        value = self._root
+        for element in self.path:
+            if isinstance(value, dict):
+                if element not in value:
+                    return None
+                value = value[element]
+            elif isinstance(value, list) and isinstance(element, int):
+                if element >= len(value):
+                    return None
+                value = value[element]
+            else:
+                return None
+        return value
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Parses the next chunk. Returns True if the value at `path` changed.
+        """
+        self._changed = False
+        self._appended.clear()
+
+        pos = 0
+        end = len(chunk)
+        while pos < end:
+            token = self._token
+            if token == _STRING:
+                pos = self._read_string(chunk, pos)
+            elif token == _NUMBER_TOKEN:
+                pos = self._read_number(chunk, pos)
+            elif token == _LITERAL:
+                pos = self._read_literal(chunk, pos)
+            else:
+                char = chunk[pos]
+                if char not in _WHITESPACE:
+                    self._read_structural(char, pos)
+                pos += 1
+
+        self._offset += end
+        return self._changed
+
+    def finish(self) -> bool:
+        """
+        Ends the input, completing a number at the end of the document.
+        Returns True if the value at `path` changed, and raises a ValueError
+        if the document is incomplete.
+        """
+        self._changed = False
+        self._appended.clear()
+        if self._token == _NUMBER_TOKEN:
+            self._read_number("", 0)
+        if not self._done:
+            raise self._error(0, "unexpected end of input")
+        return self._changed
+
+    def _error(self, pos: int, message: str) -> ValueError:
+        return ValueError(f"Invalid JSON at offset {self._offset + pos}: {message}")
+
+    def _read_structural(self, char: str, pos: int) -> None:
+        if self._done:
+            raise self._error(pos, f"unexpected {char!r} after the end of the document")
+
+        frame = self._stack[-1] if self._stack else None
+        expect = frame.expect if frame is not None else _VALUE
+
+        if expect == _VALUE:
+            if char == "]" and frame is not None and not frame.is_object and frame.empty:
+                self._close(frame)
+            else:
+                self._start_value(char, pos)
+        elif expect == _KEY:
+            if char == '"':
+                self._token = _STRING
+                self._is_key = True
+            elif char == "}" and frame.empty:
+                self._close(frame)
+            else:
+                raise self._error(pos, f"expected an object key, got {char!r}")
+        elif expect == _COLON:
+            if char != ":":
+                raise self._error(pos, f"expected ':', got {char!r}")
+            frame.expect = _VALUE
+        elif char == ",":
+            if frame.is_object:
+                frame.expect = _KEY
+            else:
+                frame.key += 1
+                frame.expect = _VALUE
+        elif char == ("}" if frame.is_object else "]"):
+            self._close(frame)
+        else:
+            raise self._error(pos, f"expected ',' or the end of the container, got {char!r}")
+
+    def _start_value(self, char: str, pos: int) -> None:
+        if self._stack:
+            frame = self._stack[-1]
+            frame.empty = False
+            rel = self._child_rel(frame.rel, frame.key)
+        else:
+            self._started = True
+            rel = 0
+
+        if char == "{" or char == "[":
+            container: Any = {} if char == "{" else []
+            self._rel = rel
+            self._store(container)
+            if self.listener is not None and rel >= len(self.path):
+                self.listener.on_start(self._relative_path(), container)
+            self._stack.append(_Frame(container, rel))
+        elif char == '"':
+            self._token = _STRING
+            self._is_key = False
+            self._rel = rel
+            if self.listener is not None and rel >= len(self.path):
+                self.listener.on_start(self._relative_path(), "")
+        elif char == "-" or "0" <= char <= "9":
+            # Numbers and literals change the value when they complete
+            self._token = _NUMBER_TOKEN
+            self._rel = rel
+            self._parts.append(char)
+            return
+        elif char in _LITERALS:
+            self._token = _LITERAL
+            self._rel = rel
+            self._literal = char
+            return
+        else:
+            raise self._error(pos, f"unexpected {char!r}")
+
+        if rel >= len(self.path):
+            self._changed = True
+
+    def _relative_path(self) -> List[PathElement]:
+        """
+        Path of the value being parsed in the top frame, relative to `path`.
+        """
+        return [frame.key for frame in self._stack[len(self.path):]]
+
+    def _child_rel(self, rel: int, key: Optional[PathElement]) -> int:
+        """
+        Relation of a child value to the target path: -1 if it lies outside,
+        d < len(path) if it matches the first d elements of the path,
+        len(path) if it is the target and len(path) + 1 if it lies inside it.
+        """
+        depth = len(self.path)
+        if rel < 0:
+            return -1
+        if rel >= depth:
+            return depth + 1
+        return rel + 1 if key == self.path[rel] else -1
+
+    def _store(self, value: Any) -> None:
+        if not self._stack:
+            self._root = value
+            return
+        frame = self._stack[-1]
+        container = frame.container
+        if frame.is_object:
+            container[frame.key] = value
+        elif frame.key < len(container):
+            container[frame.key] = value
+        else:
+            container.append(value)
+
+    def _complete(self, value: Any) -> None:
+        self._token = 0
+        self._store(value)
+        if self._rel >= len(self.path):
+            self._changed = True
+            if self.listener is not None:
+                self.listener.on_end(self._relative_path(), value)
+        if self._stack:
+            self._stack[-1].expect = _COMMA
+        else:
+            self._done = True
+
+    def _close(self, frame: _Frame) -> None:
+        self._stack.pop()
+        if frame.rel >= len(self.path):
+            self._changed = True
+            if self.listener is not None:
+                self.listener.on_end(self._relative_path(), frame.container)
+        if self._stack:
+            self._stack[-1].expect = _COMMA
+        else:
+            self._done = True
+
+    def _string(self) -> str:
+        # Only the text appended since the last call is joined
+        if self._parts:
+            self._joined += "".join(self._parts)
+            self._parts.clear()
+        return self._joined
+
+    def _add_text(self, text: str) -> None:
+        if self._high_surrogate is not None:
+            text = chr(self._high_surrogate) + text
+            self._high_surrogate = None
+        if not text:
+            return
+        self._parts.append(text)
+        if not self._is_key and self._rel >= len(self.path):
+            self._changed = True
+            if self._rel == len(self.path):
+                self._appended.append(text)
+            if self.listener is not None:
+                self.listener.on_text(self._relative_path(), text)
+
+    def _add_code_point(self, code: int) -> None:
+        high = self._high_surrogate
+        if high is not None and 0xDC00 <= code < 0xE000:
+            self._high_surrogate = None
+            self._add_text(chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00)))
+        elif 0xD800 <= code < 0xDC00:
+            self._add_text("")
+            self._high_surrogate = code
+        else:
+            self._add_text(chr(code))
+
+    def _read_string(self, chunk: str, pos: int) -> int:
+        end = len(chunk)
+        while pos < end:
+            if self._escape is not None:
+                pos = self._read_escape(chunk, pos)
+                continue
+            match = _STRING_RUN.match(chunk, pos)
+            if match is not None:
+                self._add_text(match.group())
+                pos = match.end()
+                continue
+            char = chunk[pos]
+            pos += 1
+            if char == "\\":
+                self._escape = ""
+                continue
+            if char != '"':
+                raise self._error(pos - 1, f"unescaped control character {char!r} in string")
+
+            # Closing quote
+            self._add_text("")
+            text = self._string()
+            self._joined = ""
+            if self._is_key:
+                self._token = 0
+                frame = self._stack[-1]
+                frame.key = text
+                frame.empty = False
+                frame.expect = _COLON
+                if self.listener is not None and frame.rel >= len(self.path):
+                    self.listener.on_key(self._relative_path())
+            else:
+                self._complete(text)
+            return pos
+        return pos
+
+    def _read_escape(self, chunk: str, pos: int) -> int:
+        escape = self._escape
+        end = len(chunk)
+        while pos < end:
+            escape += chunk[pos]
+            pos += 1
+            if escape[0] != "u":
+                if escape not in _ESCAPES:
+                    raise self._error(pos - 1, f"invalid escape '\\{escape}'")
+                self._escape = None
+                self._add_text(_ESCAPES[escape])
+                return pos
+            if len(escape) == 5:
+                try:
+                    code = int(escape[1:], 16)
+                except ValueError:
+                    raise self._error(pos - 1, f"invalid escape '\\{escape}'") from None
+                self._escape = None
+                self._add_code_point(code)
+                return pos
+        self._escape = escape
+        return pos
+
+    def _read_number(self, chunk: str, pos: int) -> int:
+        match = _NUMBER_RUN.match(chunk, pos)
+        if match is not None:
+            self._parts.append(match.group())
+            pos = match.end()
+            if pos == len(chunk):
+                return pos
+
+        text = "".join(self._parts)
+        self._parts.clear()
+        if _NUMBER.fullmatch(text) is None:
+            raise self._error(pos, f"invalid number {text!r}")
+        if "." in text or "e" in text or "E" in text:
+            self._complete(float(text))
+        else:
+            self._complete(int(text))
+        return pos
+
+    def _read_literal(self, chunk: str, pos: int) -> int:
+        word, value = _LITERALS[self._literal[0]]
+        while pos < len(chunk) and len(self._literal) < len(word):
+            self._literal += chunk[pos]
+            pos += 1
+        if not word.startswith(self._literal):
+            raise self._error(pos, f"invalid literal {self._literal!r}")
+        if len(self._literal) == len(word):
+            self._literal = ""
+            self._complete(value)
+        return pos
+
+
+def iter_partial_values(
+    chunks: Iterable[str],
+    path: Sequence[PathElement] = ()
+) -> Iterator[Any]:
+    """
+    Yields the updated value at `path` after every chunk that changed it, and
+    raises a ValueError if the chunks end before the document does.
+
+    Every value is a new object, so a string at `path` is copied for each
+    chunk; the parser's `appended` text avoids that for long strings.
+    """
+    parser = PartialJSONParser(path)
+    for chunk in chunks:
+        if parser.feed(chunk):
+            yield parser.value
+    if parser.finish():
+        yield parser.value
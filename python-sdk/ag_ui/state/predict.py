@@ -0,0 +1,231 @@
+"""
+This module contains the PredictiveStateEmitter, which turns streamed tool call
+arguments into STATE_DELTA events on the server.
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from ag_ui.core.events import (
+    BaseEvent,
+    EventType,
+    StateDeltaEvent,
+    ToolCallArgsEvent
+)
+from ag_ui.state.partial_json import PartialJSONListener, PartialJSONParser, PathElement
+
+PREDICT_STATE_EVENT = "PredictState"
+
+
+def _pointer(state_key: str, path: List[PathElement]) -> str:
+    """
+    Builds a JSON Pointer (RFC 6901) to a location inside a state key.
+    """
+    elements = [state_key, *path]
+    return "".join(
+        "/" + str(element).replace("~", "~0").replace("/", "~1")
+        for element in elements
+    )
+
+
+class _PatchListener(PartialJSONListener):
+    """
+    Collects JSON Patch operations for one predicted state key.
+    """
+
+    def __init__(self, state_key: str, string_flush_size: int, string_growth: float):
+        self.state_key = state_key
+        self.string_flush_size = string_flush_size
+        self.string_growth = string_growth
+        self.operations: List[Dict[str, Any]] = []
+        # The string currently streaming, how much of it was sent and how much is unsent
+        self.string_path: Optional[List[PathElement]] = None
+        self.string_sent = 0
+        self.string_unsent = 0
+
+    def on_start(self, path: List[PathElement], value: Any) -> None:
+        if isinstance(value, str):
+            self.string_path = path
+            self.string_sent = 0
+            self.string_unsent = 0
+        else:
+            self.operations.append(
+                {"op": "add", "path": _pointer(self.state_key, path), "value": value.copy()}
+            )
+
+    def on_text(self, path: List[PathElement], text: str) -> None:
+        self.string_unsent += len(text)
+
+    def on_end(self, path: List[PathElement], value: Any) -> None:
+        if isinstance(value, (dict, list)):
+            return
+        op = "add"
+        if isinstance(value, str):
+            if self.string_sent:
+                op = "replace"
+            self.string_path = None
+            self.string_sent = 0
+        self.operations.append({"op": op, "path": _pointer(self.state_key, path), "value": value})
+
+    def flush_string(self, parser: PartialJSONParser) -> None:
+        """
+        Sends the string that is still streaming, if enough of it is unsent.
+        """
+        if self.string_path is None or self.string_unsent == 0:
+            return
+        if self.string_unsent < max(self.string_flush_size, self.string_growth * self.string_sent):
+            return
+        value = parser.value
+        for element in self.string_path:
+            value = value[element]
+        self.operations.append({
+            "op": "replace" if self.string_sent else "add",
+            "path": _pointer(self.state_key, self.string_path),
+            "value": value
+        })
+        self.string_sent += self.string_unsent
+        self.string_unsent = 0
+
+
+class _PredictedToolCall:
+    """
+    A tool call whose arguments predict one or more state keys.
+    """
+
+    def __init__(self, mappings: List[Dict[str, str]], string_flush_size: int, string_growth: float):
+        # The forwarded tool call, held until it ends
+        self.start_event: Optional[BaseEvent] = None
+        self.arguments: List[str] = []
+        self.parsers: List[PartialJSONParser] = []
+        for mapping in mappings:
+            argument = mapping.get("tool_argument")
+            listener = _PatchListener(mapping["state_key"], string_flush_size, string_growth)
+            self.parsers.append(PartialJSONParser([argument] if argument else [], listener))
+
+    def feed(self, delta: str) -> List[Dict[str, Any]]:
+        """
+        Parses the next arguments delta and returns the resulting operations.
+        """
+        operations: List[Dict[str, Any]] = []
+        for parser in self.parsers:
+            listener = parser.listener
+            parser.feed(delta)
+            listener.flush_string(parser)
+            operations.extend(listener.operations)
+            listener.operations.clear()
+        return operations
+
+
+class PredictiveStateEmitter:
+    """
+    Derives STATE_DELTA events from streaming TOOL_CALL_ARGS events.
+
+    The emitter uses the same configuration as the PredictState custom event:
+    a list of mappings with a `state_key`, the `tool` whose arguments predict
+    it and the `tool_argument` holding the value (the whole arguments if
+    empty). Without an explicit configuration it adopts the one announced by
+    the agent and stops forwarding the PredictState event, since clients no
+    longer need to reassemble the arguments themselves.
+
+    Each TOOL_CALL_ARGS event of a predicted tool call is followed by a
+    STATE_DELTA event with the operations it results in. Objects and arrays
+    are added as soon as they open and filled in member by member; numbers
+    and literals are added once complete. JSON Patch has no string append
+    operation, so a streaming string is re-sent whole with a replace
+    operation, once at least `string_flush_size` characters and
+    `string_growth` times the length already sent have accumulated. The
+    string therefore grows geometrically between updates, and the bytes sent
+    for it stay proportional to its length.
+
+    Unless `forward_tool_calls` is False, the tool call is forwarded as
+    well, so that it still appears in the message history. Clients do not
+    accept state events inside an open tool call, so it is held while its
+    STATE_DELTA events stream and sent when it ends, as its start, one
+    TOOL_CALL_ARGS event with the whole arguments and its end. For the same
+    reason, operations that result while another tool call is open are sent
+    once it ends.
+    """
+
+    def __init__(
+        self,
+        predict_state: Optional[List[Dict[str, str]]] = None,
+        forward_tool_calls: bool = True,
+        string_flush_size: int = 64,
+        string_growth: float = 0.25
+    ):
+        self.predict_state = list(predict_state or [])
+        self.forward_tool_calls = forward_tool_calls
+        self.string_flush_size = string_flush_size
+        self.string_growth = string_growth
+        self._configured = predict_state is not None
+        self._tool_calls: Dict[str, _PredictedToolCall] = {}
+        # The other tool calls that are open, and the operations waiting for them to end
+        self._open_tool_calls: Set[str] = set()
+        self._pending: List[Dict[str, Any]] = []
+
+    def process(self, event: BaseEvent) -> List[BaseEvent]:
+        """
+        Processes an event and returns the events to send in its place.
+        """
+        event_type = event.type
+
+        if event_type == EventType.TOOL_CALL_ARGS:
+            tool_call = self._tool_calls.get(event.tool_call_id)
+            if tool_call is None:
+                return [event]
+            if self.forward_tool_calls:
+                tool_call.arguments.append(event.delta)
+            operations = tool_call.feed(event.delta)
+            if self._open_tool_calls:
+                self._pending.extend(operations)
+            elif operations:
+                return [StateDeltaEvent(type=EventType.STATE_DELTA, delta=operations)]
+            return []
+
+        if event_type == EventType.TOOL_CALL_START:
+            mappings = [
+                mapping for mapping in self.predict_state
+                if mapping.get("tool") == event.tool_call_name
+            ]
+            if not mappings:
+                self._open_tool_calls.add(event.tool_call_id)
+                return [event]
+            tool_call = _PredictedToolCall(mappings, self.string_flush_size, self.string_growth)
+            if self.forward_tool_calls:
+                tool_call.start_event = event
+            self._tool_calls[event.tool_call_id] = tool_call
+            return []
+
+        if event_type == EventType.TOOL_CALL_END:
+            tool_call = self._tool_calls.pop(event.tool_call_id, None)
+            if tool_call is None:
+                self._open_tool_calls.discard(event.tool_call_id)
+                if self._open_tool_calls or not self._pending:
+                    return [event]
+                operations, self._pending = self._pending, []
+                return [event, StateDeltaEvent(type=EventType.STATE_DELTA, delta=operations)]
+            if not self.forward_tool_calls:
+                return []
+            events = [tool_call.start_event]
+            if tool_call.arguments:
+                events.append(ToolCallArgsEvent(
+                    type=EventType.TOOL_CALL_ARGS,
+                    tool_call_id=event.tool_call_id,
+                    delta="".join(tool_call.arguments)
+                ))
+            events.append(event)
+            return events
+
+        if event_type == EventType.CUSTOM and event.name == PREDICT_STATE_EVENT:
+            if not self._configured:
+                self.predict_state = list(event.value or [])
+            return []
+
+        return [event]
+
+    async def stream(self, events: AsyncIterator[BaseEvent]) -> AsyncIterator[BaseEvent]:
+        """
+        Applies the emitter to a stream of events.
+        """
+        async for event in events:
+            for processed in self.process(event):
+                yield processed
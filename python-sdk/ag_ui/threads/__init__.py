@@ -0,0 +1,20 @@
+"""
+This module contains the server-side storage and indexing of thread message
+histories.
+"""
+
+from ag_ui.threads.index import MessageIndex
+from ag_ui.threads.store import (
+    SQLiteThreadBackend,
+    ThreadBackend,
+    ThreadStore,
+    UnknownThreadVersionError
+)
+
+__all__ = [
+    "MessageIndex",
+    "SQLiteThreadBackend",
+    "ThreadBackend",
+    "ThreadStore",
+    "UnknownThreadVersionError"
+]
@@ -0,0 +1,116 @@
+"""
+This module contains the MessageIndex, which answers lookups on the message
+history of a run without scanning it.
+"""
+
+from itertools import islice
+from typing import Dict, List, Optional, Sequence
+
+from ag_ui.core.types import AssistantMessage, Message, Role, ToolCall, ToolMessage
+
+
+class MessageIndex:
+    """
+    An index of the messages of a run, by message ID, by role and by tool
+    call.
+
+        index = MessageIndex(input_data.messages)
+        for tool_call in index.unanswered_tool_calls():
+            ...
+
+    The index is built the first time it is queried, and afterwards only
+    indexes the messages appended to the list since, so it can be kept for
+    the whole run. Messages must not be replaced or removed, except by
+    assigning a new list to `messages`.
+    """
+
+    def __init__(self, messages: Sequence[Message]):
+        self.messages = messages
+        self._reset()
+
+    def _reset(self) -> None:
+        self._list = self.messages
+        self._indexed = 0
+        self._by_id: Dict[str, Message] = {}
+        self._by_role: Dict[str, List[Message]] = {}
+        self._tool_calls: Dict[str, ToolCall] = {}
+        self._tool_call_messages: Dict[str, AssistantMessage] = {}
+        self._results: Dict[str, ToolMessage] = {}
+        # Dicts keep insertion order, so tool calls stay in the order they were made
+        self._unanswered: Dict[str, ToolCall] = {}
+
+    def _update(self) -> None:
+        messages = self.messages
+        if messages is not self._list or len(messages) < self._indexed:
+            self._reset()
+        if len(messages) == self._indexed:
+            return
+
+        for message in islice(messages, self._indexed, None):
+            self._by_id[message.id] = message
+            self._by_role.setdefault(message.role, []).append(message)
+            if message.role == "assistant":
+                for tool_call in message.tool_calls or ():
+                    self._tool_calls[tool_call.id] = tool_call
+                    self._tool_call_messages[tool_call.id] = message
+                    if tool_call.id not in self._results:
+                        self._unanswered[tool_call.id] = tool_call
+            elif message.role == "tool":
+                self._results[message.tool_call_id] = message
+                self._unanswered.pop(message.tool_call_id, None)
+        self._indexed = len(messages)
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def get(self, message_id: str) -> Optional[Message]:
+        """
+        Returns the message with an ID, the last one if several have it.
+        """
+        self._update()
+        return self._by_id.get(message_id)
+
+    def by_role(self, role: Role) -> List[Message]:
+        """
+        Returns the messages with a role, in order.
+        """
+        self._update()
+        return list(self._by_role.get(role, ()))
+
+    def last(self, role: Optional[Role] = None) -> Optional[Message]:
+        """
+        Returns the last message, or the last message with a role.
+        """
+        if role is None:
+            return self.messages[-1] if self.messages else None
+        self._update()
+        messages = self._by_role.get(role)
+        return messages[-1] if messages else None
+
+    def tool_call(self, tool_call_id: str) -> Optional[ToolCall]:
+        """
+        Returns the tool call with an ID.
+        """
+        self._update()
+        return self._tool_calls.get(tool_call_id)
+
+    def tool_call_message(self, tool_call_id: str) -> Optional[AssistantMessage]:
+        """
+        Returns the assistant message that made a tool call.
+        """
+        self._update()
+        return self._tool_call_messages.get(tool_call_id)
+
+    def tool_result(self, tool_call_id: str) -> Optional[ToolMessage]:
+        """
+        Returns the tool message answering a tool call.
+        """
+        self._update()
+        return self._results.get(tool_call_id)
+
+    def unanswered_tool_calls(self) -> List[ToolCall]:
+        """
+        Returns the tool calls that no tool message answers yet, in order.
+        """
+        self._update()
+        return list(self._unanswered.values())
@@ -0,0 +1,245 @@
+"""
+This module contains the ThreadStore, which keeps the message history of
+threads on the server so that clients only send the messages that are new.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json
+
+from ag_ui.core.types import Message, RunAgentInput
+
+_messages_adapter: Optional[TypeAdapter] = None
+
+
+def _validate_messages(data: List[Any]) -> List[Message]:
+    global _messages_adapter
+    if _messages_adapter is None:
+        _messages_adapter = TypeAdapter(List[Message])
+    return _messages_adapter.validate_python(data)
+
+
+class UnknownThreadVersionError(LookupError):
+    """
+    Raised when a run builds on messages of a thread that the server does not
+    have. The client should send the run again with the whole history and a
+    base version of 0.
+    """
+
+    def __init__(self, thread_id: str, base_version: int):
+        super().__init__(
+            f"Thread {thread_id!r} has no version {base_version}, "
+            "send the whole history with base version 0 instead"
+        )
+        self.thread_id = thread_id
+        self.base_version = base_version
+
+
+class ThreadBackend:
+    """
+    Persistent storage for the message histories of a ThreadStore.
+
+    Messages are passed in wire format. The base class stores nothing.
+    """
+
+    def load(self, thread_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Returns the messages of a thread, or None if it is unknown.
+        """
+        return None
+
+    def save(self, thread_id: str, start: int, messages: List[Dict[str, Any]]) -> None:
+        """
+        Replaces the messages of a thread from position `start` on.
+        """
+
+
+class SQLiteThreadBackend(ThreadBackend):
+    """
+    Stores message histories in an SQLite database, one row per message, so
+    that a run only writes the messages it adds.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = ":memory:"):
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS thread_messages ("
+                " thread_id TEXT NOT NULL,"
+                " position INTEGER NOT NULL,"
+                " message TEXT NOT NULL,"
+                " PRIMARY KEY (thread_id, position))"
+            )
+
+    def load(self, thread_id: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT message FROM thread_messages WHERE thread_id = ? ORDER BY position",
+                (thread_id,)
+            ).fetchall()
+        if not rows:
+            return None
+        return [from_json(message) for message, in rows]
+
+    def save(self, thread_id: str, start: int, messages: List[Dict[str, Any]]) -> None:
+        rows = [
+            (thread_id, start + index, to_json(message).decode("utf-8"))
+            for index, message in enumerate(messages)
+        ]
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM thread_messages WHERE thread_id = ? AND position >= ?",
+                (thread_id, start)
+            )
+            self._connection.executemany(
+                "INSERT INTO thread_messages (thread_id, position, message) VALUES (?, ?, ?)",
+                rows
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+class ThreadStore:
+    """
+    Keeps the message history of recent threads, so that a client can send
+    only the messages added since its last run.
+
+        store = ThreadStore(backend=SQLiteThreadBackend("threads.db"))
+        input_data = await store.resolve_async(input_data)
+
+    A run that sets `baseVersion` builds on the first `baseVersion` messages
+    of its thread that the server already has, and `messages` only holds the
+    messages that follow them; the resulting history is stored. A new
+    thread starts from version 0. Runs without `baseVersion` send the whole
+    history and are passed through as they are, without being stored.
+
+    The store only sees the messages that clients send, not the events the
+    agent answers with, so the version of a history is the number of
+    messages clients sent for it. A client that sent n messages sends n as
+    the base of its next run, followed by the messages it received from the
+    agent since and its new ones.
+
+    The most recently used `max_threads` histories are kept in memory as
+    validated messages, and every history is written to `backend`, which
+    reloads the threads that were evicted or belong to another process.
+    Requests are then validated in O(new messages) instead of O(history).
+    `resolve_async` runs the backend I/O in a thread, off the event loop.
+
+    Thread IDs are the only access control: any client that knows the ID of
+    a thread can run on top of its history, or branch it. Use thread IDs
+    that cannot be guessed, or check that the caller may use a thread before
+    its runs are resolved.
+
+    Runs get their own copy of the history list, but share the stored
+    message models and must not modify them.
+    """
+
+    def __init__(self, max_threads: int = 1024, backend: Optional[ThreadBackend] = None):
+        self.max_threads = max_threads
+        self.backend = backend if backend is not None else ThreadBackend()
+        self._threads: "OrderedDict[str, List[Message]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._threads)
+
+    def get(self, thread_id: str) -> Optional[List[Message]]:
+        """
+        Returns the stored history of a thread, or None if it is unknown.
+        """
+        messages = self._cached(thread_id)
+        if messages is None:
+            messages = self._load(thread_id)
+            if messages is None:
+                return None
+            self._remember(thread_id, messages)
+        return list(messages)
+
+    def save(self, thread_id: str, messages: List[Message], start: int = 0) -> None:
+        """
+        Stores the history of a thread whose first `start` messages are
+        already stored.
+        """
+        self._remember(thread_id, list(messages))
+        self._write(thread_id, messages, start)
+
+    def _cached(self, thread_id: str) -> Optional[List[Message]]:
+        messages = self._threads.get(thread_id)
+        if messages is not None:
+            self._threads.move_to_end(thread_id)
+        return messages
+
+    def _load(self, thread_id: str) -> Optional[List[Message]]:
+        data = self.backend.load(thread_id)
+        return None if data is None else _validate_messages(data)
+
+    def _write(self, thread_id: str, messages: List[Message], start: int) -> None:
+        self.backend.save(
+            thread_id,
+            start,
+            [message.model_dump(by_alias=True, exclude_none=True) for message in messages[start:]]
+        )
+
+    def _remember(self, thread_id: str, messages: List[Message]) -> None:
+        self._threads[thread_id] = messages
+        self._threads.move_to_end(thread_id)
+        if len(self._threads) > self.max_threads:
+            self._threads.popitem(last=False)
+
+    def _extend(
+        self,
+        input_data: RunAgentInput,
+        history: Optional[List[Message]]
+    ) -> List[Message]:
+        base_version = input_data.base_version
+        if history is None or not 0 <= base_version <= len(history):
+            raise UnknownThreadVersionError(input_data.thread_id, base_version)
+        messages = history[:base_version] + input_data.messages
+        self._remember(input_data.thread_id, messages)
+        input_data.messages = list(messages)
+        return messages
+
+    def resolve(self, input_data: RunAgentInput) -> RunAgentInput:
+        """
+        Completes the messages of a run with the stored history of its
+        thread, and stores the resulting history. Raises an
+        UnknownThreadVersionError if the thread or its base version is not
+        stored.
+        """
+        base_version = input_data.base_version
+        if base_version is None:
+            return input_data
+        thread_id = input_data.thread_id
+        history = [] if base_version == 0 else self._cached(thread_id)
+        if history is None:
+            history = self._load(thread_id)
+        messages = self._extend(input_data, history)
+        self._write(thread_id, messages, base_version)
+        return input_data
+
+    async def resolve_async(self, input_data: RunAgentInput) -> RunAgentInput:
+        """
+        Like `resolve`, with the backend loads and writes run in a thread so
+        they do not block the event loop.
+        """
+        base_version = input_data.base_version
+        if base_version is None:
+            return input_data
+        thread_id = input_data.thread_id
+        history = [] if base_version == 0 else self._cached(thread_id)
+        if history is None:
+            history = await asyncio.to_thread(self._load, thread_id)
+        messages = self._extend(input_data, history)
+        await asyncio.to_thread(self._write, thread_id, messages, base_version)
+        return input_data
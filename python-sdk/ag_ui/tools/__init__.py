@@ -0,0 +1,35 @@
+"""
+This module contains utilities for the tools of a run.
+"""
+
+from ag_ui.tools.cache import (
+    TOOLS_REF_HEADER,
+    CachedTools,
+    ToolCache,
+    UnknownToolsRefError,
+    tools_ref
+)
+from ag_ui.tools.validation import (
+    CompiledSchema,
+    StreamingValidator,
+    ToolArgumentsError,
+    ToolCallValidator,
+    compile_schema,
+    compile_tool_schemas,
+    schema_hash
+)
+
+__all__ = [
+    "TOOLS_REF_HEADER",
+    "CachedTools",
+    "ToolCache",
+    "UnknownToolsRefError",
+    "tools_ref",
+    "CompiledSchema",
+    "StreamingValidator",
+    "ToolArgumentsError",
+    "ToolCallValidator",
+    "compile_schema",
+    "compile_tool_schemas",
+    "schema_hash"
+]
@@ -0,0 +1,222 @@
+"""
+This module contains the ToolCache, which keeps the validated tool definitions
+of recent runs so that identical tool lists are only validated once.
+"""
+
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from pydantic import ValidationError
+from pydantic_core import from_json
+
+from ag_ui.core.types import RunAgentInput, Tool
+
+T = TypeVar("T")
+
+# The tools of a request body, up to the next key of the run input or the end
+_TOOLS_START = re.compile(rb'"tools"\s*:\s*(?=\[)')
+_TOOLS_END = re.compile(
+    rb'\]\s*(?:,\s*"(?:threadId|runId|state|messages|context|forwardedProps|toolsRef)"\s*:|\}\s*$)'
+)
+# Put in place of the tools, so that only the rest of the body is decoded
+_PLACEHOLDER = "\x00tools"
+_PLACEHOLDER_JSON = b'"\\u0000tools"'
+
+# The response header with the reference of the tools of a run
+TOOLS_REF_HEADER = "AG-UI-Tools-Ref"
+
+
+def tools_ref(tools: List[Any]) -> str:
+    """
+    Returns the reference of a tool list in wire format: the SHA-256 of its
+    JSON with sorted keys, no whitespace and unescaped non-ASCII characters.
+
+    The canonical JSON is Python's, which other languages do not reproduce
+    for every number and escape, so clients must not compute the hash:
+    servers return the reference of the tools of a run in the
+    TOOLS_REF_HEADER response header, and clients send it back as `toolsRef`.
+    """
+    canonical = json.dumps(tools, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class UnknownToolsRefError(LookupError):
+    """
+    Raised when a run refers to a tool list that is not in the cache. The
+    client should send the run again with its tools.
+    """
+
+    def __init__(self, ref: str):
+        super().__init__(f"Unknown tools reference {ref!r}, send the tools instead")
+        self.ref = ref
+
+
+class CachedTools:
+    """
+    A validated tool list, and the formats derived from it.
+    """
+
+    def __init__(self, ref: str, tools: List[Tool]):
+        self.ref = ref
+        self.tools = tools
+        self._derived: Dict[str, Any] = {}
+        # Hashes of the serialized tool lists that resolve to this entry
+        self._keys: List[bytes] = []
+
+    def derive(self, name: str, factory: Callable[[List[Tool]], T]) -> T:
+        """
+        Returns a format derived from the tools, such as the tool schemas of
+        a model provider, built by `factory` the first time it is asked for.
+        """
+        try:
+            return self._derived[name]
+        except KeyError:
+            value = self._derived[name] = factory(self.tools)
+            return value
+
+
+class ToolCache:
+    """
+    A content-addressed cache of the tool lists sent with RunAgentInput.
+
+        cache = ToolCache()
+        input_data = cache.parse_run_agent_input(await request.body())
+
+    Clients usually send the same tools, with large JSON Schemas, on every
+    run. The cache hashes the tools of a request as they were sent and
+    reuses the Tool models validated for an identical list, so only the rest
+    of the input is decoded and validated. A client that sent a tool list before can
+    send its `toolsRef`, as returned by the server, and an empty `tools`
+    list instead.
+
+    Runs share the cached Tool models and must not modify them.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, CachedTools]" = OrderedDict()
+        self._refs: Dict[bytes, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, ref: Optional[str]) -> Optional[CachedTools]:
+        """
+        Returns the tool list with a reference, if it is cached.
+        """
+        entry = self._entries.get(ref) if ref is not None else None
+        if entry is not None:
+            self._entries.move_to_end(ref)
+        return entry
+
+    def _store(self, raw_tools: List[Any], tools: List[Tool], key: Optional[bytes]) -> CachedTools:
+        ref = tools_ref(raw_tools)
+        entry = self._entries.get(ref)
+        if entry is None:
+            entry = self._entries[ref] = CachedTools(ref, tools)
+            if len(self._entries) > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                for evicted_key in evicted._keys:
+                    del self._refs[evicted_key]
+        else:
+            self._entries.move_to_end(ref)
+        if key is not None and key not in self._refs:
+            entry._keys.append(key)
+            self._refs[key] = ref
+        return entry
+
+    def parse_run_agent_input(self, body: Union[bytes, str]) -> RunAgentInput:
+        """
+        Decodes and validates a RunAgentInput in wire format, resolving its
+        tools from the cache. Raises a pydantic ValidationError if the input
+        is invalid, and an UnknownToolsRefError if it refers to tools that
+        are not cached.
+
+        The tools of a request are found in its body without decoding them
+        and are hashed as they were sent. When an identical list is cached,
+        only the rest of the body is decoded and validated.
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        span = _tools_span(body)
+        key = None
+        if span is not None:
+            key = hashlib.sha256(body[span[0]:span[1]]).digest()
+            entry = self.get(self._refs.get(key))
+            data = _without_tools(body, span) if entry is not None else None
+            if data is not None:
+                data["tools"] = []
+                try:
+                    input_data = RunAgentInput.model_validate(data)
+                except ValidationError:
+                    # Reported with the errors of the whole body below
+                    pass
+                else:
+                    input_data.tools = list(entry.tools)
+                    input_data.tools_ref = entry.ref
+                    return input_data
+
+        input_data = RunAgentInput.model_validate_json(body)
+        if input_data.tools:
+            raw_tools = _raw_tools(body, span) if key is not None else None
+            if raw_tools is None:
+                key = None
+                raw_tools = from_json(body)["tools"]
+            entry = self._store(raw_tools, input_data.tools, key)
+            input_data.tools = list(entry.tools)
+            input_data.tools_ref = entry.ref
+        elif input_data.tools_ref is not None:
+            entry = self.get(input_data.tools_ref)
+            if entry is None:
+                raise UnknownToolsRefError(input_data.tools_ref)
+            input_data.tools = list(entry.tools)
+        return input_data
+
+
+def _tools_span(body: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Returns where the tools probably are in a request body. The guess is
+    only trusted once _without_tools has confirmed it.
+    """
+    match = _TOOLS_START.search(body)
+    if match is None:
+        return None
+    start = match.end()
+    match = _TOOLS_END.search(body, start)
+    if match is None:
+        return None
+    return start, match.start() + 1
+
+
+def _raw_tools(body: bytes, span: Tuple[int, int]) -> Optional[List[Any]]:
+    """
+    Decodes the tools at a span, if the span is exactly the tools of the run
+    input.
+    """
+    if _without_tools(body, span) is None:
+        return None
+    try:
+        return from_json(body[span[0]:span[1]])
+    except ValueError:
+        # The span runs past the tools into the next members of the body
+        return None
+
+
+def _without_tools(body: bytes, span: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """
+    Decodes a request body with the placeholder in place of the span.
+    Returns None unless the span is exactly the tools of the run input: the
+    body must still be valid JSON, which it is not if the span ends too
+    early, and the placeholder must be the top-level tools.
+    """
+    try:
+        data = from_json(body[:span[0]] + _PLACEHOLDER_JSON + body[span[1]:])
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or data.get("tools") != _PLACEHOLDER:
+        return None
+    return data
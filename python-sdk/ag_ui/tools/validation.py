@@ -0,0 +1,648 @@
+"""
+This module contains the validation of tool call arguments against the JSON
+Schema of the tool's parameters, on complete arguments or while they stream.
+"""
+
+import hashlib
+import json
+import math
+import re
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from ag_ui.core.events import BaseEvent, EventType
+from ag_ui.core.types import Tool
+from ag_ui.state.partial_json import PartialJSONListener, PartialJSONParser, PathElement
+
+# Number of compiled schemas kept, least recently used first out
+SCHEMA_CACHE_SIZE = 256
+
+_TYPES = ("object", "array", "string", "integer", "number", "boolean", "null")
+
+
+class ToolArgumentsError(ValueError):
+    """
+    Raised when tool call arguments are not valid JSON or do not match the
+    tool's schema.
+
+    `path` is the location of the invalid value in the arguments and
+    `offset` the number of argument characters received when the error was
+    found.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        path: Iterable[PathElement] = (),
+        offset: Optional[int] = None,
+        tool_call_id: Optional[str] = None,
+        tool_name: Optional[str] = None
+    ):
+        self.message = message
+        self.path = list(path)
+        self.offset = offset
+        self.tool_call_id = tool_call_id
+        self.tool_name = tool_name
+        super().__init__(str(self))
+
+    def __str__(self) -> str:
+        location = "".join(
+            "/" + str(element).replace("~", "~0").replace("/", "~1") for element in self.path
+        )
+        prefix = f"Invalid arguments for tool {self.tool_name!r}" if self.tool_name else "Invalid arguments"
+        return f"{prefix} at {location or '/'}: {self.message}"
+
+
+def _type_of(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
+
+
+def _matches_type(value_type: str, value: Any, types: frozenset) -> bool:
+    if value_type in types:
+        return True
+    if value_type == "integer":
+        return "number" in types
+    if value_type == "number":
+        return "integer" in types and math.isfinite(value) and float(value).is_integer()
+    return False
+
+
+class _Node:
+    """
+    A compiled schema: the keywords of a JSON Schema, resolved once into
+    attributes so that checking a value only looks at what the schema uses.
+    """
+    __slots__ = (
+        "reject", "types", "enum", "strings", "const", "has_const",
+        "properties", "required", "additional", "additional_allowed",
+        "pattern_properties", "min_properties", "max_properties",
+        "items", "prefix_items", "min_items", "max_items", "unique_items",
+        "min_length", "max_length", "pattern", "minimum", "maximum",
+        "exclusive_minimum", "exclusive_maximum", "multiple_of",
+        "all_of", "any_of", "one_of", "not_", "combined"
+    )
+
+    def __init__(self):
+        self.reject = False
+        self.types: Optional[frozenset] = None
+        self.enum: Optional[List[Any]] = None
+        # The values of a string enum or const, checked while the string streams
+        self.strings: Optional[Tuple[str, ...]] = None
+        self.const: Any = None
+        self.has_const = False
+        self.properties: Dict[str, Optional[_Node]] = {}
+        self.required: Tuple[str, ...] = ()
+        self.additional: Optional[_Node] = None
+        self.additional_allowed = True
+        self.pattern_properties: List[Tuple[Any, Optional[_Node]]] = []
+        self.min_properties: Optional[int] = None
+        self.max_properties: Optional[int] = None
+        self.items: Optional[_Node] = None
+        self.prefix_items: List[Optional[_Node]] = []
+        self.min_items: Optional[int] = None
+        self.max_items: Optional[int] = None
+        self.unique_items = False
+        self.min_length: Optional[int] = None
+        self.max_length: Optional[int] = None
+        self.pattern: Any = None
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+        self.exclusive_minimum: Optional[float] = None
+        self.exclusive_maximum: Optional[float] = None
+        self.multiple_of: Optional[float] = None
+        self.all_of: List[Optional[_Node]] = []
+        self.any_of: List[Optional[_Node]] = []
+        self.one_of: List[Optional[_Node]] = []
+        self.not_: Optional[_Node] = None
+        # Combined schemas are only checked once their value is complete
+        self.combined = False
+
+    def child(self, key: PathElement, path: List[PathElement]) -> "Optional[_Node]":
+        """
+        Returns the schema of a member or element, None if anything goes.
+        """
+        if isinstance(key, int):
+            if key < len(self.prefix_items):
+                return self.prefix_items[key]
+            if self.max_items is not None and key >= self.max_items:
+                raise ToolArgumentsError(f"more than {self.max_items} items", path[:-1])
+            return self.items
+        if key in self.properties:
+            return self.properties[key]
+        for pattern, node in self.pattern_properties:
+            if pattern.search(key):
+                return node
+        if not self.additional_allowed:
+            raise ToolArgumentsError(f"unexpected property {key!r}", path[:-1])
+        return self.additional
+
+    def start(self, value_type: str, path: List[PathElement]) -> None:
+        """
+        Checks the type of an object, array or string that starts streaming.
+        """
+        if self.reject:
+            raise ToolArgumentsError("no value is allowed here", path)
+        if self.types is not None and value_type not in self.types:
+            raise ToolArgumentsError(f"expected {_expected(self.types)}, got {value_type}", path)
+
+    def text(self, length: int, text: Optional[str], path: List[PathElement]) -> None:
+        """
+        Checks the length of a string received so far and, for string enums
+        and constants, its text.
+        """
+        if self.max_length is not None and length > self.max_length:
+            raise ToolArgumentsError(f"string longer than {self.max_length} characters", path)
+        if text is not None and not any(value.startswith(text) for value in self.strings):
+            raise ToolArgumentsError(f"{text!r} is not the start of any of {list(self.strings)!r}", path)
+
+    def end(self, value: Any, path: List[PathElement], streamed: bool) -> None:
+        """
+        Checks a complete value. When it was `streamed`, its members and
+        elements have already been checked one at a time.
+        """
+        if self.reject:
+            raise ToolArgumentsError("no value is allowed here", path)
+        value_type = _type_of(value)
+        if self.types is not None and not _matches_type(value_type, value, self.types):
+            raise ToolArgumentsError(f"expected {_expected(self.types)}, got {value_type}", path)
+        if self.has_const and not _equal(value, self.const):
+            raise ToolArgumentsError(f"expected {self.const!r}", path)
+        if self.enum is not None and not any(_equal(value, option) for option in self.enum):
+            raise ToolArgumentsError(f"{value!r} is not one of {self.enum!r}", path)
+
+        if value_type == "object":
+            self._end_object(value, path, streamed)
+        elif value_type == "array":
+            self._end_array(value, path, streamed)
+        elif value_type == "string":
+            self._end_string(value, path)
+        elif value_type in ("integer", "number"):
+            self._end_number(value, path)
+
+        if self.combined:
+            self._end_combined(value, path)
+
+    def _end_object(self, value: Dict[str, Any], path: List[PathElement], streamed: bool) -> None:
+        for name in self.required:
+            if name not in value:
+                raise ToolArgumentsError(f"missing required property {name!r}", path)
+        if self.min_properties is not None and len(value) < self.min_properties:
+            raise ToolArgumentsError(f"fewer than {self.min_properties} properties", path)
+        if self.max_properties is not None and len(value) > self.max_properties:
+            raise ToolArgumentsError(f"more than {self.max_properties} properties", path)
+        if not streamed:
+            for key, member in value.items():
+                path.append(key)
+                node = self.child(key, path)
+                if node is not None:
+                    node.end(member, path, False)
+                path.pop()
+
+    def _end_array(self, value: List[Any], path: List[PathElement], streamed: bool) -> None:
+        if self.min_items is not None and len(value) < self.min_items:
+            raise ToolArgumentsError(f"fewer than {self.min_items} items", path)
+        if self.max_items is not None and len(value) > self.max_items:
+            raise ToolArgumentsError(f"more than {self.max_items} items", path)
+        if self.unique_items:
+            for index, item in enumerate(value):
+                if any(_equal(item, other) for other in value[:index]):
+                    raise ToolArgumentsError("items are not unique", path)
+        if not streamed:
+            for index, item in enumerate(value):
+                path.append(index)
+                node = self.child(index, path)
+                if node is not None:
+                    node.end(item, path, False)
+                path.pop()
+
+    def _end_string(self, value: str, path: List[PathElement]) -> None:
+        if self.max_length is not None and len(value) > self.max_length:
+            raise ToolArgumentsError(f"string longer than {self.max_length} characters", path)
+        if self.min_length is not None and len(value) < self.min_length:
+            raise ToolArgumentsError(f"string shorter than {self.min_length} characters", path)
+        if self.pattern is not None and not self.pattern.search(value):
+            raise ToolArgumentsError(f"{value!r} does not match {self.pattern.pattern!r}", path)
+
+    def _end_number(self, value: Any, path: List[PathElement]) -> None:
+        if self.minimum is not None and value < self.minimum:
+            raise ToolArgumentsError(f"{value!r} is less than {self.minimum!r}", path)
+        if self.maximum is not None and value > self.maximum:
+            raise ToolArgumentsError(f"{value!r} is greater than {self.maximum!r}", path)
+        if self.exclusive_minimum is not None and value <= self.exclusive_minimum:
+            raise ToolArgumentsError(f"{value!r} is not greater than {self.exclusive_minimum!r}", path)
+        if self.exclusive_maximum is not None and value >= self.exclusive_maximum:
+            raise ToolArgumentsError(f"{value!r} is not less than {self.exclusive_maximum!r}", path)
+        if self.multiple_of is not None:
+            quotient = value / self.multiple_of
+            if not math.isclose(quotient, round(quotient)):
+                raise ToolArgumentsError(f"{value!r} is not a multiple of {self.multiple_of!r}", path)
+
+    def _end_combined(self, value: Any, path: List[PathElement]) -> None:
+        for node in self.all_of:
+            if node is not None:
+                node.end(value, path, False)
+        if self.any_of and not any(_accepts(node, value) for node in self.any_of):
+            raise ToolArgumentsError("value does not match any of the allowed schemas", path)
+        if self.one_of:
+            matches = sum(1 for node in self.one_of if _accepts(node, value))
+            if matches != 1:
+                raise ToolArgumentsError(
+                    f"value matches {matches} of the schemas instead of exactly one", path
+                )
+        if self.not_ is not None and _accepts(self.not_, value):
+            raise ToolArgumentsError("value matches a schema it must not match", path)
+
+
+def _accepts(node: Optional[_Node], value: Any) -> bool:
+    if node is None:
+        return True
+    try:
+        node.end(value, [], False)
+    except ToolArgumentsError:
+        return False
+    return True
+
+
+def _equal(value: Any, other: Any) -> bool:
+    # JSON equality: 1 equals 1.0, but true does not equal 1
+    if isinstance(value, bool) or isinstance(other, bool):
+        return type(value) is type(other) and value == other
+    if isinstance(value, (int, float)) and isinstance(other, (int, float)):
+        return value == other
+    if isinstance(value, dict) and isinstance(other, dict):
+        return value.keys() == other.keys() and all(_equal(value[key], other[key]) for key in value)
+    if isinstance(value, list) and isinstance(other, list):
+        return len(value) == len(other) and all(map(_equal, value, other))
+    return type(value) is type(other) and value == other
+
+
+def _expected(types: frozenset) -> str:
+    return " or ".join(name for name in _TYPES if name in types)
+
+
+class _Compiler:
+    """
+    Compiles a schema and the schemas it references, each of them once.
+    """
+
+    def __init__(self, root: Any):
+        self.root = root
+        self.nodes: Dict[int, Optional[_Node]] = {}
+
+    def compile(self, schema: Any) -> Optional[_Node]:
+        if schema is True or schema == {}:
+            return None
+        key = id(schema)
+        if key in self.nodes:
+            return self.nodes[key]
+        node = _Node()
+        self.nodes[key] = node
+        if schema is False:
+            node.reject = True
+            return node
+        if not isinstance(schema, dict):
+            raise ValueError(f"Invalid JSON Schema: {schema!r}")
+
+        if "$ref" in schema:
+            target = self.compile(self._resolve(schema["$ref"]))
+            self.nodes[key] = target
+            return target
+
+        schema_type = schema.get("type")
+        if schema_type is not None:
+            node.types = frozenset([schema_type] if isinstance(schema_type, str) else schema_type)
+        if "enum" in schema:
+            node.enum = list(schema["enum"])
+            if all(isinstance(value, str) for value in node.enum):
+                node.strings = tuple(node.enum)
+        if "const" in schema:
+            node.const = schema["const"]
+            node.has_const = True
+            if isinstance(node.const, str):
+                node.strings = (node.const,)
+
+        node.properties = {
+            name: self.compile(value) for name, value in schema.get("properties", {}).items()
+        }
+        node.required = tuple(schema.get("required", ()))
+        additional = schema.get("additionalProperties", True)
+        node.additional_allowed = additional is not False
+        node.additional = None if additional is False else self.compile(additional)
+        node.pattern_properties = [
+            (re.compile(pattern), self.compile(value))
+            for pattern, value in schema.get("patternProperties", {}).items()
+        ]
+        node.min_properties = schema.get("minProperties")
+        node.max_properties = schema.get("maxProperties")
+
+        items = schema.get("items", True)
+        prefix_items = schema.get("prefixItems")
+        if isinstance(items, list):
+            # Draft 7 tuples
+            prefix_items, items = items, schema.get("additionalItems", True)
+        node.prefix_items = [self.compile(value) for value in prefix_items or ()]
+        if items is False:
+            node.max_items = len(node.prefix_items)
+        else:
+            node.items = self.compile(items)
+        if "minItems" in schema:
+            node.min_items = schema["minItems"]
+        if "maxItems" in schema:
+            limit = schema["maxItems"]
+            node.max_items = limit if node.max_items is None else min(node.max_items, limit)
+        node.unique_items = bool(schema.get("uniqueItems", False))
+
+        node.min_length = schema.get("minLength")
+        node.max_length = schema.get("maxLength")
+        if "pattern" in schema:
+            node.pattern = re.compile(schema["pattern"])
+
+        node.minimum = schema.get("minimum")
+        node.maximum = schema.get("maximum")
+        exclusive_minimum = schema.get("exclusiveMinimum")
+        exclusive_maximum = schema.get("exclusiveMaximum")
+        # Draft 4 uses booleans that make minimum and maximum exclusive
+        if exclusive_minimum is True:
+            node.exclusive_minimum, node.minimum = node.minimum, None
+        elif not isinstance(exclusive_minimum, bool):
+            node.exclusive_minimum = exclusive_minimum
+        if exclusive_maximum is True:
+            node.exclusive_maximum, node.maximum = node.maximum, None
+        elif not isinstance(exclusive_maximum, bool):
+            node.exclusive_maximum = exclusive_maximum
+        node.multiple_of = schema.get("multipleOf")
+
+        node.all_of = [self.compile(value) for value in schema.get("allOf", ())]
+        node.any_of = [self.compile(value) for value in schema.get("anyOf", ())]
+        node.one_of = [self.compile(value) for value in schema.get("oneOf", ())]
+        if "not" in schema:
+            node.not_ = self.compile(schema["not"])
+        node.combined = bool(node.all_of or node.any_of or node.one_of or "not" in schema)
+        return node
+
+    def _resolve(self, ref: str) -> Any:
+        if not ref.startswith("#"):
+            raise ValueError(f"Only local schema references are supported, got {ref!r}")
+        schema = self.root
+        for element in ref[1:].split("/")[1:]:
+            element = element.replace("~1", "/").replace("~0", "~")
+            schema = schema[int(element)] if isinstance(schema, list) else schema[element]
+        return schema
+
+
+class CompiledSchema:
+    """
+    A tool's parameter schema, compiled once into a validator.
+
+    Supports the JSON Schema keywords that describe tool parameters: types,
+    enums and constants, properties, required and additional properties,
+    items, string, number and array bounds, patterns, local `$ref`s and the
+    `allOf`, `anyOf`, `oneOf` and `not` combinations.
+    """
+
+    def __init__(self, schema: Any):
+        self.schema = schema
+        self._root = _Compiler(schema).compile(schema)
+
+    def validate(self, value: Any) -> None:
+        """
+        Checks decoded arguments, raising a ToolArgumentsError if they are invalid.
+        """
+        if self._root is not None:
+            self._root.end(value, [], False)
+
+    def validate_json(self, arguments: str) -> Any:
+        """
+        Decodes and checks arguments, and returns them.
+        """
+        try:
+            value = json.loads(arguments)
+        except ValueError as error:
+            raise ToolArgumentsError(f"invalid JSON: {error}") from None
+        self.validate(value)
+        return value
+
+    def stream(self) -> "StreamingValidator":
+        """
+        Returns a validator for arguments that arrive in chunks.
+        """
+        return StreamingValidator(self)
+
+
+_schema_cache: "OrderedDict[str, CompiledSchema]" = OrderedDict()
+
+
+def schema_hash(schema: Any) -> str:
+    """
+    Returns a hash of a JSON Schema that does not depend on the order of its keys.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def compile_schema(schema: Any) -> CompiledSchema:
+    """
+    Compiles a tool's parameter schema, or returns it from the cache if an
+    identical schema was compiled before.
+    """
+    key = schema_hash(schema)
+    compiled = _schema_cache.get(key)
+    if compiled is not None:
+        _schema_cache.move_to_end(key)
+        return compiled
+    compiled = _schema_cache[key] = CompiledSchema(schema)
+    if len(_schema_cache) > SCHEMA_CACHE_SIZE:
+        _schema_cache.popitem(last=False)
+    return compiled
+
+
+class StreamingValidator(PartialJSONListener):
+    """
+    Checks tool call arguments while they stream in.
+
+        validator = compile_schema(tool.parameters).stream()
+        for delta in deltas:
+            validator.feed(delta)
+        arguments = validator.finish()
+
+    Every chunk is parsed once. Unexpected properties are checked as soon as
+    their key is complete, object and array types, too many items, string
+    lengths and string enums as soon as they start or grow, and every other keyword as soon as its
+    value is complete, so invalid arguments are usually rejected long before
+    the last chunk.
+    """
+
+    def __init__(self, compiled: CompiledSchema):
+        self.compiled = compiled
+        self.parser = PartialJSONParser(listener=self)
+        self.offset = 0
+        # The schema of each open object or array, and of the streaming string
+        self._containers: List[Optional[_Node]] = []
+        self._string: Optional[_Node] = None
+        self._length = 0
+        self._text: List[str] = []
+
+    def _node(self, path: List[PathElement]) -> Optional[_Node]:
+        if not path:
+            return self.compiled._root
+        parent = self._containers[-1]
+        return None if parent is None else parent.child(path[-1], path)
+
+    def on_start(self, path: List[PathElement], value: Any) -> None:
+        node = self._node(path)
+        value_type = _type_of(value)
+        if node is not None:
+            node.start(value_type, path)
+        if value_type == "string":
+            self._string = node
+            self._length = 0
+            self._text.clear()
+        else:
+            self._containers.append(node)
+
+    def on_key(self, path: List[PathElement]) -> None:
+        self._node(path)
+
+    def on_text(self, path: List[PathElement], text: str) -> None:
+        node = self._string
+        if node is None:
+            return
+        self._length += len(text)
+        if node.strings is None:
+            node.text(self._length, None, path)
+            return
+        self._text.append(text)
+        node.text(self._length, "".join(self._text), path)
+
+    def on_end(self, path: List[PathElement], value: Any) -> None:
+        if isinstance(value, (dict, list)):
+            node = self._containers.pop()
+            streamed = True
+        elif isinstance(value, str):
+            node = self._string
+            self._string = None
+            streamed = True
+        else:
+            node = self._node(path)
+            streamed = False
+        if node is not None:
+            node.end(value, path, streamed)
+
+    def feed(self, delta: str) -> None:
+        """
+        Parses and checks the next chunk of arguments.
+        """
+        self.offset += len(delta)
+        try:
+            self.parser.feed(delta)
+        except ToolArgumentsError as error:
+            error.offset = self.offset
+            raise
+        except ValueError as error:
+            raise ToolArgumentsError(str(error), offset=self.offset) from None
+
+    def finish(self) -> Any:
+        """
+        Checks that the arguments are complete, and returns them.
+        """
+        try:
+            self.parser.finish()
+        except ToolArgumentsError as error:
+            error.offset = self.offset
+            raise
+        except ValueError:
+            raise ToolArgumentsError("incomplete JSON", offset=self.offset) from None
+        return self.parser.value
+
+
+def compile_tool_schemas(tools: Iterable[Tool]) -> Dict[str, CompiledSchema]:
+    """
+    Compiles the parameter schemas of tools, by tool name.
+    """
+    return {tool.name: compile_schema(tool.parameters) for tool in tools}
+
+
+class ToolCallValidator:
+    """
+    Checks the arguments of tool calls against the schemas of their tools
+    while they stream, and stops the run as soon as they are invalid.
+
+    Tool calls of tools that are not listed are passed through unchecked,
+    unless `allow_unknown_tools` is False. Schemas compiled by
+    `compile_tool_schemas` can be passed as `schemas` instead of the tools.
+    """
+
+    def __init__(
+        self,
+        tools: Iterable[Tool] = (),
+        allow_unknown_tools: bool = True,
+        schemas: Optional[Dict[str, CompiledSchema]] = None
+    ):
+        self.schemas = schemas if schemas is not None else compile_tool_schemas(tools)
+        self.allow_unknown_tools = allow_unknown_tools
+        self._tool_calls: Dict[str, Tuple[str, StreamingValidator]] = {}
+
+    def process(self, event: BaseEvent) -> None:
+        """
+        Checks an event, raising a ToolArgumentsError if it makes the
+        arguments of its tool call invalid.
+        """
+        event_type = event.type
+        if event_type == EventType.TOOL_CALL_ARGS:
+            tool_call = self._tool_calls.get(event.tool_call_id)
+            if tool_call is not None:
+                try:
+                    tool_call[1].feed(event.delta)
+                except ToolArgumentsError as error:
+                    raise self._failed(event.tool_call_id, error) from None
+        elif event_type == EventType.TOOL_CALL_START:
+            schema = self.schemas.get(event.tool_call_name)
+            if schema is not None:
+                self._tool_calls[event.tool_call_id] = (event.tool_call_name, schema.stream())
+            elif not self.allow_unknown_tools:
+                raise ToolArgumentsError(
+                    "unknown tool",
+                    tool_call_id=event.tool_call_id,
+                    tool_name=event.tool_call_name
+                )
+        elif event_type == EventType.TOOL_CALL_END:
+            tool_call = self._tool_calls.get(event.tool_call_id)
+            if tool_call is not None:
+                try:
+                    tool_call[1].finish()
+                except ToolArgumentsError as error:
+                    raise self._failed(event.tool_call_id, error) from None
+                del self._tool_calls[event.tool_call_id]
+
+    def _failed(self, tool_call_id: str, error: ToolArgumentsError) -> ToolArgumentsError:
+        tool_name, _ = self._tool_calls.pop(tool_call_id)
+        error.tool_call_id = tool_call_id
+        error.tool_name = tool_name
+        error.args = (str(error),)
+        return error
+
+    async def stream(self, events: AsyncIterator[BaseEvent]) -> AsyncIterator[BaseEvent]:
+        """
+        Yields the events of a stream, and closes the stream when a tool call
+        becomes invalid so that the agent stops generating it.
+        """
+        try:
+            async for event in events:
+                self.process(event)
+                yield event
+        finally:
+            close = getattr(events, "aclose", None)
+            if close is not None:
+                await close()
@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the benchmark suite.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from ag_ui.core import BaseEvent
+from .samples import SAMPLE_EVENTS
+
+# The example server lives next to the TypeScript integrations in this repository
+EXAMPLE_SERVER_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "typescript-sdk" / "integrations" / "server-starter-all-features" / "server" / "python"
+)
+if EXAMPLE_SERVER_PATH.is_dir() and str(EXAMPLE_SERVER_PATH) not in sys.path:
+    sys.path.append(str(EXAMPLE_SERVER_PATH))
+
+
+@pytest.fixture(params=sorted(SAMPLE_EVENTS))
+def sample_event(request) -> BaseEvent:
+    """
+    One representative event of every type.
+    """
+    return SAMPLE_EVENTS[request.param]
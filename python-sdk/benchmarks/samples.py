@@ -0,0 +1,200 @@
+"""
+Sample data for the benchmark suite.
+"""
+
+from typing import Any, Dict, List
+
+from ag_ui.core import (
+    EventType,
+    BaseEvent,
+    TextMessageStartEvent,
+    TextMessageContentEvent,
+    TextMessageEndEvent,
+    ToolCallStartEvent,
+    ToolCallArgsEvent,
+    ToolCallEndEvent,
+    StateSnapshotEvent,
+    StateDeltaEvent,
+    MessagesSnapshotEvent,
+    RawEvent,
+    CustomEvent,
+    RunStartedEvent,
+    RunFinishedEvent,
+    RunErrorEvent,
+    StepStartedEvent,
+    StepFinishedEvent,
+)
+
+
+def make_messages(count: int) -> List[Dict[str, Any]]:
+    """
+    Returns a conversation of `count` messages in wire format, alternating
+    between user messages and assistant messages with a tool call.
+    """
+    messages = []
+    for index in range(count):
+        if index % 2 == 0:
+            messages.append({
+                "id": f"message-{index}",
+                "role": "user",
+                "content": f"Please look up item number {index} and summarize it."
+            })
+        else:
+            messages.append({
+                "id": f"message-{index}",
+                "role": "assistant",
+                "content": "Looking it up.",
+                "toolCalls": [{
+                    "id": f"call-{index}",
+                    "type": "function",
+                    "function": {"name": "lookup", "arguments": f'{{"item": {index}}}'}
+                }]
+            })
+    return messages
+
+
+def make_state(size: int) -> Dict[str, Any]:
+    """
+    Returns a state with `size` items of nested data.
+    """
+    return {
+        "title": "Benchmark state",
+        "items": [
+            {"id": index, "name": f"Item {index}", "done": index % 3 == 0, "tags": ["a", "b"]}
+            for index in range(size)
+        ]
+    }
+
+
+def make_tools(count: int) -> List[Dict[str, Any]]:
+    """
+    Returns `count` tool definitions with JSON Schemas of a realistic size.
+    """
+    return [
+        {
+            "name": f"tool_{index}",
+            "description": f"Tool number {index}, which does something useful",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    f"field_{field}": {
+                        "type": "string",
+                        "description": f"Field {field} of tool {index}",
+                        "enum": ["a", "b", "c"]
+                    }
+                    for field in range(20)
+                },
+                "required": ["field_0"]
+            }
+        }
+        for index in range(count)
+    ]
+
+
+def make_input(message_count: int, tool_count: int = 0) -> Dict[str, Any]:
+    """
+    Returns a RunAgentInput in wire format with `message_count` messages and
+    `tool_count` tools.
+    """
+    return {
+        "threadId": "thread",
+        "runId": "run",
+        "state": {},
+        "messages": make_messages(message_count),
+        "tools": make_tools(tool_count),
+        "context": [],
+        "forwardedProps": {}
+    }
+
+
+def make_run(message_count: int, chunks: int = 20) -> List[BaseEvent]:
+    """
+    Returns the events of a run that streams `message_count` text messages of
+    `chunks` chunks, each followed by a tool call with streamed arguments.
+    """
+    events: List[BaseEvent] = [RunStartedEvent(type=EventType.RUN_STARTED, thread_id="thread", run_id="run")]
+    for index in range(message_count):
+        message_id = f"message-{index}"
+        tool_call_id = f"call-{index}"
+        events.append(TextMessageStartEvent(
+            type=EventType.TEXT_MESSAGE_START, message_id=message_id, role="assistant"
+        ))
+        events += [
+            TextMessageContentEvent(
+                type=EventType.TEXT_MESSAGE_CONTENT, message_id=message_id, delta=f"Chunk {chunk} "
+            )
+            for chunk in range(chunks)
+        ]
+        events.append(TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id=message_id))
+        events.append(ToolCallStartEvent(
+            type=EventType.TOOL_CALL_START, tool_call_id=tool_call_id, tool_call_name="lookup"
+        ))
+        events += [
+            ToolCallArgsEvent(type=EventType.TOOL_CALL_ARGS, tool_call_id=tool_call_id, delta=delta)
+            for delta in ('{"item": ', str(index), "}")
+        ]
+        events.append(ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=tool_call_id))
+    events.append(RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id="thread", run_id="run"))
+    return events
+
+
+def sample_events() -> Dict[str, BaseEvent]:
+    """
+    Returns one representative event of every type, keyed by type name.
+    """
+    state = make_state(10)
+    return {
+        EventType.TEXT_MESSAGE_START.value: TextMessageStartEvent(
+            type=EventType.TEXT_MESSAGE_START, message_id="message", role="assistant"
+        ),
+        EventType.TEXT_MESSAGE_CONTENT.value: TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT, message_id="message", delta="Hello, world! "
+        ),
+        EventType.TEXT_MESSAGE_END.value: TextMessageEndEvent(
+            type=EventType.TEXT_MESSAGE_END, message_id="message"
+        ),
+        EventType.TOOL_CALL_START.value: ToolCallStartEvent(
+            type=EventType.TOOL_CALL_START, tool_call_id="call", tool_call_name="lookup",
+            parent_message_id="message"
+        ),
+        EventType.TOOL_CALL_ARGS.value: ToolCallArgsEvent(
+            type=EventType.TOOL_CALL_ARGS, tool_call_id="call", delta='{"item": '
+        ),
+        EventType.TOOL_CALL_END.value: ToolCallEndEvent(
+            type=EventType.TOOL_CALL_END, tool_call_id="call"
+        ),
+        EventType.STATE_SNAPSHOT.value: StateSnapshotEvent(
+            type=EventType.STATE_SNAPSHOT, snapshot=state
+        ),
+        EventType.STATE_DELTA.value: StateDeltaEvent(
+            type=EventType.STATE_DELTA,
+            delta=[{"op": "replace", "path": "/items/0/done", "value": True}]
+        ),
+        EventType.MESSAGES_SNAPSHOT.value: MessagesSnapshotEvent.model_validate({
+            "type": EventType.MESSAGES_SNAPSHOT, "messages": make_messages(10)
+        }),
+        EventType.RAW.value: RawEvent(
+            type=EventType.RAW, event={"kind": "raw", "data": [1, 2, 3]}, source="benchmark"
+        ),
+        EventType.CUSTOM.value: CustomEvent(
+            type=EventType.CUSTOM, name="benchmark", value={"count": 1}
+        ),
+        EventType.RUN_STARTED.value: RunStartedEvent(
+            type=EventType.RUN_STARTED, thread_id="thread", run_id="run"
+        ),
+        EventType.RUN_FINISHED.value: RunFinishedEvent(
+            type=EventType.RUN_FINISHED, thread_id="thread", run_id="run"
+        ),
+        EventType.RUN_ERROR.value: RunErrorEvent(
+            type=EventType.RUN_ERROR, message="Something went wrong", code="INTERNAL_ERROR"
+        ),
+        EventType.STEP_STARTED.value: StepStartedEvent(
+            type=EventType.STEP_STARTED, step_name="step"
+        ),
+        EventType.STEP_FINISHED.value: StepFinishedEvent(
+            type=EventType.STEP_FINISHED, step_name="step"
+        ),
+    }
+
+
+SAMPLE_EVENTS = sample_events()
@@ -0,0 +1,57 @@
+"""
+Benchmarks for encoding events.
+"""
+
+import pytest
+
+from ag_ui.core import EventType, FastEvent, StateSnapshotEvent
+from ag_ui.encoder import EventEncoder, Instrumentation, OffloadPolicy, SnapshotCache, freeze_state
+from .samples import SAMPLE_EVENTS
+
+
+def test_encode(benchmark, sample_event):
+    """Encode every event type as a server-sent event"""
+    encoder = EventEncoder()
+    benchmark(encoder.encode, sample_event)
+
+
+def test_encode_fast_event(benchmark, sample_event):
+    """Encode every event type from its compact representation"""
+    encoder = EventEncoder()
+    benchmark(encoder.encode, FastEvent.from_model(sample_event))
+
+
+@pytest.mark.parametrize("sample_rate", [None, 1.0, 0.01], ids=["off", "all", "1%"])
+def test_encode_stream(benchmark, sample_rate):
+    """Encode a stream of 1,000 events of mixed types, with and without instrumentation"""
+    instrumentation = Instrumentation(sample_rate) if sample_rate is not None else None
+    encoder = EventEncoder(instrumentation=instrumentation)
+    events = list(SAMPLE_EVENTS.values()) * (1000 // len(SAMPLE_EVENTS) + 1)
+    events = events[:1000]
+
+    def encode_all():
+        for event in events:
+            encoder.encode(event)
+
+    benchmark(encode_all)
+
+
+@pytest.mark.parametrize("items", [10, 10000])
+def test_should_offload(benchmark, items):
+    """Decide whether to offload state snapshots of 10 and 10,000 items, which costs the same for both"""
+    event = StateSnapshotEvent(
+        type=EventType.STATE_SNAPSHOT,
+        snapshot={"items": [{"id": index, "text": "x" * 100} for index in range(items)]}
+    )
+    benchmark(OffloadPolicy().should_offload, event)
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+def test_encode_repeated_snapshot(benchmark, cached):
+    """Encode a frozen state snapshot of 1,000 items that is sent again, with and without a snapshot cache"""
+    event = StateSnapshotEvent(
+        type=EventType.STATE_SNAPSHOT,
+        snapshot=freeze_state({"items": [{"id": index, "text": "x" * 100} for index in range(1000)]})
+    )
+    encoder = EventEncoder(snapshot_cache=SnapshotCache() if cached else None)
+    benchmark(encoder.encode, event)
@@ -0,0 +1,105 @@
+"""
+Benchmarks for the columnar event log and replay, against the same run as
+JSON lines.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from ag_ui.core import EventType
+from ag_ui.eventlog import EventLogWriter, EventLog, JSONLinesRecording, replay
+from ag_ui.eventlog.format import EVENT_TYPE_CODES
+from .samples import make_run
+
+# A run of about 10,000 events
+RUN = make_run(400)
+
+
+@pytest.fixture(scope="module")
+def event_log() -> bytes:
+    writer = EventLogWriter()
+    writer.extend(RUN)
+    return writer.to_bytes()
+
+
+@pytest.fixture(scope="module")
+def json_lines() -> bytes:
+    return "".join(
+        event.model_dump_json(by_alias=True, exclude_none=True) + "\n" for event in RUN
+    ).encode("utf-8")
+
+
+def test_write(benchmark):
+    """Write the run as an event log"""
+    def write():
+        writer = EventLogWriter()
+        writer.extend(RUN)
+        return writer.to_bytes()
+
+    data = benchmark(write)
+    benchmark.extra_info["events"] = len(RUN)
+    benchmark.extra_info["bytes"] = len(data)
+
+
+def test_scan_tool_calls(benchmark, event_log):
+    """Reconstruct the tool call arguments of the run from the event log"""
+    log = EventLog(event_log)
+    events = benchmark(lambda: list(log.filter(types=[EventType.TOOL_CALL_ARGS])))
+    assert len(events) == 1200
+
+
+def test_scan_tool_calls_json_lines(benchmark, json_lines):
+    """Find the tool call arguments of the run in JSON lines, for comparison"""
+    def scan():
+        return [
+            event for event in map(json.loads, json_lines.splitlines())
+            if event["type"] == EventType.TOOL_CALL_ARGS.value
+        ]
+
+    events = benchmark(scan)
+    assert len(events) == 1200
+
+
+def test_count_by_type(benchmark, event_log):
+    """Count the events of every type from the type column"""
+    log = EventLog(event_log)
+
+    def count():
+        types = log.types.tobytes()
+        return {event_type: types.count(code) for code, event_type in enumerate(EVENT_TYPE_CODES)}
+
+    counts = benchmark(count)
+    assert counts[EventType.TEXT_MESSAGE_CONTENT] == 8000
+
+
+def test_read_all(benchmark, event_log):
+    """Reconstruct every event of the run"""
+    log = EventLog(event_log)
+    benchmark(lambda: list(log))
+
+
+def test_size(benchmark, event_log, json_lines):
+    """Compare the size of the event log with JSON lines"""
+    benchmark.pedantic(lambda: None, rounds=1, iterations=1)
+    benchmark.extra_info["event_log_bytes"] = len(event_log)
+    benchmark.extra_info["json_lines_bytes"] = len(json_lines)
+    assert len(event_log) < len(json_lines)
+
+
+@pytest.mark.parametrize("source", ["json_lines", "json_lines_parsed", "event_log"])
+def test_replay(benchmark, source, event_log, json_lines):
+    """Replay the run as fast as possible: JSON lines passed through or parsed, or an event log"""
+    if source == "event_log":
+        recording = EventLog(event_log)
+    else:
+        recording = JSONLinesRecording(json_lines)
+
+    async def run():
+        sent = 0
+        async for data in replay(recording, speed=None, passthrough=source == "json_lines"):
+            sent += len(data)
+        return sent
+
+    benchmark(lambda: asyncio.run(run()))
@@ -0,0 +1,80 @@
+"""
+Benchmarks for constructing and validating events.
+"""
+
+import tracemalloc
+
+from ag_ui.core import (
+    EventType,
+    TextMessageContentEvent,
+    ToolCallArgsEvent,
+    FastEvent,
+    FastTextMessageContentEvent
+)
+
+
+def test_construct_text_message_content(benchmark):
+    """Construct the most frequent event, a text message chunk"""
+    benchmark(
+        TextMessageContentEvent,
+        type=EventType.TEXT_MESSAGE_CONTENT,
+        message_id="message",
+        delta="Hello, world! "
+    )
+
+
+def test_construct_tool_call_args(benchmark):
+    """Construct a tool call arguments chunk"""
+    benchmark(
+        ToolCallArgsEvent,
+        type=EventType.TOOL_CALL_ARGS,
+        tool_call_id="call",
+        delta='{"item": '
+    )
+
+
+def test_validate_event(benchmark, sample_event):
+    """Validate every event type from its wire format"""
+    data = sample_event.model_dump(by_alias=True, exclude_none=True)
+    benchmark(type(sample_event).model_validate, data)
+
+
+def test_construct_fast_text_message_content(benchmark):
+    """Construct a text message chunk in its compact representation"""
+    benchmark(FastTextMessageContentEvent, message_id="message", delta="Hello, world! ")
+
+
+def test_fast_event_from_model(benchmark, sample_event):
+    """Convert every event type to its compact representation"""
+    benchmark(FastEvent.from_model, sample_event)
+
+
+def test_fast_event_from_json(benchmark, sample_event):
+    """Decode every event type from its wire format without building its model"""
+    data = sample_event.model_dump_json(by_alias=True, exclude_none=True)
+    benchmark(FastEvent.from_json, data)
+
+
+def test_buffer_memory(benchmark):
+    """Buffer 100,000 text message chunks as models and as fast events"""
+    def buffer_size(make):
+        tracemalloc.start()
+        try:
+            events = [make() for _ in range(100_000)]
+            return tracemalloc.get_traced_memory()[0] / len(events)
+        finally:
+            tracemalloc.stop()
+
+    sizes = {}
+
+    def measure():
+        sizes["model"] = buffer_size(lambda: TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT, message_id="message", delta="Hello, world! "
+        ))
+        sizes["fast"] = buffer_size(lambda: FastTextMessageContentEvent(
+            message_id="message", delta="Hello, world! "
+        ))
+
+    benchmark.pedantic(measure, rounds=1, iterations=1)
+    benchmark.extra_info["bytes_per_event"] = sizes
+    assert sizes["fast"] * 5 <= sizes["model"]
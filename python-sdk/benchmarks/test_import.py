@@ -0,0 +1,53 @@
+"""
+Import-time benchmarks with a regression budget.
+
+Each statement runs in a fresh interpreter with `-X importtime`; only the
+time spent in the SDK's own modules counts against the budget, so a slow
+pydantic or a cold disk cache does not fail the check.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Statement, and the budget for the SDK's own import time in milliseconds
+IMPORT_BUDGETS = [
+    ("from ag_ui.core import EventType", 5),
+    ("import ag_ui.core.events", 40),
+    ("import ag_ui.encoder", 50),
+]
+
+
+def sdk_import_time(statement: str) -> float:
+    """
+    Returns the self time of the ag_ui modules imported by a statement, in
+    seconds.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True
+    ).stderr
+    total = 0
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        self_time, _, module = line[len("import time:"):].split("|")
+        if module.strip().startswith("ag_ui") and self_time.strip().isdigit():
+            total += int(self_time)
+    return total / 1e6
+
+
+@pytest.mark.parametrize("statement, budget_ms", IMPORT_BUDGETS, ids=[s for s, _ in IMPORT_BUDGETS])
+def test_import_time(benchmark, statement, budget_ms):
+    """Import the SDK in a fresh interpreter and check its import time against the budget"""
+    timings = []
+
+    def run():
+        timings.append(sdk_import_time(statement))
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    assert min(timings) * 1000 <= budget_ms, (
+        f"{statement!r} spent {min(timings) * 1000:.1f} ms in ag_ui, over the {budget_ms} ms budget"
+    )
@@ -0,0 +1,37 @@
+"""
+Benchmarks for computing and applying JSON Patch state deltas.
+"""
+
+import copy
+
+import pytest
+
+from .samples import make_state
+
+jsonpatch = pytest.importorskip("jsonpatch")
+
+STATE_SIZES = [10, 100, 1_000]
+
+
+def _changed(state):
+    changed = copy.deepcopy(state)
+    for item in changed["items"][::10]:
+        item["done"] = not item["done"]
+    changed["items"].append({"id": -1, "name": "New item", "done": False, "tags": []})
+    return changed
+
+
+@pytest.mark.parametrize("size", STATE_SIZES)
+def test_make_patch(benchmark, size):
+    """Diff two states that differ in every tenth item"""
+    state = make_state(size)
+    changed = _changed(state)
+    benchmark(jsonpatch.make_patch, state, changed)
+
+
+@pytest.mark.parametrize("size", STATE_SIZES)
+def test_apply_patch(benchmark, size):
+    """Apply the delta between two states"""
+    state = make_state(size)
+    patch = jsonpatch.make_patch(state, _changed(state))
+    benchmark(patch.apply, state)
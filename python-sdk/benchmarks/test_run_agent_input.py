@@ -0,0 +1,49 @@
+"""
+Benchmarks for validating the input of a run.
+"""
+
+import json
+
+import pytest
+
+from ag_ui.core import RunAgentInput
+from ag_ui.threads import ThreadStore
+from ag_ui.tools import ToolCache
+from .samples import make_input
+
+
+@pytest.mark.parametrize("message_count", [10, 1_000, 10_000])
+def test_validate_run_agent_input(benchmark, message_count):
+    """Validate a RunAgentInput from parsed JSON"""
+    data = make_input(message_count)
+    benchmark(RunAgentInput.model_validate, data)
+
+
+@pytest.mark.parametrize("message_count", [10, 1_000, 10_000])
+def test_validate_run_agent_input_json(benchmark, message_count):
+    """Validate a RunAgentInput from a request body"""
+    body = json.dumps(make_input(message_count))
+    benchmark(RunAgentInput.model_validate_json, body)
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+def test_validate_run_agent_input_tools(benchmark, cached):
+    """Validate a request body with 50 tools, with and without the tool cache"""
+    body = json.dumps(make_input(10, tool_count=50))
+    if cached:
+        cache = ToolCache()
+        cache.parse_run_agent_input(body)
+        benchmark(cache.parse_run_agent_input, body)
+    else:
+        benchmark(RunAgentInput.model_validate_json, body)
+
+
+@pytest.mark.parametrize("message_count", [1_000, 10_000])
+def test_resolve_thread_history(benchmark, message_count):
+    """Validate a request body with one new message on top of a stored history"""
+    store = ThreadStore()
+    store.resolve(RunAgentInput.model_validate({**make_input(message_count), "baseVersion": 0}))
+    data = make_input(1)
+    data["baseVersion"] = message_count
+    body = json.dumps(data)
+    benchmark(lambda: store.resolve(RunAgentInput.model_validate_json(body)))
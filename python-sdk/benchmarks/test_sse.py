@@ -0,0 +1,66 @@
+"""
+End-to-end benchmarks of streaming server-sent events from the example server.
+"""
+
+import asyncio
+
+import pytest
+
+from ag_ui.core import EventType, TextMessageContentEvent
+from .samples import make_input
+
+httpx = pytest.importorskip("httpx")
+fastapi = pytest.importorskip("fastapi")
+router = pytest.importorskip("example_server.router")
+
+EVENT_COUNTS = [100, 1_000]
+
+
+async def content_agent(input_data):
+    """
+    Streams as many text message chunks as the input asks for, without delays.
+    """
+    for _ in range(input_data.forwarded_props["events"]):
+        yield TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id="message",
+            delta="Hello, world! "
+        )
+
+
+def _app():
+    app = fastapi.FastAPI()
+    agents = router.AGUIRouter()
+    agents.add_agent("/content", content_agent)
+    app.include_router(agents)
+    return app
+
+
+@pytest.fixture(scope="module")
+def run_async():
+    """
+    Runs coroutines on one event loop shared by the benchmark rounds.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.mark.parametrize("event_count", EVENT_COUNTS)
+def test_stream_events(benchmark, run_async, event_count):
+    """Stream a run of text message chunks through the AG-UI router"""
+    transport = httpx.ASGITransport(app=_app())
+    body = make_input(10)
+    body["forwardedProps"] = {"events": event_count}
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            async with client.stream("POST", "/content", json=body) as response:
+                received = 0
+                async for chunk in response.aiter_bytes():
+                    received += len(chunk)
+                return received
+
+    received = benchmark(lambda: run_async(run()))
+    benchmark.extra_info["bytes"] = received
+    benchmark.extra_info["events"] = event_count + 2
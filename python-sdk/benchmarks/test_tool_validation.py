@@ -0,0 +1,68 @@
+"""
+Benchmarks for validating tool call arguments against their schema.
+"""
+
+import json
+
+import pytest
+
+from ag_ui.tools import compile_schema
+
+from .samples import make_state
+
+STATE_SIZES = [10, 100]
+
+STATE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string", "maxLength": 100},
+        "items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer", "minimum": -1},
+                    "name": {"type": "string"},
+                    "done": {"type": "boolean"},
+                    "tags": {"type": "array", "items": {"type": "string", "enum": ["a", "b"]}}
+                },
+                "required": ["id", "name", "done"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["title", "items"]
+}
+
+
+def _chunks(text, size=4):
+    return [text[index:index + size] for index in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", STATE_SIZES)
+def test_validate_arguments(benchmark, size):
+    """Validate complete arguments"""
+    arguments = json.dumps(make_state(size))
+    compiled = compile_schema(STATE_SCHEMA)
+    benchmark(compiled.validate_json, arguments)
+
+
+@pytest.mark.parametrize("size", STATE_SIZES)
+def test_validate_streaming_arguments(benchmark, size):
+    """Validate arguments streamed in chunks of four characters"""
+    chunks = _chunks(json.dumps(make_state(size)))
+    compiled = compile_schema(STATE_SCHEMA)
+
+    def validate():
+        validator = compiled.stream()
+        for chunk in chunks:
+            validator.feed(chunk)
+        return validator.finish()
+
+    benchmark(validate)
+
+
+def test_compile_cached_schema(benchmark):
+    """Look up a compiled schema by its hash"""
+    compile_schema(STATE_SCHEMA)
+    benchmark(compile_schema, STATE_SCHEMA)
@@ -0,0 +1,157 @@
+import unittest
+import io
+import os
+import tempfile
+
+from ag_ui.core import (
+    EventType,
+    FastEvent,
+    RunStartedEvent,
+    RunFinishedEvent,
+    TextMessageStartEvent,
+    TextMessageContentEvent,
+    TextMessageEndEvent,
+    TextMessageChunkEvent,
+    ToolCallStartEvent,
+    ToolCallArgsEvent,
+    ToolCallEndEvent,
+    StateDeltaEvent,
+    MessagesSnapshotEvent,
+    UserMessage,
+    FastTextMessageContentEvent,
+)
+from ag_ui.eventlog import EventLogWriter, EventLog
+
+
+def run_events():
+    return [
+        RunStartedEvent(type=EventType.RUN_STARTED, thread_id="t1", run_id="r1", timestamp=1000),
+        TextMessageStartEvent(type=EventType.TEXT_MESSAGE_START, message_id="m1", role="assistant", timestamp=1001),
+        TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id="m1", delta="Héllo", timestamp=1002),
+        TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id="m1", delta=" world", timestamp=1003),
+        TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id="m1", timestamp=1004),
+        ToolCallStartEvent(type=EventType.TOOL_CALL_START, tool_call_id="c1", tool_call_name="search"),
+        ToolCallArgsEvent(type=EventType.TOOL_CALL_ARGS, tool_call_id="c1", delta='{"q": 1}', timestamp=1006),
+        ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id="c1", timestamp=1007),
+        TextMessageChunkEvent(type=EventType.TEXT_MESSAGE_CHUNK, delta=""),
+        StateDeltaEvent(type=EventType.STATE_DELTA, delta=[{"op": "add", "path": "/a", "value": None}]),
+        MessagesSnapshotEvent(type=EventType.MESSAGES_SNAPSHOT, messages=[
+            UserMessage(id="u1", role="user", content="Hi")
+        ]),
+        RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id="t1", run_id="r1", timestamp=1011),
+    ]
+
+
+def write_log(events):
+    writer = EventLogWriter()
+    writer.extend(events)
+    return writer.to_bytes()
+
+
+class TestEventLog(unittest.TestCase):
+    """Test suite for the columnar event log"""
+
+    def test_round_trip(self):
+        """Test that every event is reconstructed exactly"""
+        events = run_events()
+        log = EventLog(write_log(events))
+        self.assertEqual(len(log), len(events))
+        for event, stored in zip(events, log):
+            self.assertIsInstance(stored, FastEvent)
+            self.assertEqual(stored.to_model(), event)
+
+    def test_fast_events(self):
+        """Test that fast events are stored like their models"""
+        events = run_events()
+        self.assertEqual(
+            write_log(FastEvent.from_model(event) for event in events),
+            write_log(events)
+        )
+
+    def test_columns(self):
+        """Test the type, timestamp and ID columns and the interned IDs"""
+        log = EventLog(write_log(run_events()))
+        self.assertEqual(log.id_table, ["m1", "c1"])
+        self.assertEqual(log.event_type(2), EventType.TEXT_MESSAGE_CONTENT)
+        self.assertEqual(log.event_id(3), "m1")
+        self.assertIsNone(log.event_id(0))
+        self.assertEqual(log.delta(2), "Héllo")
+        self.assertEqual(log.delta(8), "")
+        self.assertEqual(log.timestamps[1], 1001)
+        self.assertEqual(list(log.ids[:3]), [-1, 0, 0])
+
+    def test_select(self):
+        """Test filtering by type, ID and time"""
+        log = EventLog(write_log(run_events()))
+        self.assertEqual(
+            list(log.select(types=[EventType.TEXT_MESSAGE_CONTENT, EventType.TOOL_CALL_ARGS])),
+            [2, 3, 6]
+        )
+        self.assertEqual(list(log.select(ids=["c1"])), [5, 6, 7])
+        self.assertEqual(list(log.select(ids=["unknown"])), [])
+        self.assertEqual(list(log.select(types=[])), [])
+        # Events without a timestamp never match a time range
+        self.assertEqual(list(log.select(since=1003, until=1007)), [3, 4, 6])
+        self.assertEqual(
+            list(log.select(types=[EventType.TEXT_MESSAGE_CONTENT], ids=["m1"], since=1003)),
+            [3]
+        )
+
+    def test_filter(self):
+        """Test that filtered events are reconstructed in order"""
+        log = EventLog(write_log(run_events()))
+        events = list(log.filter(types=[EventType.TEXT_MESSAGE_CONTENT]))
+        self.assertEqual(
+            events,
+            [
+                FastTextMessageContentEvent(message_id="m1", delta="Héllo", timestamp=1002),
+                FastTextMessageContentEvent(message_id="m1", delta=" world", timestamp=1003),
+            ]
+        )
+
+    def test_indexing(self):
+        """Test negative and out of range indexes"""
+        log = EventLog(write_log(run_events()))
+        self.assertEqual(log[-1].type, EventType.RUN_FINISHED)
+        with self.assertRaises(IndexError):
+            log[len(log)]
+
+    def test_memory_mapped_file(self):
+        """Test writing a file and reading it memory-mapped"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.aguilog")
+            writer = EventLogWriter()
+            writer.extend(run_events())
+            writer.write(path)
+            with EventLog.open(path) as log:
+                self.assertEqual(log[2].delta, "Héllo")
+                types = log.types
+            # Closing the log releases its columns
+            with self.assertRaises(ValueError):
+                types[0]
+
+    def test_write_to_file_object(self):
+        """Test writing to a binary file object"""
+        writer = EventLogWriter()
+        writer.extend(run_events())
+        output = io.BytesIO()
+        writer.write(output)
+        self.assertEqual(output.getvalue(), writer.to_bytes())
+
+    def test_empty_log(self):
+        """Test a log without events"""
+        log = EventLog(EventLogWriter().to_bytes())
+        self.assertEqual(len(log), 0)
+        self.assertEqual(list(log), [])
+
+    def test_invalid_data(self):
+        """Test that other files and truncated logs are rejected"""
+        with self.assertRaises(ValueError):
+            EventLog(b"not an event log at all" * 10)
+        data = write_log(run_events())
+        with self.assertRaises(ValueError):
+            EventLog(data[:len(data) // 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -298,6 +298,20 @@ class TestEvents(unittest.TestCase):
         self.assertEqual(serialized["type"], "RUN_ERROR")
         self.assertEqual(serialized["message"], "An error occurred during execution")
         self.assertEqual(serialized["code"], "ERROR_001")
+        self.assertIsNone(serialized["retryable"])
+
+    def test_run_error_retryable(self):
+        """Test that a RunErrorEvent can be marked as retryable"""
+        event = RunErrorEvent(
+            type=EventType.RUN_ERROR,
+            message="Upstream timed out",
+            code="UNAVAILABLE",
+            retryable=True
+        )
+        self.assertTrue(event.retryable)
+
+        serialized = json.loads(event.model_dump_json(by_alias=True, exclude_none=True))
+        self.assertEqual(serialized["retryable"], True)
 
     def test_step_started(self):
         """Test creating and serializing a StepStartedEvent event"""
@@ -0,0 +1,120 @@
+import unittest
+import json
+
+from ag_ui.core import (
+    EventType,
+    TextMessageContentEvent,
+    ToolCallStartEvent,
+    MessagesSnapshotEvent,
+    RunErrorEvent,
+    UserMessage,
+    AssistantMessage,
+    ToolCall,
+    FunctionCall,
+    FastEvent,
+    FastTextMessageContentEvent,
+    FastToolCallStartEvent,
+    FastMessagesSnapshotEvent,
+)
+from ag_ui.core.fast_events import FAST_EVENT_CLASSES
+from ag_ui.encoder import EventEncoder
+
+
+def sample_events():
+    return [
+        TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id="m1", delta="Héllo", timestamp=1),
+        ToolCallStartEvent(type=EventType.TOOL_CALL_START, tool_call_id="c1", tool_call_name="search"),
+        RunErrorEvent(type=EventType.RUN_ERROR, message="failed", retryable=False),
+        MessagesSnapshotEvent(type=EventType.MESSAGES_SNAPSHOT, messages=[
+            UserMessage(id="u1", role="user", content="Hi"),
+            AssistantMessage(id="a1", role="assistant", tool_calls=[
+                ToolCall(id="c1", type="function", function=FunctionCall(name="search", arguments="{}"))
+            ])
+        ]),
+    ]
+
+
+class TestFastEvents(unittest.TestCase):
+    """Test suite for the compact event representation"""
+
+    def test_a_class_per_event_type(self):
+        """Test that every event type has a fast event class"""
+        self.assertEqual(set(FAST_EVENT_CLASSES), set(EventType))
+        self.assertIs(FAST_EVENT_CLASSES[EventType.TEXT_MESSAGE_CONTENT], FastTextMessageContentEvent)
+        self.assertIs(FastTextMessageContentEvent.model, TextMessageContentEvent)
+
+    def test_slots(self):
+        """Test that fast events have no instance dictionary"""
+        event = FastTextMessageContentEvent(message_id="m1", delta="Hi")
+        self.assertFalse(hasattr(event, "__dict__"))
+        self.assertEqual(event.type, EventType.TEXT_MESSAGE_CONTENT)
+        self.assertIsNone(event.timestamp)
+        with self.assertRaises(AttributeError):
+            event.role = "assistant"
+
+    def test_constructor_checks_fields(self):
+        """Test that required and unknown fields are checked"""
+        with self.assertRaises(TypeError):
+            FastTextMessageContentEvent(message_id="m1")
+        with self.assertRaises(TypeError):
+            FastTextMessageContentEvent(message_id="m1", delta="Hi", role="assistant")
+
+    def test_model_round_trip(self):
+        """Test that models convert to fast events and back"""
+        for event in sample_events():
+            fast = FastEvent.from_model(event)
+            self.assertEqual(fast.type, event.type)
+            self.assertEqual(fast.to_model(), event)
+            self.assertEqual(fast.to_model(validate=True), event)
+
+    def test_nested_models_are_validated(self):
+        """Test that nested values become models when converting to a model"""
+        event = sample_events()[3]
+        fast = FastEvent.from_json(event.model_dump_json(by_alias=True, exclude_none=True))
+        self.assertIsInstance(fast.messages[0], dict)
+        model = fast.to_model()
+        self.assertIsInstance(model.messages[0], UserMessage)
+        self.assertEqual(model, event)
+
+    def test_to_json_matches_model(self):
+        """Test that fast events encode exactly like their models"""
+        for event in sample_events():
+            self.assertEqual(
+                FastEvent.from_model(event).to_json(),
+                event.model_dump_json(by_alias=True, exclude_none=True)
+            )
+
+    def test_from_json(self):
+        """Test decoding fast events from their JSON encoding"""
+        fast = FastEvent.from_json('{"type":"TOOL_CALL_START","toolCallId":"c1","toolCallName":"search"}')
+        self.assertIsInstance(fast, FastToolCallStartEvent)
+        self.assertEqual(fast, FastToolCallStartEvent(tool_call_id="c1", tool_call_name="search"))
+        with self.assertRaises(ValueError):
+            FastEvent.from_json('{"type":"TOOL_CALL_END","toolCallId":"c1","delta":"x"}')
+        with self.assertRaises(ValueError):
+            FastEvent.from_json('{"type":"NO_SUCH_EVENT"}')
+
+    def test_validation_is_deferred(self):
+        """Test that invalid fast events fail when validated"""
+        fast = FastTextMessageContentEvent(message_id="m1", delta="")
+        with self.assertRaises(ValueError):
+            fast.to_model(validate=True)
+
+    def test_encoder(self):
+        """Test that the encoder encodes fast events like their models"""
+        encoder = EventEncoder()
+        for event in sample_events():
+            self.assertEqual(encoder.encode(FastEvent.from_model(event)), encoder.encode(event))
+        encoded = encoder.encode(FastMessagesSnapshotEvent(messages=[{"id": "u1", "role": "user", "content": "Hi"}]))
+        self.assertEqual(json.loads(encoded[len("data: "):])["messages"][0]["content"], "Hi")
+
+    def test_repr(self):
+        """Test that the representation lists the fields that are set"""
+        self.assertEqual(
+            repr(FastTextMessageContentEvent(message_id="m1", delta="Hi")),
+            "FastTextMessageContentEvent(message_id='m1', delta='Hi')"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
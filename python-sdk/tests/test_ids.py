@@ -0,0 +1,126 @@
+import unittest
+
+from ag_ui.core import (
+    EventType,
+    TextMessageContentEvent,
+    TextMessageEndEvent,
+    ToolCallArgsEvent,
+    ToolCallEndEvent,
+    FastTextMessageContentEvent,
+    IdGenerator,
+    StreamIds,
+    generate_id,
+)
+from ag_ui.encoder import EventEncoder
+
+
+class TestIdGenerator(unittest.TestCase):
+    """Test suite for the ID generator"""
+
+    def test_ids_are_short_and_unique(self):
+        """Test that IDs are unique and much shorter than UUIDs"""
+        generator = IdGenerator()
+        ids = [generator() for _ in range(5000)]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertTrue(all(len(value) <= 14 for value in ids))
+        self.assertTrue(all(value.isalnum() for value in ids))
+
+    def test_ids_sort_in_generation_order(self):
+        """Test that the IDs of a generator sort in the order they were generated"""
+        generator = IdGenerator()
+        ids = [generator() for _ in range(5000)]
+        self.assertEqual(sorted(ids), ids)
+
+    def test_generators_do_not_collide(self):
+        """Test that generators draw different tokens"""
+        self.assertNotEqual(IdGenerator()(), IdGenerator()())
+        generator = IdGenerator()
+        first = generator()
+        generator.reset()
+        self.assertNotEqual(generator(), first)
+
+    def test_prefix(self):
+        """Test that IDs start with the prefix"""
+        self.assertTrue(IdGenerator(prefix="msg_")().startswith("msg_"))
+
+    def test_generate_id(self):
+        """Test the default generator"""
+        self.assertNotEqual(generate_id(), generate_id())
+
+
+class TestStreamIds(unittest.TestCase):
+    """Test suite for the IDs of a stream"""
+
+    def test_json(self):
+        """Test that IDs are escaped as JSON strings and released"""
+        ids = StreamIds()
+        self.assertEqual(ids.json('a"b\\c'), '"a\\"b\\\\c"')
+        ids.release('a"b\\c')
+        ids.json("m1")
+        self.assertEqual(len(ids), 1)
+        ids.release("m1")
+        self.assertEqual(len(ids), 0)
+
+
+class TestChunkEncoding(unittest.TestCase):
+    """Test suite for the encoding of text message and tool call chunks"""
+
+    def assert_encoded_like_model(self, encoder, event):
+        self.assertEqual(
+            encoder.encode(event),
+            f"data: {event.model_dump_json(by_alias=True, exclude_none=True)}\n\n"
+        )
+
+    def test_chunks_match_the_model(self):
+        """Test that chunks are encoded exactly like their models, whatever they contain"""
+        encoder = EventEncoder()
+        deltas = ["Hello", 'quote " and \\ backslash', "new\nline\ttab\x01\x1f", "héllo 😀  ", " "]
+        for delta in deltas:
+            self.assert_encoded_like_model(encoder, TextMessageContentEvent(
+                type=EventType.TEXT_MESSAGE_CONTENT, message_id='id "1"', delta=delta
+            ))
+            self.assert_encoded_like_model(encoder, ToolCallArgsEvent(
+                type=EventType.TOOL_CALL_ARGS, tool_call_id="call-1", delta=delta
+            ))
+
+    def test_lone_surrogates_are_rejected_like_the_model(self):
+        """Test that chunks that are not valid UTF-8 fail like their models"""
+        encoder = EventEncoder()
+        for message_id, delta in (("m1", "a\ud800b"), ("m\udc00", "Hi")):
+            event = TextMessageContentEvent(
+                type=EventType.TEXT_MESSAGE_CONTENT, message_id=message_id, delta=delta
+            )
+            with self.assertRaises(ValueError):
+                event.model_dump_json()
+            with self.assertRaises(ValueError):
+                encoder.encode(event)
+
+    def test_chunks_with_timestamps_match_the_model(self):
+        """Test that chunks with optional fields are encoded like their models"""
+        encoder = EventEncoder()
+        self.assert_encoded_like_model(encoder, TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT, message_id="m1", delta="Hi", timestamp=5
+        ))
+        self.assert_encoded_like_model(encoder, TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT, message_id="m1", delta="Hi", raw_event={"a": 1}
+        ))
+
+    def test_fast_chunks(self):
+        """Test that fast chunk events are encoded like their models"""
+        encoder = EventEncoder()
+        fast = FastTextMessageContentEvent(message_id="m1", delta="Hi")
+        self.assertEqual(encoder.encode(fast), encoder.encode(fast.to_model()))
+
+    def test_ids_are_released_when_messages_end(self):
+        """Test that the IDs of ended messages and tool calls are not kept"""
+        encoder = EventEncoder()
+        encoder.encode(TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id="m1", delta="Hi"))
+        encoder.encode(ToolCallArgsEvent(type=EventType.TOOL_CALL_ARGS, tool_call_id="c1", delta="{}"))
+        self.assertEqual(len(encoder._ids._json), 2)
+        encoder.encode(TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id="m1"))
+        encoder.encode(ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id="c1"))
+        self.assertEqual(len(encoder._ids._json), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import subprocess
+import sys
+
+import ag_ui.core
+
+
+def imported_modules(statement: str) -> set:
+    """Runs an import statement in a fresh interpreter and returns the modules it loaded"""
+    output = subprocess.run(
+        [sys.executable, "-c", f"import sys; {statement}; print(' '.join(sys.modules))"],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test suite for the lazy loading of ag_ui.core"""
+
+    def test_package_import_is_lazy(self):
+        """Test that importing the package does not import the models"""
+        modules = imported_modules("import ag_ui.core")
+        self.assertNotIn("ag_ui.core.events", modules)
+        self.assertNotIn("ag_ui.core.types", modules)
+        self.assertNotIn("pydantic", modules)
+
+    def test_event_type_does_not_need_pydantic(self):
+        """Test that EventType can be used without importing the models"""
+        modules = imported_modules("from ag_ui.core import EventType; EventType.RUN_STARTED")
+        self.assertIn("ag_ui.core.event_type", modules)
+        self.assertNotIn("ag_ui.core.events", modules)
+        self.assertNotIn("pydantic", modules)
+
+    def test_lazy_attributes(self):
+        """Test that every public name resolves to the object of its submodule"""
+        import importlib
+        from ag_ui.core import events, event_type
+        for name in ag_ui.core.__all__:
+            module = importlib.import_module(ag_ui.core._LAZY_IMPORTS[name])
+            self.assertIs(getattr(ag_ui.core, name), getattr(module, name))
+        self.assertIs(events.EventType, event_type.EventType)
+
+    def test_dir_lists_public_names(self):
+        """Test that dir() lists the names that are not loaded yet"""
+        self.assertTrue(set(ag_ui.core.__all__) <= set(dir(ag_ui.core)))
+
+    def test_unknown_attribute(self):
+        """Test that unknown names raise AttributeError"""
+        with self.assertRaises(AttributeError):
+            getattr(ag_ui.core, "NoSuchEvent")
+        with self.assertRaises(ImportError):
+            exec("from ag_ui.core import NoSuchEvent", {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import time
+import unittest
+
+from ag_ui.core.events import (
+    EventType,
+    RunStartedEvent,
+    RunFinishedEvent,
+    RunErrorEvent,
+    TextMessageContentEvent
+)
+from ag_ui.encoder import EventEncoder, Instrumentation, OpenTelemetryInstrumentation
+
+
+class RecordingInstrumentation(Instrumentation):
+    """Records the calls of the encoder"""
+
+    def __init__(self, sample_rate: float = 1.0):
+        super().__init__(sample_rate)
+        self.samples = []
+        self.first_events = []
+        self.runs = []
+
+    def on_encode(self, sample):
+        self.samples.append(sample)
+
+    def on_first_event(self, agent, seconds):
+        self.first_events.append((agent, seconds))
+
+    def on_run_finished(self, agent, seconds, events, error):
+        self.runs.append((agent, seconds, events, error))
+
+
+def run_events(count: int = 3):
+    events = [RunStartedEvent(type=EventType.RUN_STARTED, thread_id="t1", run_id="r1")]
+    events += [
+        TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id="m1", delta="héllo")
+        for _ in range(count)
+    ]
+    events.append(RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id="t1", run_id="r1"))
+    return events
+
+
+class TestEncoderInstrumentation(unittest.TestCase):
+    """Test suite for the instrumentation hooks of the EventEncoder"""
+
+    def test_encoding_is_unchanged(self):
+        """Test that instrumentation does not change the encoded events"""
+        plain = EventEncoder()
+        instrumented = EventEncoder(instrumentation=RecordingInstrumentation())
+        for event in run_events():
+            self.assertEqual(instrumented.encode(event), plain.encode(event))
+
+    def test_samples_every_event(self):
+        """Test that every event is measured by default"""
+        instrumentation = RecordingInstrumentation()
+        encoder = EventEncoder(instrumentation=instrumentation, agent="chat")
+        encoded = [encoder.encode(event) for event in run_events()]
+
+        self.assertEqual(
+            [sample.event_type for sample in instrumentation.samples],
+            [EventType.RUN_STARTED] + [EventType.TEXT_MESSAGE_CONTENT] * 3 + [EventType.RUN_FINISHED]
+        )
+        for sample, data in zip(instrumentation.samples, encoded):
+            self.assertEqual(sample.agent, "chat")
+            self.assertEqual(sample.weight, 1)
+            self.assertGreaterEqual(sample.seconds, 0)
+            # Sizes are in bytes, not characters
+            self.assertEqual(sample.size, len(data.encode("utf-8")))
+
+    def test_sampling(self):
+        """Test that only one in 1 / sample_rate events is measured, weighted accordingly"""
+        instrumentation = RecordingInstrumentation(sample_rate=0.25)
+        encoder = EventEncoder(instrumentation=instrumentation)
+        for event in run_events(count=10):
+            encoder.encode(event)
+
+        self.assertEqual(len(instrumentation.samples), 3)
+        self.assertTrue(all(sample.weight == 4 for sample in instrumentation.samples))
+        # Run measurements are not sampled
+        self.assertEqual(len(instrumentation.first_events), 1)
+        self.assertEqual(len(instrumentation.runs), 1)
+
+    def test_invalid_sample_rate(self):
+        """Test that sample rates outside (0, 1] are rejected"""
+        for sample_rate in (0, -1, 1.5):
+            with self.assertRaises(ValueError):
+                Instrumentation(sample_rate=sample_rate)
+
+    def test_run_measurements(self):
+        """Test that the first event and the end of the run are reported"""
+        instrumentation = RecordingInstrumentation()
+        encoder = EventEncoder(instrumentation=instrumentation, agent="chat")
+        for event in run_events():
+            encoder.encode(event)
+
+        self.assertEqual(len(instrumentation.first_events), 1)
+        self.assertEqual(instrumentation.first_events[0][0], "chat")
+        agent, seconds, events, error = instrumentation.runs[0]
+        self.assertEqual((agent, events, error), ("chat", 5, False))
+        self.assertGreaterEqual(seconds, instrumentation.first_events[0][1])
+
+    def test_first_event_is_produced_by_the_agent(self):
+        """Test that the time to the first event excludes the run lifecycle events"""
+        instrumentation = RecordingInstrumentation()
+        encoder = EventEncoder(instrumentation=instrumentation)
+        events = run_events(count=1)
+        encoder.encode(events[0])
+        self.assertEqual(instrumentation.first_events, [])
+        encoder.encode(events[1])
+        self.assertEqual(len(instrumentation.first_events), 1)
+
+        # A run that fails before the agent produced an event has no first event
+        instrumentation = RecordingInstrumentation()
+        encoder = EventEncoder(instrumentation=instrumentation)
+        encoder.encode(events[0])
+        encoder.encode(RunErrorEvent(type=EventType.RUN_ERROR, message="failed"))
+        self.assertEqual(instrumentation.first_events, [])
+        self.assertEqual(len(instrumentation.runs), 1)
+
+    def test_started(self):
+        """Test that run times are measured from the given start"""
+        instrumentation = RecordingInstrumentation()
+        encoder = EventEncoder(instrumentation=instrumentation, started=time.perf_counter() - 10)
+        for event in run_events():
+            encoder.encode(event)
+
+        self.assertGreaterEqual(instrumentation.first_events[0][1], 10)
+        self.assertGreaterEqual(instrumentation.runs[0][1], 10)
+
+    def test_run_error(self):
+        """Test that a run ending with RUN_ERROR is reported as failed"""
+        instrumentation = RecordingInstrumentation()
+        encoder = EventEncoder(instrumentation=instrumentation)
+        encoder.encode(RunStartedEvent(type=EventType.RUN_STARTED, thread_id="t1", run_id="r1"))
+        encoder.encode(RunErrorEvent(type=EventType.RUN_ERROR, message="failed"))
+
+        self.assertEqual(instrumentation.runs[0][2:], (2, True))
+
+    def test_open_telemetry_instrumentation(self):
+        """Test that measurements are recorded on the instruments of the given meter"""
+        class Instrument:
+            def __init__(self):
+                self.values = []
+
+            def add(self, value, attributes):
+                self.values.append((value, attributes))
+
+            record = add
+
+        class Meter:
+            def __init__(self):
+                self.instruments = {}
+
+            def create_counter(self, name, **kwargs):
+                return self.instruments.setdefault(name, Instrument())
+
+            create_histogram = create_counter
+
+        meter = Meter()
+        encoder = EventEncoder(instrumentation=OpenTelemetryInstrumentation(meter=meter), agent="chat")
+        encoded = [encoder.encode(event) for event in run_events(count=1)]
+
+        events = meter.instruments["ag_ui.events"].values
+        self.assertEqual(len(events), 3)
+        self.assertEqual(events[1], (1, {"agent": "chat", "event_type": "TEXT_MESSAGE_CONTENT"}))
+        self.assertEqual(
+            sum(value for value, _ in meter.instruments["ag_ui.event.bytes"].values),
+            sum(len(data.encode("utf-8")) for data in encoded)
+        )
+        run = meter.instruments["ag_ui.run.duration"].values
+        self.assertEqual(run[0][1], {"agent": "chat", "outcome": "finished"})
+        self.assertEqual(len(meter.instruments["ag_ui.run.time_to_first_event"].values), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
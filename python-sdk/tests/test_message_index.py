@@ -0,0 +1,76 @@
+import unittest
+
+from ag_ui.core import AssistantMessage, FunctionCall, ToolCall, ToolMessage, UserMessage
+from ag_ui.threads import MessageIndex
+
+
+def tool_call(tool_call_id):
+    return ToolCall(
+        id=tool_call_id,
+        type="function",
+        function=FunctionCall(name="lookup", arguments="{}")
+    )
+
+
+def history():
+    return [
+        UserMessage(id="u1", role="user", content="Hi"),
+        AssistantMessage(id="a1", role="assistant", tool_calls=[tool_call("c1"), tool_call("c2")]),
+        ToolMessage(id="t1", role="tool", content="Done", tool_call_id="c1"),
+        UserMessage(id="u2", role="user", content="Thanks"),
+    ]
+
+
+class TestMessageIndex(unittest.TestCase):
+    """Test suite for the message index"""
+
+    def test_lookups(self):
+        """Test lookups by ID, role and tool call"""
+        messages = history()
+        index = MessageIndex(messages)
+        self.assertIs(index.get("a1"), messages[1])
+        self.assertIsNone(index.get("missing"))
+        self.assertEqual(index.by_role("user"), [messages[0], messages[3]])
+        self.assertEqual(index.by_role("developer"), [])
+        self.assertIs(index.last(), messages[3])
+        self.assertIs(index.last("tool"), messages[2])
+        self.assertEqual(index.tool_call("c2").id, "c2")
+        self.assertIs(index.tool_call_message("c2"), messages[1])
+        self.assertIs(index.tool_result("c1"), messages[2])
+        self.assertIsNone(index.tool_result("c2"))
+
+    def test_unanswered_tool_calls(self):
+        """Test that tool calls are unanswered until a tool message answers them"""
+        messages = history()
+        index = MessageIndex(messages)
+        self.assertEqual([call.id for call in index.unanswered_tool_calls()], ["c2"])
+        messages.append(ToolMessage(id="t2", role="tool", content="Done", tool_call_id="c2"))
+        self.assertEqual(index.unanswered_tool_calls(), [])
+
+    def test_appended_messages_are_indexed(self):
+        """Test that the index follows messages appended after it was built"""
+        messages = history()
+        index = MessageIndex(messages)
+        index.get("u1")
+        messages.append(UserMessage(id="u3", role="user", content="More"))
+        self.assertIs(index.get("u3"), messages[-1])
+        self.assertEqual(len(index.by_role("user")), 3)
+
+    def test_new_list(self):
+        """Test that assigning a new list rebuilds the index"""
+        index = MessageIndex(history())
+        self.assertIsNotNone(index.get("a1"))
+        index.messages = [UserMessage(id="u9", role="user", content="New")]
+        self.assertIsNone(index.get("a1"))
+        self.assertEqual(index.unanswered_tool_calls(), [])
+        self.assertEqual(len(index), 1)
+
+    def test_empty(self):
+        """Test an index without messages"""
+        index = MessageIndex([])
+        self.assertIsNone(index.last())
+        self.assertIsNone(index.last("user"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import json
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from ag_ui.core import EventType, StateSnapshotEvent, TextMessageContentEvent
+from ag_ui.encoder import EncodeSample, EventEncoder, Instrumentation, OffloadPolicy
+from ag_ui.encoder.offload import estimate_size
+
+
+def snapshot(items):
+    return StateSnapshotEvent(
+        type=EventType.STATE_SNAPSHOT,
+        snapshot={"items": [{"id": index, "text": "x" * 100} for index in range(items)]}
+    )
+
+
+def content(delta):
+    return TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id="m1", delta=delta)
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class TestOffloadPolicy(unittest.TestCase):
+    """Test suite for the choice of events to offload"""
+
+    def test_estimate_is_bounded(self):
+        """Test that long lists are estimated from their first items and the estimate stops at the limit"""
+        value = {"items": [{"text": "x" * 100} for _ in range(10000)]}
+        self.assertAlmostEqual(estimate_size(value, 10 ** 7), len(json.dumps(value)), delta=10 ** 5)
+        self.assertEqual(estimate_size(value, 1000), 1001)
+
+    def test_large_payloads_are_offloaded(self):
+        """Test that only large events of the offloaded types are offloaded"""
+        policy = OffloadPolicy(threshold=10000)
+        self.assertFalse(policy.should_offload(snapshot(10)))
+        self.assertTrue(policy.should_offload(snapshot(1000)))
+        self.assertFalse(policy.should_offload(content("x" * 100000)))
+
+    def test_event_types(self):
+        """Test that the offloaded event types can be chosen"""
+        policy = OffloadPolicy(threshold=10000, event_types=[EventType.TEXT_MESSAGE_CONTENT])
+        self.assertFalse(policy.should_offload(snapshot(1000)))
+        self.assertTrue(policy.should_offload(content("x" * 100000)))
+
+
+class TestEncodeAsync(unittest.TestCase):
+    """Test suite for the offloaded encoding of events"""
+
+    def test_same_output_and_order(self):
+        """Test that offloaded events are encoded like the others and stay in order"""
+        executor = RecordingExecutor()
+        events = [content("a"), snapshot(1000), content("b"), snapshot(2000), content("c")]
+        encoder = EventEncoder(offload=OffloadPolicy(threshold=10000, executor=executor))
+
+        async def run():
+            return [await encoder.encode_async(event) for event in events]
+
+        with executor:
+            self.assertEqual(asyncio.run(run()), [EventEncoder().encode(event) for event in events])
+        self.assertEqual(executor.submitted, 2)
+
+    def test_without_policy(self):
+        """Test that events are encoded on the loop without a policy"""
+        event = snapshot(1000)
+        self.assertEqual(asyncio.run(EventEncoder().encode_async(event)), EventEncoder().encode(event))
+
+    def test_offloaded_events_are_measured(self):
+        """Test that offloaded events are reported to the instrumentation"""
+        samples = []
+
+        class Recording(Instrumentation):
+            def on_encode(self, sample: EncodeSample) -> None:
+                samples.append(sample)
+
+        encoder = EventEncoder(
+            instrumentation=Recording(),
+            offload=OffloadPolicy(threshold=10000)
+        )
+        encoded = asyncio.run(encoder.encode_async(snapshot(1000)))
+        self.assertEqual(len(samples), 1)
+        self.assertEqual(samples[0].size, len(encoded.encode("utf-8")))
+
+    def test_process_pool(self):
+        """Test that events can be encoded in another process"""
+        event = snapshot(1000)
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            encoder = EventEncoder(offload=OffloadPolicy(threshold=10000, executor=executor))
+            self.assertEqual(asyncio.run(encoder.encode_async(event)), EventEncoder().encode(event))
+
+
+if __name__ == "__main__":
+    unittest.main()
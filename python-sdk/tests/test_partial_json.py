@@ -0,0 +1,166 @@
+import unittest
+import json
+import random
+
+from ag_ui.state.partial_json import PartialJSONParser, iter_partial_values
+
+
+DOCUMENTS = [
+    {"document": "Once upon a time, there was a dog named Rex."},
+    {"steps": [{"description": f"Step {i + 1}", "status": "pending"} for i in range(10)]},
+    {
+        "recipe": {
+            "skill_level": "Advanced",
+            "special_preferences": ["Low Carb", "Spicy"],
+            "ingredients": [{"icon": "🍗", "name": "chicken breast", "amount": "1"}],
+            "servings": 2,
+            "rating": -4.5e-1,
+            "vegan": False,
+            "vegetarian": True,
+            "notes": None,
+        }
+    },
+    {"escaped": "quote \" backslash \\ newline \n tab \t unicode é emoji 😀  "},
+    {"nested": [[], {}, [1, [2, [3]]], {"a": {"b": {}}}], "empty": ""},
+    [1, "two", 3.0, None],
+]
+
+
+def split_randomly(text, rng, max_size=5):
+    """Split a string into random chunks"""
+    chunks = []
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, max_size)
+        chunks.append(text[pos:pos + size])
+        pos += size
+    return chunks
+
+
+class TestPartialJSONParser(unittest.TestCase):
+    """Test suite for PartialJSONParser"""
+
+    def test_parses_documents_split_into_chunks(self):
+        """Test that any split of a document parses to the same value as json.loads"""
+        rng = random.Random(42)
+        for document in DOCUMENTS:
+            for text in (json.dumps(document), json.dumps(document, indent=2, ensure_ascii=False)):
+                for _ in range(20):
+                    parser = PartialJSONParser()
+                    for chunk in split_randomly(text, rng):
+                        parser.feed(chunk)
+                    self.assertTrue(parser.done)
+                    self.assertEqual(parser.value, document)
+
+    def test_single_character_chunks(self):
+        """Test feeding one character at a time, including escapes and surrogate pairs"""
+        document = {"text": "a\"b\\cé😀d", "n": 12345}
+        parser = PartialJSONParser()
+        for char in json.dumps(document):
+            parser.feed(char)
+        self.assertEqual(parser.value, document)
+
+    def test_partial_string_value(self):
+        """Test that a streaming string is visible before it is complete"""
+        parser = PartialJSONParser(["document"])
+        self.assertIsNone(parser.value)
+
+        self.assertFalse(parser.feed('{"title": "x", '))
+        self.assertIsNone(parser.value)
+
+        self.assertTrue(parser.feed('"document": "Once upon'))
+        self.assertEqual(parser.value, "Once upon")
+        self.assertEqual(parser.appended, "Once upon")
+
+        self.assertTrue(parser.feed(' a time\\n'))
+        self.assertEqual(parser.value, "Once upon a time\n")
+        self.assertEqual(parser.appended, " a time\n")
+
+        self.assertTrue(parser.feed('"}'))
+        self.assertEqual(parser.value, "Once upon a time\n")
+        self.assertEqual(parser.appended, "")
+        self.assertTrue(parser.done)
+
+    def test_partial_escape_is_not_visible(self):
+        """Test that a half-received escape sequence is held back"""
+        parser = PartialJSONParser(["text"])
+        parser.feed('{"text": "caf\\u00')
+        self.assertEqual(parser.value, "caf")
+        parser.feed('e9"}')
+        self.assertEqual(parser.value, "café")
+
+    def test_changes_outside_path_are_ignored(self):
+        """Test that feed only reports changes to the value at the path"""
+        parser = PartialJSONParser(["steps"])
+        self.assertFalse(parser.feed('{"title": "plan", "count": 2'))
+        self.assertTrue(parser.feed(', "steps": ['))
+        self.assertEqual(parser.value, [])
+        self.assertTrue(parser.feed('{"description": "Dig'))
+        self.assertEqual(parser.value, [{"description": "Dig"}])
+        self.assertTrue(parser.feed(' hole"}'))
+        # Closing the array completes the value at the path
+        self.assertTrue(parser.feed(']'))
+        self.assertFalse(parser.feed(', "other": "value'))
+        self.assertEqual(parser.value, [{"description": "Dig hole"}])
+
+    def test_numbers_appear_when_complete(self):
+        """Test that numbers are only reported once they are delimited"""
+        parser = PartialJSONParser(["values"])
+        parser.feed('{"values": [12')
+        self.assertEqual(parser.value, [])
+        parser.feed('3, 4.5')
+        self.assertEqual(parser.value, [123])
+        parser.feed("]}")
+        self.assertEqual(parser.value, [123, 4.5])
+
+    def test_list_index_path(self):
+        """Test a path that indexes into an array"""
+        parser = PartialJSONParser(["steps", 1, "description"])
+        parser.feed('{"steps": [{"description": "first"}, {"description": "sec')
+        self.assertEqual(parser.value, "sec")
+        self.assertEqual(parser.appended, "sec")
+
+    def test_invalid_json(self):
+        """Test that malformed input raises a ValueError"""
+        for text in ['{"a" 1}', '{"a": tru3}', '[1,]', '{"a": 1,}', '{"a": "\\x"}', '{} {}', '{"a": 01}']:
+            parser = PartialJSONParser()
+            with self.assertRaises(ValueError):
+                parser.feed(text)
+                parser.feed(" ")
+
+    def test_finish_completes_a_top_level_number(self):
+        """Test that a number at the end of the document completes when the input ends"""
+        parser = PartialJSONParser()
+        self.assertFalse(parser.feed("-12.5"))
+        self.assertIsNone(parser.value)
+        self.assertTrue(parser.finish())
+        self.assertEqual(parser.value, -12.5)
+        self.assertEqual(list(iter_partial_values(["4", "2"])), [42])
+
+    def test_finish_rejects_incomplete_documents(self):
+        """Test that finish raises a ValueError when the document is incomplete"""
+        for text in ['{"a": 1', '"abc', "tr", "", "-"]:
+            parser = PartialJSONParser()
+            parser.feed(text)
+            with self.assertRaises(ValueError):
+                parser.finish()
+
+    def test_control_characters_in_strings(self):
+        """Test that raw control characters in strings are rejected, and escaped ones accepted"""
+        for text in ['{"a": "line\nbreak"}', '"tab\there"', '{"a\x01": 1}']:
+            parser = PartialJSONParser()
+            with self.assertRaises(ValueError):
+                parser.feed(text)
+        parser = PartialJSONParser()
+        parser.feed('{"a": "line\\nbreak"}')
+        self.assertEqual(parser.value, {"a": "line\nbreak"})
+
+    def test_iter_partial_values(self):
+        """Test the iter_partial_values helper"""
+        chunks = ['{"document": "', "Hello", ", ", "world", '"}']
+        values = list(iter_partial_values(chunks, ["document"]))
+        self.assertEqual(values, ["", "Hello", "Hello, ", "Hello, world", "Hello, world"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+import unittest
+import asyncio
+import json
+
+from ag_ui.core.events import (
+    EventType,
+    CustomEvent,
+    ToolCallStartEvent,
+    ToolCallArgsEvent,
+    ToolCallEndEvent,
+    TextMessageStartEvent,
+)
+from ag_ui.state.predict import PredictiveStateEmitter
+
+
+PREDICT_DOCUMENT = [{"state_key": "document", "tool": "write_document", "tool_argument": "document"}]
+
+
+def tool_call_events(tool_call_id, name, deltas):
+    """Build the events of a streamed tool call"""
+    events = [ToolCallStartEvent(type=EventType.TOOL_CALL_START, tool_call_id=tool_call_id, tool_call_name=name)]
+    for delta in deltas:
+        events.append(ToolCallArgsEvent(type=EventType.TOOL_CALL_ARGS, tool_call_id=tool_call_id, delta=delta))
+    events.append(ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=tool_call_id))
+    return events
+
+
+def apply_patch(state, operations):
+    """Apply add and replace operations (RFC 6902) to a state"""
+    for operation in operations:
+        parts = [
+            part.replace("~1", "/").replace("~0", "~")
+            for part in operation["path"].split("/")[1:]
+        ]
+        target = state
+        for part in parts[:-1]:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        last = parts[-1]
+        if isinstance(target, list):
+            index = int(last)
+            if operation["op"] == "add":
+                target.insert(index, operation["value"])
+            else:
+                target[index] = operation["value"]
+        else:
+            target[last] = operation["value"]
+    return state
+
+
+def assert_client_order(test, events):
+    """Check events against the ordering rules of the TypeScript client's verifyEvents"""
+    message_id = None
+    tool_call_ids = set()
+    for event in events:
+        if message_id is not None:
+            test.assertIn(event.type, (EventType.TEXT_MESSAGE_CONTENT, EventType.TEXT_MESSAGE_END, EventType.RAW))
+        if tool_call_ids:
+            test.assertIn(
+                event.type,
+                (EventType.TOOL_CALL_START, EventType.TOOL_CALL_ARGS, EventType.TOOL_CALL_END, EventType.RAW)
+            )
+        if event.type == EventType.TEXT_MESSAGE_START:
+            message_id = event.message_id
+        elif event.type == EventType.TEXT_MESSAGE_END:
+            test.assertEqual(event.message_id, message_id)
+            message_id = None
+        elif event.type == EventType.TOOL_CALL_START:
+            test.assertNotIn(event.tool_call_id, tool_call_ids)
+            tool_call_ids.add(event.tool_call_id)
+        elif event.type == EventType.TOOL_CALL_ARGS:
+            test.assertIn(event.tool_call_id, tool_call_ids)
+        elif event.type == EventType.TOOL_CALL_END:
+            tool_call_ids.remove(event.tool_call_id)
+    test.assertEqual(tool_call_ids, set())
+
+
+def run(emitter, events):
+    """Process events and return the output events"""
+    output = []
+    for event in events:
+        output.extend(emitter.process(event))
+    return output
+
+
+class TestPredictiveStateEmitter(unittest.TestCase):
+    """Test suite for PredictiveStateEmitter"""
+
+    def test_string_argument_becomes_state_deltas(self):
+        """Test that a streamed document argument becomes STATE_DELTA events next to the tool call"""
+        emitter = PredictiveStateEmitter(string_flush_size=0, string_growth=0)
+        events = [CustomEvent(type=EventType.CUSTOM, name="PredictState", value=PREDICT_DOCUMENT)]
+        events += tool_call_events("call_1", "write_document", ['{"document":"', "Once ", "upon ", "a time", '"}'])
+
+        output = run(emitter, events)
+        types = [event.type for event in output]
+
+        # The PredictState event is consumed and the tool call is forwarded when it ends
+        self.assertEqual(types, [EventType.STATE_DELTA] * 4 + [
+            EventType.TOOL_CALL_START,
+            EventType.TOOL_CALL_ARGS,
+            EventType.TOOL_CALL_END,
+        ])
+        self.assertEqual(output[-2].delta, '{"document":"Once upon a time"}')
+        self.assertEqual([output[-3], output[-1]], [events[1], events[-1]])
+        assert_client_order(self, output)
+
+        state = {"document": "old"}
+        documents = []
+        for event in output:
+            if event.type == EventType.STATE_DELTA:
+                apply_patch(state, event.delta)
+                documents.append(state["document"])
+        self.assertEqual(documents, ["Once ", "Once upon ", "Once upon a time", "Once upon a time"])
+
+    def test_long_strings_are_sent_in_linear_size(self):
+        """Test that a long streaming string is re-sent less often as it grows"""
+        emitter = PredictiveStateEmitter(PREDICT_DOCUMENT, forward_tool_calls=False)
+        document = "word " * 20000
+        deltas = ['{"document":"'] + [document[i:i + 10] for i in range(0, len(document), 10)] + ['"}']
+        output = run(emitter, tool_call_events("call_1", "write_document", deltas))
+
+        sent = sum(len(operation["value"]) for event in output for operation in event.delta)
+        self.assertLess(sent, 6 * len(document))
+        self.assertEqual(apply_patch({}, [op for event in output for op in event.delta]), {"document": document})
+
+    def test_structured_argument_uses_add_operations(self):
+        """Test that arrays are filled element by element"""
+        emitter = PredictiveStateEmitter(
+            [{"state_key": "steps", "tool": "generate_task_steps", "tool_argument": "steps"}],
+            forward_tool_calls=False
+        )
+        steps = [{"description": f"Step {i + 1}", "status": "enabled"} for i in range(3)]
+        deltas = ['{"steps":['] + [json.dumps(step) + ("," if i != 2 else "") for i, step in enumerate(steps)] + ["]}"]
+        output = run(emitter, tool_call_events("call_1", "generate_task_steps", deltas))
+
+        self.assertTrue(all(event.type == EventType.STATE_DELTA for event in output))
+        state = {}
+        for event in output:
+            apply_patch(state, event.delta)
+            for operation in event.delta:
+                self.assertIn(operation["op"], ("add", "replace"))
+        self.assertEqual(state, {"steps": steps})
+
+    def test_whole_arguments_without_tool_argument(self):
+        """Test predicting a state key from the whole tool arguments"""
+        emitter = PredictiveStateEmitter([{"state_key": "recipe", "tool": "generate_recipe", "tool_argument": ""}])
+        recipe = {"title": "Soup", "servings": 2, "vegan": True, "steps": ["Boil", "Serve"]}
+        text = json.dumps(recipe)
+        output = run(emitter, tool_call_events("call_1", "generate_recipe", [text[i:i + 3] for i in range(0, len(text), 3)]))
+
+        state = {}
+        for event in output:
+            if event.type == EventType.STATE_DELTA:
+                apply_patch(state, event.delta)
+        self.assertEqual(state, {"recipe": recipe})
+
+    def test_string_flush_size(self):
+        """Test that streaming strings are only re-sent after enough text"""
+        emitter = PredictiveStateEmitter(PREDICT_DOCUMENT, string_flush_size=10)
+        deltas = ['{"document":"'] + ["abc"] * 6 + ['"}']
+        output = run(emitter, tool_call_events("call_1", "write_document", deltas))
+        deltas_sent = [event for event in output if event.type == EventType.STATE_DELTA]
+        # 18 characters arrive in chunks of 3: one flush at 12 and one on completion
+        self.assertEqual(len(deltas_sent), 2)
+        self.assertEqual(deltas_sent[-1].delta, [{"op": "replace", "path": "/document", "value": "abc" * 6}])
+
+    def test_interleaved_events_keep_the_client_order(self):
+        """Test that state deltas never appear inside an open tool call, whatever streams around them"""
+        emitter = PredictiveStateEmitter(PREDICT_DOCUMENT, string_flush_size=0, string_growth=0)
+        predicted = tool_call_events("call_1", "write_document", ['{"document":"', "a", "b", '"}'])
+        other = tool_call_events("call_2", "search", ['{"q":', '"x"}'])
+        events = [predicted[0], other[0], predicted[1], other[1], predicted[2], other[2]]
+        events += [predicted[3], other[3], predicted[4], predicted[5]]
+
+        output = run(emitter, events)
+        assert_client_order(self, output)
+        self.assertEqual([event for event in output if event.type != EventType.STATE_DELTA][:4], other)
+        self.assertEqual(output[-1], predicted[-1])
+        deltas = [event.delta for event in output if event.type == EventType.STATE_DELTA]
+        self.assertEqual(apply_patch({}, [op for delta in deltas for op in delta]), {"document": "ab"})
+
+    def test_other_events_pass_through(self):
+        """Test that unrelated events and tool calls are forwarded unchanged"""
+        emitter = PredictiveStateEmitter(PREDICT_DOCUMENT)
+        events = [TextMessageStartEvent(type=EventType.TEXT_MESSAGE_START, message_id="m", role="assistant")]
+        events += tool_call_events("call_2", "confirm_changes", ["{}"])
+        self.assertEqual(run(emitter, events), events)
+
+    def test_explicit_configuration_ignores_agent_configuration(self):
+        """Test that an explicit configuration is not replaced by a PredictState event"""
+        emitter = PredictiveStateEmitter(PREDICT_DOCUMENT)
+        event = CustomEvent(
+            type=EventType.CUSTOM,
+            name="PredictState",
+            value=[{"state_key": "other", "tool": "other_tool", "tool_argument": "x"}]
+        )
+        self.assertEqual(emitter.process(event), [])
+        self.assertEqual(emitter.predict_state, PREDICT_DOCUMENT)
+
+    def test_stream(self):
+        """Test applying the emitter to an async stream"""
+        async def events():
+            for event in tool_call_events("call_1", "write_document", ['{"document":"hi"}']):
+                yield event
+
+        async def collect():
+            return [event async for event in PredictiveStateEmitter(PREDICT_DOCUMENT).stream(events())]
+
+        output = asyncio.run(collect())
+        self.assertEqual(output[0].delta, [{"op": "add", "path": "/document", "value": "hi"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+import asyncio
+import os
+import tempfile
+
+from ag_ui.core import (
+    EventType,
+    RunStartedEvent,
+    RunFinishedEvent,
+    TextMessageContentEvent,
+    StateSnapshotEvent,
+)
+from ag_ui.encoder import EventEncoder, Instrumentation
+from ag_ui.eventlog import EventLog, EventLogWriter, JSONLinesRecording, open_recording, replay
+
+
+def run_events():
+    return [
+        RunStartedEvent(type=EventType.RUN_STARTED, thread_id="t1", run_id="r1", timestamp=1000),
+        StateSnapshotEvent(type=EventType.STATE_SNAPSHOT, snapshot={"timestamp": 5}),
+        TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id="m1", delta="Hi", timestamp=1500),
+        RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id="t1", run_id="r1", timestamp=3000),
+    ]
+
+
+def json_lines(events):
+    return "".join(
+        event.model_dump_json(by_alias=True, exclude_none=True) + "\n" for event in events
+    ).encode("utf-8")
+
+
+def event_log(events):
+    writer = EventLogWriter()
+    writer.extend(events)
+    return writer.to_bytes()
+
+
+class FakeTime:
+    """A clock that advances when slept on"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def collect(recording, **kwargs):
+    async def run():
+        return [data async for data in replay(recording, **kwargs)]
+    return asyncio.run(run())
+
+
+class TestReplay(unittest.TestCase):
+    """Test suite for replaying recorded runs"""
+
+    def expected(self, events):
+        encoder = EventEncoder()
+        return [encoder.encode(event).encode("utf-8") for event in events]
+
+    def test_json_lines_passthrough(self):
+        """Test that JSON lines are sent as they are recorded"""
+        events = run_events()
+        recording = JSONLinesRecording(json_lines(events) + b"\n\n")
+        self.assertEqual(collect(recording, speed=None), self.expected(events))
+
+    def test_json_lines_without_passthrough(self):
+        """Test that JSON lines can be parsed and encoded by the encoder"""
+        events = run_events()
+        instrumentation = Instrumentation()
+        instrumentation.on_encode = lambda sample: samples.append(sample)
+        samples = []
+        encoder = EventEncoder(instrumentation=instrumentation)
+        recording = JSONLinesRecording(json_lines(events))
+        self.assertEqual(
+            collect(recording, encoder=encoder, speed=None, passthrough=False),
+            self.expected(events)
+        )
+        self.assertEqual(len(samples), len(events))
+
+    def test_event_log(self):
+        """Test replaying an event log"""
+        events = run_events()
+        self.assertEqual(collect(EventLog(event_log(events)), speed=None), self.expected(events))
+
+    def test_pacing(self):
+        """Test that events are sent at the recorded pace, scaled by the speed"""
+        for recording in (JSONLinesRecording(json_lines(run_events())), EventLog(event_log(run_events()))):
+            fake = FakeTime()
+            collect(recording, speed=2.0, sleep=fake.sleep, clock=fake.clock)
+            # The nested timestamp of the snapshot is not taken for the event's
+            self.assertEqual(fake.sleeps, [0.25, 0.75])
+
+    def test_pacing_with_other_field_order(self):
+        """Test that timestamps are found in lines that were not encoded by the SDK"""
+        lines = (
+            b'{"threadId":"t1","runId":"r1","type":"RUN_STARTED","timestamp":1000}\n'
+            b'{"type":"STATE_SNAPSHOT","snapshot":{"timestamp":5000}}\n'
+            b'{"type":"RUN_FINISHED","threadId":"t1","runId":"r1","timestamp":2000}\n'
+        )
+        fake = FakeTime()
+        collect(JSONLinesRecording(lines), sleep=fake.sleep, clock=fake.clock)
+        self.assertEqual(fake.sleeps, [1.0])
+
+    def test_open_recording(self):
+        """Test that recordings are memory-mapped in the format they were written in"""
+        events = run_events()
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "run.aguilog")
+            lines_path = os.path.join(directory, "run.jsonl")
+            empty_path = os.path.join(directory, "empty.jsonl")
+            with open(log_path, "wb") as file:
+                file.write(event_log(events))
+            with open(lines_path, "wb") as file:
+                file.write(json_lines(events))
+            open(empty_path, "wb").close()
+
+            with open_recording(log_path) as recording:
+                self.assertIsInstance(recording, EventLog)
+                self.assertEqual(collect(recording, speed=None), self.expected(events))
+            with open_recording(lines_path) as recording:
+                self.assertIsInstance(recording, JSONLinesRecording)
+                self.assertEqual([event.to_model() for event in recording], events)
+            with open_recording(empty_path) as recording:
+                self.assertEqual(collect(recording), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import asyncio
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from pydantic import ValidationError
+
+from ag_ui.core import EventType, FastEvent, StateSnapshotEvent
+from ag_ui.encoder import EventEncoder, OffloadPolicy, SnapshotCache, freeze_state
+
+
+def snapshot(state, **fields):
+    return StateSnapshotEvent(type=EventType.STATE_SNAPSHOT, snapshot=state, **fields)
+
+
+class TestSnapshotCache(unittest.TestCase):
+    """Test suite for the cache of encoded state snapshots"""
+
+    def test_snapshot_encoded_once(self):
+        """Test that a frozen state sent again is not encoded again, by any encoder"""
+        state = freeze_state({"recipe": {"title": "Soup", "steps": ["Boil", "Serve"]}})
+        cache = SnapshotCache()
+        first = EventEncoder(snapshot_cache=cache).encode(snapshot(state))
+        self.assertEqual(first, EventEncoder().encode(snapshot({"recipe": {"title": "Soup", "steps": ["Boil", "Serve"]}})))
+        self.assertIs(EventEncoder(snapshot_cache=cache).encode(snapshot(state)), first)
+        self.assertIs(EventEncoder(snapshot_cache=cache).encode(FastEvent.from_model(snapshot(state))), first)
+        self.assertEqual(len(cache), 1)
+
+    def test_frozen_states_are_copies(self):
+        """Test that a frozen state is not changed by changes to the original state"""
+        original = {"recipe": {"title": "Soup"}, "tags": [{"name": "hot"}]}
+        state = freeze_state(original)
+        original["recipe"]["title"] = "Stew"
+        original["tags"].append({"name": "new"})
+        self.assertEqual(state.root, {"recipe": {"title": "Soup"}, "tags": [{"name": "hot"}]})
+        with self.assertRaises(ValidationError):
+            state.root = {}
+        self.assertEqual(pickle.loads(pickle.dumps(state)), state)
+
+    def test_mutable_states_not_cached(self):
+        """Test that states that can still be modified are encoded every time"""
+        state = {"count": 1}
+        cache = SnapshotCache()
+        encoder = EventEncoder(snapshot_cache=cache)
+        encoder.encode(snapshot(state))
+        state["count"] = 2
+        self.assertIn('"count":2', encoder.encode(snapshot(state)))
+        self.assertEqual(len(cache), 0)
+
+    def test_equal_states_are_distinct(self):
+        """Test that frozen states are recognized by identity, not by content"""
+        cache = SnapshotCache()
+        encoder = EventEncoder(snapshot_cache=cache)
+        encoder.encode(snapshot(freeze_state({"count": 1})))
+        self.assertIn('"count":2', encoder.encode(snapshot(freeze_state({"count": 2}))))
+        self.assertEqual(len(cache), 2)
+
+    def test_events_with_other_fields_not_cached(self):
+        """Test that snapshots with a timestamp or raw event are encoded as usual"""
+        state = freeze_state({"count": 1})
+        cache = SnapshotCache()
+        encoder = EventEncoder(snapshot_cache=cache)
+        encoder.encode(snapshot(state))
+        self.assertIn('"timestamp":5', encoder.encode(snapshot(state, timestamp=5)))
+        self.assertIn('"rawEvent"', encoder.encode(snapshot(state, raw_event={"source": "x"})))
+        self.assertEqual(len(cache), 1)
+
+    def test_eviction(self):
+        """Test that the least recently used snapshots are evicted by count and by encoded size"""
+        states = [freeze_state({"index": index}) for index in range(3)]
+        cache = SnapshotCache(max_entries=2)
+        encoder = EventEncoder(snapshot_cache=cache)
+        encoder.encode(snapshot(states[0]))
+        encoder.encode(snapshot(states[1]))
+        encoder.encode(snapshot(states[0]))
+        encoder.encode(snapshot(states[2]))
+        self.assertIsNotNone(cache.get(snapshot(states[0])))
+        self.assertIsNone(cache.get(snapshot(states[1])))
+
+        # Sizes are the encoded bytes, whatever the depth of the state
+        large = freeze_state({"items": [{"text": "é" * 10}] * 50})
+        encoded = EventEncoder().encode(snapshot(large))
+        cache = SnapshotCache(max_bytes=len(encoded.encode("utf-8")))
+        encoder = EventEncoder(snapshot_cache=cache)
+        encoder.encode(snapshot(large))
+        self.assertEqual(cache.size, cache.max_bytes)
+        encoder.encode(snapshot(freeze_state({"items": [{"text": "é" * 10}] * 50})))
+        self.assertEqual(len(cache), 1)
+        encoder.encode(snapshot(freeze_state({"items": [{"text": "é" * 10}] * 51})))
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.size, cache.max_bytes)
+
+    def test_offloaded_snapshots_are_cached(self):
+        """Test that snapshots encoded in an executor are cached and not offloaded again"""
+        state = freeze_state({"text": "x" * 20000})
+        cache = SnapshotCache()
+        encoder = EventEncoder(offload=OffloadPolicy(threshold=10000), snapshot_cache=cache)
+
+        async def run():
+            return [await encoder.encode_async(snapshot(state)) for _ in range(2)]
+
+        first, second = asyncio.run(run())
+        self.assertIs(second, first)
+        self.assertEqual(len(cache), 1)
+
+    def test_process_pool(self):
+        """Test that frozen states can be encoded in another process"""
+        state = freeze_state({"items": [{"text": "x" * 100} for _ in range(200)]})
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            encoder = EventEncoder(offload=OffloadPolicy(threshold=10000, executor=executor))
+            self.assertEqual(asyncio.run(encoder.encode_async(snapshot(state))), EventEncoder().encode(snapshot(state)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from ag_ui.core import AssistantMessage, RunAgentInput, UserMessage
+from ag_ui.threads import SQLiteThreadBackend, ThreadStore, UnknownThreadVersionError
+
+
+def user(index):
+    return UserMessage(id=f"user-{index}", role="user", content=f"Message {index}")
+
+
+def assistant(index):
+    return AssistantMessage(id=f"assistant-{index}", role="assistant", content=f"Reply {index}")
+
+
+def run_input(messages, base_version=None, thread_id="thread"):
+    return RunAgentInput(
+        thread_id=thread_id,
+        run_id="run",
+        state={},
+        messages=messages,
+        tools=[],
+        context=[],
+        forwarded_props={},
+        base_version=base_version
+    )
+
+
+class TestThreadStore(unittest.TestCase):
+    """Test suite for the thread store"""
+
+    def test_full_history_is_not_stored(self):
+        """Test that a run without base version is passed through and not stored"""
+        store = ThreadStore()
+        input_data = run_input([user(1), assistant(1)])
+        self.assertIs(store.resolve(input_data), input_data)
+        self.assertEqual(input_data.messages, [user(1), assistant(1)])
+        self.assertIsNone(store.get("thread"))
+
+    def test_new_messages_are_appended(self):
+        """Test that a run with a base version only sends the new messages"""
+        store = ThreadStore()
+        store.resolve(run_input([user(1)], base_version=0))
+        resolved = store.resolve(run_input([assistant(1), user(2)], base_version=1))
+        self.assertEqual(resolved.messages, [user(1), assistant(1), user(2)])
+        self.assertEqual(store.get("thread"), resolved.messages)
+
+    def test_branching_from_an_earlier_version(self):
+        """Test that a base version older than the stored history starts a new branch"""
+        store = ThreadStore()
+        store.resolve(run_input([user(1), assistant(1), user(2)], base_version=0))
+        resolved = store.resolve(run_input([user(3)], base_version=2))
+        self.assertEqual(resolved.messages, [user(1), assistant(1), user(3)])
+        store.resolve(run_input([user(4)], base_version=0))
+        self.assertEqual(store.get("thread"), [user(4)])
+
+    def test_unknown_versions(self):
+        """Test that unknown threads and versions are rejected"""
+        store = ThreadStore()
+        with self.assertRaises(UnknownThreadVersionError):
+            store.resolve(run_input([user(1)], base_version=1))
+        store.resolve(run_input([user(1)], base_version=0))
+        with self.assertRaises(UnknownThreadVersionError):
+            store.resolve(run_input([user(2)], base_version=2))
+
+    def test_runs_do_not_change_the_store(self):
+        """Test that a run appending to its messages leaves the stored history alone"""
+        store = ThreadStore()
+        resolved = store.resolve(run_input([user(1)], base_version=0))
+        resolved.messages.append(assistant(1))
+        self.assertEqual(store.get("thread"), [user(1)])
+
+    def test_resolve_async(self):
+        """Test that runs resolved on the event loop load and store their history"""
+        backend = SQLiteThreadBackend()
+
+        async def run():
+            await ThreadStore(backend=backend).resolve_async(run_input([user(1)], base_version=0))
+            store = ThreadStore(backend=backend)
+            return await store.resolve_async(run_input([user(2)], base_version=1))
+
+        self.assertEqual(asyncio.run(run()).messages, [user(1), user(2)])
+        self.assertEqual(len(backend.load("thread")), 2)
+        backend.close()
+
+    def test_eviction_and_backend(self):
+        """Test that evicted threads are reloaded from the backend"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "threads.db")
+            backend = SQLiteThreadBackend(path)
+            store = ThreadStore(max_threads=1, backend=backend)
+            store.resolve(run_input([user(1)], base_version=0, thread_id="a"))
+            store.resolve(run_input([assistant(1), user(2)], base_version=1, thread_id="a"))
+            store.resolve(run_input([user(3)], base_version=0, thread_id="b"))
+            self.assertEqual(len(store), 1)
+            self.assertEqual(store.get("a"), [user(1), assistant(1), user(2)])
+            backend.close()
+
+            # Another process with the same database
+            backend = SQLiteThreadBackend(path)
+            resolved = ThreadStore(backend=backend).resolve(run_input([user(4)], base_version=1, thread_id="a"))
+            self.assertEqual(resolved.messages, [user(1), user(4)])
+            self.assertEqual(backend.load("a"), [
+                {"id": "user-1", "role": "user", "content": "Message 1"},
+                {"id": "user-4", "role": "user", "content": "Message 4"},
+            ])
+            backend.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
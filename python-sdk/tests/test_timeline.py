@@ -0,0 +1,150 @@
+import unittest
+import asyncio
+import json
+
+from ag_ui.core.events import (
+    EventType,
+    RunStartedEvent,
+    RunFinishedEvent,
+    StepStartedEvent,
+    StepFinishedEvent,
+    TextMessageContentEvent
+)
+from ag_ui.encoder import EventEncoder, TimelineRecorder, StepSpan
+
+
+class FakeClock:
+    """A clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def run_stream(recorder, events, clock, agent_time=1.0, flush_time=0.5):
+    """Streams the events through the recorder, advancing the clock for the agent and the consumer"""
+    async def agent():
+        for event in events:
+            clock.now += agent_time
+            yield event
+
+    async def consume():
+        encoded = []
+        async for data in recorder.stream(agent()):
+            encoded.append(data)
+            clock.now += flush_time
+        return encoded
+
+    return asyncio.run(consume())
+
+
+def run_events():
+    return [
+        RunStartedEvent(type=EventType.RUN_STARTED, thread_id="t1", run_id="r1"),
+        StepStartedEvent(type=EventType.STEP_STARTED, step_name="plan"),
+        StepStartedEvent(type=EventType.STEP_STARTED, step_name="search"),
+        TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id="m1", delta="Hi"),
+        StepFinishedEvent(type=EventType.STEP_FINISHED, step_name="plan"),
+        StepFinishedEvent(type=EventType.STEP_FINISHED, step_name="search"),
+        RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id="t1", run_id="r1"),
+    ]
+
+
+class TestTimelineRecorder(unittest.TestCase):
+    """Test suite for the TimelineRecorder"""
+
+    def test_stream_encodes_events(self):
+        """Test that the recorded stream yields the encoded events"""
+        clock = FakeClock()
+        events = run_events()
+        encoded = run_stream(TimelineRecorder(clock=clock), events, clock)
+        encoder = EventEncoder()
+        self.assertEqual(encoded, [encoder.encode(event) for event in events])
+
+    def test_fills_missing_timestamps(self):
+        """Test that events without a timestamp get one and others keep theirs"""
+        clock = FakeClock()
+        events = run_events()
+        events[0].timestamp = 1234
+        run_stream(TimelineRecorder(clock=clock), events, clock)
+        self.assertEqual(events[0].timestamp, 1234)
+        self.assertTrue(all(isinstance(event.timestamp, int) for event in events))
+
+    def test_records_entries_and_steps(self):
+        """Test the recorded timestamps of the events and the step spans"""
+        clock = FakeClock()
+        recorder = TimelineRecorder(clock=clock)
+        run_stream(recorder, run_events(), clock)
+
+        self.assertEqual(len(recorder.entries), 7)
+        first = recorder.entries[0]
+        self.assertEqual((first.generated, first.encoded, first.flushed), (1.0, 1.0, 1.5))
+        self.assertEqual(recorder.entries[-1].flushed, 10.5)
+        self.assertEqual(recorder.finished, 10.5)
+        # The overlapping steps are placed on different lanes
+        self.assertEqual(recorder.steps, [
+            StepSpan("plan", 2.5, 7.0, 0),
+            StepSpan("search", 4.0, 8.5, 1)
+        ])
+
+    def test_unfinished_steps_end_with_the_stream(self):
+        """Test that steps left open end when the stream ends"""
+        clock = FakeClock()
+        recorder = TimelineRecorder(clock=clock)
+        run_stream(recorder, run_events()[:3], clock)
+        self.assertEqual([(step.name, step.end) for step in recorder.steps], [("plan", 4.5), ("search", 4.5)])
+
+    def test_chrome_trace(self):
+        """Test that the Chrome trace has the run, the slices of every event and the steps"""
+        clock = FakeClock()
+        recorder = TimelineRecorder(clock=clock)
+        run_stream(recorder, run_events(), clock)
+        trace = json.loads(json.dumps(recorder.to_chrome_trace()))
+
+        slices = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        run = slices[0]
+        self.assertEqual((run["name"], run["ts"], run["dur"]), ("run", 0.0, 10.5e6))
+        stream = [event for event in slices if event["tid"] == 0][1:]
+        self.assertEqual(
+            [event["name"] for event in stream[:3]],
+            ["agent", "encode RUN_STARTED", "flush"]
+        )
+        self.assertEqual(stream[0]["dur"], 1e6)
+        self.assertEqual(stream[2]["dur"], 0.5e6)
+        steps = [(event["name"], event["tid"]) for event in slices if event["cat"] == "step"]
+        self.assertEqual(steps, [("plan", 1), ("search", 2)])
+
+    def test_speedscope(self):
+        """Test that the speedscope profiles open and close their frames in order"""
+        clock = FakeClock()
+        recorder = TimelineRecorder(clock=clock)
+        run_stream(recorder, run_events(), clock)
+        profile = recorder.to_speedscope(name="chat")
+
+        frames = [frame["name"] for frame in profile["shared"]["frames"]]
+        self.assertEqual(len(profile["profiles"]), 3)
+        for evented in profile["profiles"]:
+            stack = []
+            at = 0.0
+            for event in evented["events"]:
+                self.assertGreaterEqual(event["at"], at)
+                at = event["at"]
+                if event["type"] == "O":
+                    stack.append(event["frame"])
+                else:
+                    self.assertEqual(stack.pop(), event["frame"])
+            self.assertEqual(stack, [])
+        stream = profile["profiles"][0]
+        self.assertEqual(frames[stream["events"][0]["frame"]], "chat")
+        self.assertEqual(stream["endValue"], 10.5e6)
+
+    def test_export_requires_a_stream(self):
+        """Test that exporting before recording fails"""
+        with self.assertRaises(RuntimeError):
+            TimelineRecorder().to_chrome_trace()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import json
+import unittest
+
+from pydantic import ValidationError
+
+from ag_ui.core import RunAgentInput
+from ag_ui.tools import ToolCache, UnknownToolsRefError, tools_ref
+
+TOOLS = [
+    {
+        "name": "weather",
+        "description": "Gets the weather",
+        "parameters": {"type": "object", "properties": {"city": {"type": "string", "enum": ["a"]}}}
+    },
+    {"name": "time", "description": "Gets the time ] \"context\": [", "parameters": {}},
+]
+
+
+def make_body(**overrides):
+    body = {
+        "threadId": "thread",
+        "runId": "run",
+        "state": {},
+        "messages": [],
+        "tools": TOOLS,
+        "context": [],
+        "forwardedProps": {},
+    }
+    body.update(overrides)
+    return json.dumps(body)
+
+
+class TestToolCache(unittest.TestCase):
+    """Test suite for the tool cache"""
+
+    def setUp(self):
+        self.cache = ToolCache()
+
+    def test_parse_matches_validation(self):
+        """Test that cached and uncached inputs equal a plain validation"""
+        bodies = [
+            make_body(messages=[{"id": "1", "role": "user", "content": "Hi"}]),
+            make_body(state={"tools": [1]}),
+        ]
+        for body in bodies:
+            expected = RunAgentInput.model_validate_json(body)
+            first = self.cache.parse_run_agent_input(body)
+            second = self.cache.parse_run_agent_input(body)
+            for parsed in (first, second):
+                self.assertEqual(parsed.model_dump(exclude={"tools_ref"}), expected.model_dump(exclude={"tools_ref"}))
+                self.assertEqual(parsed.tools_ref, tools_ref(TOOLS))
+            self.assertIs(second.tools[0], first.tools[0])
+
+    def test_equal_tools_share_an_entry(self):
+        """Test that tool lists that only differ in layout share one entry"""
+        self.cache.parse_run_agent_input(make_body())
+        compact = json.dumps(json.loads(make_body()), separators=(",", ":"))
+        reordered = json.dumps(dict(reversed(list(json.loads(make_body()).items()))))
+        first = self.cache.parse_run_agent_input(compact)
+        second = self.cache.parse_run_agent_input(reordered)
+        self.assertEqual(len(self.cache), 1)
+        self.assertIs(first.tools[0], second.tools[0])
+
+    def test_tools_by_reference(self):
+        """Test that cached tools can be sent by reference"""
+        self.cache.parse_run_agent_input(make_body())
+        parsed = self.cache.parse_run_agent_input(make_body(tools=[], toolsRef=tools_ref(TOOLS)))
+        self.assertEqual([tool.name for tool in parsed.tools], ["weather", "time"])
+        with self.assertRaises(UnknownToolsRefError):
+            self.cache.parse_run_agent_input(make_body(tools=[], toolsRef="unknown"))
+
+    def test_other_tools_are_not_taken_for_the_cached_ones(self):
+        """Test that a tools key elsewhere in the body is never taken for the tools"""
+        self.cache.parse_run_agent_input(make_body())
+        parsed = self.cache.parse_run_agent_input(
+            make_body(state={"tools": TOOLS}, tools=[TOOLS[1]])
+        )
+        self.assertEqual([tool.name for tool in parsed.tools], ["time"])
+        self.assertEqual(parsed.state, {"tools": TOOLS})
+
+    def test_invalid_input(self):
+        """Test that invalid inputs raise validation errors, cached tools or not"""
+        self.cache.parse_run_agent_input(make_body())
+        for body in (make_body(runId=1), make_body(tools=[{"name": "x"}]), "[]"):
+            with self.assertRaises(ValidationError):
+                self.cache.parse_run_agent_input(body)
+
+    def test_derived_formats(self):
+        """Test that derived formats are built once per tool list"""
+        parsed = self.cache.parse_run_agent_input(make_body())
+        entry = self.cache.get(parsed.tools_ref)
+        calls = []
+        factory = lambda tools: calls.append(tools) or len(tools)
+        self.assertEqual(entry.derive("count", factory), 2)
+        self.assertEqual(entry.derive("count", factory), 2)
+        self.assertEqual(len(calls), 1)
+
+    def test_eviction(self):
+        """Test that the least recently used tool lists are evicted"""
+        cache = ToolCache(max_size=1)
+        first = cache.parse_run_agent_input(make_body())
+        cache.parse_run_agent_input(make_body(tools=TOOLS[:1]))
+        self.assertIsNone(cache.get(first.tools_ref))
+        self.assertEqual(len(cache._refs), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+import asyncio
+import json
+import unittest
+
+from ag_ui.core import EventType, Tool, ToolCallArgsEvent, ToolCallEndEvent, ToolCallStartEvent
+from ag_ui.tools import ToolArgumentsError, ToolCallValidator, compile_schema, schema_hash
+
+WEATHER = {
+    "type": "object",
+    "properties": {
+        "city": {"type": "string", "enum": ["Paris", "Berlin"]},
+        "days": {"type": "integer", "minimum": 1, "maximum": 7},
+        "units": {"type": "string", "maxLength": 10},
+        "hours": {"type": "array", "items": {"type": "integer"}, "maxItems": 3},
+    },
+    "required": ["city"],
+    "additionalProperties": False,
+}
+
+
+def stream(schema, chunks):
+    validator = compile_schema(schema).stream()
+    for chunk in chunks:
+        validator.feed(chunk)
+    return validator.finish()
+
+
+def chunked(text, size=1):
+    return [text[index:index + size] for index in range(0, len(text), size)]
+
+
+class TestCompiledSchema(unittest.TestCase):
+    """Test suite for the validation of complete arguments"""
+
+    def test_valid_arguments(self):
+        """Test that valid arguments are returned decoded"""
+        arguments = '{"city": "Paris", "days": 3, "hours": [1, 2]}'
+        self.assertEqual(compile_schema(WEATHER).validate_json(arguments), json.loads(arguments))
+
+    def test_invalid_arguments(self):
+        """Test that each kind of invalid argument is reported with its location"""
+        cases = [
+            ('{"days": 3}', [], "missing required property 'city'"),
+            ('{"city": "Rome"}', ["city"], "is not one of"),
+            ('{"city": "Paris", "days": 8}', ["days"], "greater than 7"),
+            ('{"city": "Paris", "days": 1.5}', ["days"], "expected integer"),
+            ('{"city": "Paris", "hours": [1, "2"]}', ["hours", 1], "expected integer"),
+            ('{"city": "Paris", "extra": 1}', [], "unexpected property 'extra'"),
+            ('{"city": "Paris"', [], "invalid JSON"),
+        ]
+        for arguments, path, message in cases:
+            with self.assertRaises(ToolArgumentsError) as context:
+                compile_schema(WEATHER).validate_json(arguments)
+            self.assertEqual(context.exception.path, path, arguments)
+            self.assertIn(message, str(context.exception))
+
+    def test_references_and_combinations(self):
+        """Test local references and combined schemas"""
+        schema = {
+            "$defs": {"point": {"type": "array", "prefixItems": [{"type": "number"}] * 2, "items": False}},
+            "type": "object",
+            "properties": {
+                "start": {"$ref": "#/$defs/point"},
+                "value": {"anyOf": [{"type": "string"}, {"type": "integer", "minimum": 0}]},
+            },
+        }
+        compiled = compile_schema(schema)
+        compiled.validate({"start": [1, 2.5], "value": "x"})
+        compiled.validate({"value": 3})
+        for invalid in ({"start": [1, 2, 3]}, {"start": [1, "2"]}, {"value": -1}):
+            with self.assertRaises(ToolArgumentsError):
+                compiled.validate(invalid)
+
+    def test_integer_and_number_equality(self):
+        """Test that integral numbers are integers and booleans are not numbers"""
+        compiled = compile_schema({"type": "integer", "enum": [1, 2]})
+        compiled.validate(1.0)
+        with self.assertRaises(ToolArgumentsError):
+            compiled.validate(True)
+
+    def test_cache(self):
+        """Test that identical schemas are compiled once, whatever the order of their keys"""
+        reordered = dict(reversed(list(WEATHER.items())))
+        self.assertEqual(schema_hash(WEATHER), schema_hash(reordered))
+        self.assertIs(compile_schema(WEATHER), compile_schema(reordered))
+
+
+class TestStreamingValidator(unittest.TestCase):
+    """Test suite for the validation of streaming arguments"""
+
+    def test_valid_arguments_in_any_chunks(self):
+        """Test that valid arguments are accepted however they are split"""
+        arguments = '{"city": "Berlin", "days": 7, "units": "metric", "hours": [0, 12, 23]}'
+        for size in (1, 2, 5, len(arguments)):
+            self.assertEqual(stream(WEATHER, chunked(arguments, size)), json.loads(arguments))
+
+    def test_errors_are_found_early(self):
+        """Test that invalid arguments are rejected as soon as they can be told apart"""
+        cases = [
+            ('{"city": "Pe', "is not the start of"),
+            ('{"unknown"', "unexpected property 'unknown'"),
+            ('{"city": "Paris", "extra"', "unexpected property 'extra'"),
+            ('{"city": "Paris", "hours": [1, 2, 3, 4,', "more than 3 items"),
+            ('{"city": "Paris", "units": "abcdefghijk', "longer than 10"),
+            ('{"city": "Paris", "hours": {', "expected array, got object"),
+            ('[', "expected object, got array"),
+        ]
+        for prefix, message in cases:
+            with self.assertRaises(ToolArgumentsError) as context:
+                stream(WEATHER, chunked(prefix) + ["x" * 1000])
+            self.assertIn(message, str(context.exception))
+            self.assertEqual(context.exception.offset, len(prefix))
+
+    def test_invalid_json(self):
+        """Test that malformed JSON is reported as invalid arguments"""
+        with self.assertRaises(ToolArgumentsError):
+            stream(WEATHER, ['{"city" "Paris"}'])
+
+    def test_incomplete_arguments(self):
+        """Test that arguments that end early are rejected"""
+        with self.assertRaises(ToolArgumentsError) as context:
+            stream(WEATHER, ['{"city": "Paris"'])
+        self.assertIn("incomplete JSON", str(context.exception))
+
+    def test_required_checked_when_object_ends(self):
+        """Test that missing properties are reported when their object closes"""
+        with self.assertRaises(ToolArgumentsError) as context:
+            stream(WEATHER, ['{"days": 2', '}', "x" * 100])
+        self.assertEqual(context.exception.offset, len('{"days": 2}'))
+
+
+class TestToolCallValidator(unittest.TestCase):
+    """Test suite for the validation of tool call events"""
+
+    def setUp(self):
+        self.tools = [Tool(name="weather", description="Gets the weather", parameters=WEATHER)]
+
+    def tool_call(self, name, *deltas, tool_call_id="call-1"):
+        yield ToolCallStartEvent(
+            type=EventType.TOOL_CALL_START, tool_call_id=tool_call_id, tool_call_name=name
+        )
+        for delta in deltas:
+            yield ToolCallArgsEvent(type=EventType.TOOL_CALL_ARGS, tool_call_id=tool_call_id, delta=delta)
+        yield ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=tool_call_id)
+
+    def test_valid_tool_call(self):
+        """Test that valid tool calls and unknown tools pass"""
+        validator = ToolCallValidator(self.tools)
+        for event in self.tool_call("weather", '{"city": ', '"Paris"}'):
+            validator.process(event)
+        for event in self.tool_call("other", "not json"):
+            validator.process(event)
+
+    def test_invalid_tool_call(self):
+        """Test that the error names the tool call"""
+        validator = ToolCallValidator(self.tools)
+        with self.assertRaises(ToolArgumentsError) as context:
+            for event in self.tool_call("weather", '{"city": "Rome"}'):
+                validator.process(event)
+        self.assertEqual(context.exception.tool_call_id, "call-1")
+        self.assertEqual(context.exception.tool_name, "weather")
+        self.assertIn("'weather'", str(context.exception))
+
+    def test_unknown_tools(self):
+        """Test that unknown tools can be rejected"""
+        validator = ToolCallValidator(self.tools, allow_unknown_tools=False)
+        with self.assertRaises(ToolArgumentsError):
+            validator.process(next(self.tool_call("other")))
+
+    def test_stream_stops_the_agent(self):
+        """Test that the agent's stream is closed when a tool call becomes invalid"""
+        generated = []
+
+        async def agent():
+            for event in self.tool_call("weather", '{"city": "R', 'ome"}'):
+                generated.append(event)
+                yield event
+
+        async def run():
+            async for _ in ToolCallValidator(self.tools).stream(agent()):
+                pass
+
+        with self.assertRaises(ToolArgumentsError):
+            asyncio.run(run())
+        self.assertEqual(len(generated), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -418,6 +418,21 @@ class TestBaseTypes(unittest.TestCase):
         self.assertEqual(len(run_input.context), 0)
         self.assertEqual(run_input.forwarded_props, {})
 
+    def test_base_version_is_not_negative(self):
+        """Test that RunAgentInput rejects a negative base version, like the TypeScript schema"""
+        data = {
+            "threadId": "thread_1",
+            "runId": "run_1",
+            "state": {},
+            "messages": [],
+            "tools": [],
+            "context": [],
+            "forwardedProps": {}
+        }
+        self.assertEqual(RunAgentInput.model_validate({**data, "baseVersion": 0}).base_version, 0)
+        with self.assertRaises(ValidationError):
+            RunAgentInput.model_validate({**data, "baseVersion": -1})
+
     def test_multiple_tool_calls(self):
         """Test assistant message with multiple tool calls"""
         # Create assistant message with multiple tool calls
@@ -10,8 +10,8 @@ from langgraph.graph import StateGraph, END, START
 from langgraph.graph import MessagesState
 from langgraph.types import Command
 from typing_extensions import Literal
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
+from agents.common.models import bind_tools
 
 class AgentState(MessagesState):
     tools: List[Any]
@@ -28,38 +28,32 @@ async def chat_node(state: AgentState, config: RunnableConfig):
     https://www.perplexity.ai/search/react-agents-NcXLQhreS0WDzpVaS4m9Cg
     """
     
-    # 1. Define the model
-    model = ChatOpenAI(model="gpt-4o")
-    
     # Define config for the model
     if config is None:
         config = RunnableConfig(recursion_limit=25)
 
-    # 2. Bind the tools to the model
-    model_with_tools = model.bind_tools(
+    # 1. Get the model with the tools bound to it (shared across runs)
+    model_with_tools = bind_tools(
+        "gpt-4o",
         [
             *state["tools"],
             # your_tool_here
         ],
-
-        # 2.1 Disable parallel tool calls to avoid race conditions,
-        #     enable this for faster performance if you want to manage
-        #     the complexity of running tool calls in parallel.
-        parallel_tool_calls=False,
+        config=config,
     )
 
-    # 3. Define the system message by which the chat model will be run
+    # 2. Define the system message by which the chat model will be run
     system_message = SystemMessage(
         content=f"You are a helpful assistant. ."
     )
 
-    # 4. Run the model to generate a response
+    # 3. Run the model to generate a response
     response = await model_with_tools.ainvoke([
         system_message,
         *state["messages"],
     ], config)
 
-    # 6. We've handled all tool calls, so we can end the graph.
+    # 4. We've handled all tool calls, so we can end the graph.
     return Command(
         goto=END,
         update={
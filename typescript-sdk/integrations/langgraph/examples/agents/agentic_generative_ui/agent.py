@@ -9,12 +9,14 @@ from typing import Dict, List, Any, Optional, Literal
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END, START
 from langgraph.types import Command
-from langchain_core.callbacks.manager import adispatch_custom_event
 from langgraph.graph import MessagesState
 
 # OpenAI imports
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
+from agents.common.models import bind_tools
+from agents.common.state import StateEmitter
+from agents.common.steps import StepExecutor
+from agents.common.tool_calls import get_tool_calls, tool_response
 
 # This tool simulates performing a task on the server.
 # The tool call will be streamed to the frontend as it is being generated.
@@ -87,9 +89,6 @@ async def chat_node(state: AgentState, config: RunnableConfig):
     Always say you actually did the steps, not merely generated them.
     """
 
-    # Define the model
-    model = ChatOpenAI(model="gpt-4o")
-    
     # Define config for the model with emit_intermediate_state to stream tool calls to frontend
     if config is None:
         config = RunnableConfig(recursion_limit=25)
@@ -101,14 +100,14 @@ async def chat_node(state: AgentState, config: RunnableConfig):
         "tool_argument": "steps",
     }]
 
-    # Bind the tools to the model
-    model_with_tools = model.bind_tools(
+    # Bind the tools to the model (the binding is shared across runs)
+    model_with_tools = bind_tools(
+        "gpt-4o",
         [
             *state["tools"],
             PERFORM_TASK_TOOL
         ],
-        # Disable parallel tool calls to avoid race conditions
-        parallel_tool_calls=False,
+        config=config,
     )
 
     # Run the model to generate a response
@@ -119,53 +118,49 @@ async def chat_node(state: AgentState, config: RunnableConfig):
 
     messages = state["messages"] + [response]
 
-    # Extract any tool calls from the response
-    if hasattr(response, "tool_calls") and response.tool_calls and len(response.tool_calls) > 0:
-        tool_call = response.tool_calls[0]
-        
-        # Handle tool_call as a dictionary rather than an object
-        if isinstance(tool_call, dict):
-            tool_call_id = tool_call["id"]
-            tool_call_name = tool_call["name"]
-            tool_call_args = tool_call["args"]
-        else:
-            # Handle as an object (backward compatibility)
-            tool_call_id = tool_call.id
-            tool_call_name = tool_call.name
-            tool_call_args = tool_call.args
-
-        if tool_call_name == "generate_task_steps_generative_ui":
-            steps = [{"description": step["description"], "status": step["status"]} for step in tool_call_args["steps"]]
-            
-            # Add the tool response to messages
-            tool_response = {
-                "role": "tool",
-                "content": "Steps executed.",
-                "tool_call_id": tool_call_id
-            }
+    # Handle every tool call the model made; steps from all plans run together
+    tool_calls = get_tool_calls(response)
+    plan_calls = [
+        tool_call for tool_call in tool_calls
+        if tool_call.name == "generate_task_steps_generative_ui"
+    ]
+
+    if plan_calls:
+        steps = [
+            {"description": step["description"], "status": step["status"]}
+            for tool_call in plan_calls
+            for step in tool_call.args["steps"]
+        ]
+
+        # Add a tool response for every plan to messages
+        messages = messages + [
+            tool_response(tool_call, "Steps executed.") for tool_call in plan_calls
+        ]
+
+        # Run the independent steps in parallel and stream each completion;
+        # only the changed step is sent after the first emission
+        state["steps"] = steps
+        state_emitter = StateEmitter(state, config)
+
+        async def execute_step(index: int, step: dict):
+            # simulate executing the step
+            await asyncio.sleep(1)
 
-            messages = messages + [tool_response]
+        async def complete_step(index: int, _result):
+            steps[index]["status"] = "completed"
+            await state_emitter.emit(state)
 
-            # Return Command to route to simulate_task_node
-            for i, step in enumerate(steps):
-            # simulate executing the step
-                await asyncio.sleep(1)
-                steps[i]["status"] = "completed"
-                # Update the state with the completed step - using config as first parameter
-                state["steps"] = steps
-                await adispatch_custom_event(
-                    "manually_emit_state",
-                    state,
-                    config=config,
-                )
-            
-            return Command(
-                goto='start_flow',
-                update={
-                    "messages": messages,
-                    "steps": state["steps"]
-                }
-            )
+        await state_emitter.emit(state)
+        await StepExecutor().run(steps, execute_step, complete_step)
+
+        return Command(
+            # Frontend tools called alongside the plan are answered by the client
+            goto="start_flow" if len(plan_calls) == len(tool_calls) else END,
+            update={
+                "messages": messages,
+                "steps": state["steps"]
+            }
+        )
 
     return Command(
         goto=END,
@@ -0,0 +1,155 @@
+"""
+A deterministic stand-in for the chat model, for benchmarks and load tests.
+
+The ScriptedChatModel replays scripted or recorded responses as a token
+stream, at a configurable rate and without network access, so the whole
+graph-to-AG-UI pipeline can be measured locally and repeatably. Agents use
+it when it is passed as the `chat_model` in the configurable section of the
+run config, see `agents.common.models`.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Union
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+# A scripted response: text, or a message with content and tool calls
+ScriptedResponse = Union[str, AIMessage, Dict[str, Any]]
+
+
+def _to_message(response: ScriptedResponse) -> AIMessage:
+    if isinstance(response, AIMessage):
+        return response
+    if isinstance(response, str):
+        return AIMessage(content=response)
+    return AIMessage(
+        content=response.get("content", ""),
+        tool_calls=[
+            {"id": tool_call.get("id"), "name": tool_call["name"], "args": tool_call.get("args", {})}
+            for tool_call in response.get("tool_calls", [])
+        ]
+    )
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    A chat model that replays a script of responses.
+
+    Each call returns the next response of the script, starting over at the
+    end. When streamed, the content and then every tool call's arguments are
+    split into tokens of `token_size` characters; after `first_token_latency`
+    seconds the tokens arrive at `tokens_per_second`, or as fast as possible
+    if that is None. Tool calls without an ID get one derived from the call
+    number, so repeated runs produce identical streams.
+
+    Tools bound to the model are accepted and ignored: the script decides
+    which tools are called.
+    """
+
+    # Scripted responses, see ScriptedResponse; kept as given rather than validated
+    responses: List[Any]
+    tokens_per_second: Optional[float] = None
+    first_token_latency: float = 0.0
+    token_size: int = 4
+
+    _calls: int = PrivateAttr(default=0)
+
+    @classmethod
+    def from_recording(cls, path: str, **kwargs: Any) -> "ScriptedChatModel":
+        """
+        Creates a model that replays a recording: a JSON Lines file with one
+        response per line, each with `content` and optional `tool_calls`
+        made of `name`, `args` and `id`.
+        """
+        with open(path, encoding="utf-8") as file:
+            responses = [json.loads(line) for line in file if line.strip()]
+        return cls(responses=responses, **kwargs)
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-chat-model"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "ScriptedChatModel":
+        return self
+
+    def _next_message(self) -> AIMessage:
+        call = self._calls
+        self._calls += 1
+        message = _to_message(self.responses[call % len(self.responses)])
+        if any(tool_call.get("id") is None for tool_call in message.tool_calls):
+            message = message.model_copy(update={"tool_calls": [
+                {**tool_call, "id": tool_call.get("id") or f"call_{call}_{index}"}
+                for index, tool_call in enumerate(message.tool_calls)
+            ]})
+        return message
+
+    def _chunks(self, message: AIMessage) -> Iterator[AIMessageChunk]:
+        size = self.token_size
+        content = message.content if isinstance(message.content, str) else ""
+        for start in range(0, len(content), size):
+            yield AIMessageChunk(content=content[start:start + size])
+
+        for index, tool_call in enumerate(message.tool_calls):
+            yield AIMessageChunk(content="", tool_call_chunks=[tool_call_chunk(
+                name=tool_call["name"], args="", id=tool_call["id"], index=index
+            )])
+            args = json.dumps(tool_call["args"])
+            for start in range(0, len(args), size):
+                yield AIMessageChunk(content="", tool_call_chunks=[tool_call_chunk(
+                    name=None, args=args[start:start + size], id=None, index=index
+                )])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=self._next_message())])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> Iterator[ChatGenerationChunk]:
+        delay = 1 / self.tokens_per_second if self.tokens_per_second else 0.0
+        if self.first_token_latency:
+            time.sleep(self.first_token_latency)
+        for chunk in self._chunks(self._next_message()):
+            if delay:
+                time.sleep(delay)
+            generation = ChatGenerationChunk(message=chunk)
+            if run_manager is not None:
+                run_manager.on_llm_new_token(chunk.content, chunk=generation)
+            yield generation
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        delay = 1 / self.tokens_per_second if self.tokens_per_second else 0.0
+        if self.first_token_latency:
+            await asyncio.sleep(self.first_token_latency)
+        for chunk in self._chunks(self._next_message()):
+            if delay:
+                await asyncio.sleep(delay)
+            generation = ChatGenerationChunk(message=chunk)
+            if run_manager is not None:
+                await run_manager.on_llm_new_token(chunk.content, chunk=generation)
+            yield generation
@@ -0,0 +1,106 @@
+"""
+Process-wide cache of chat models and their tool bindings.
+
+Creating a ChatOpenAI client and converting the tool schemas on every node
+invocation adds client construction and TLS setup to each LLM round trip.
+The agents get their models from here instead, so that runs share a single
+connection pool and reuse the bound models for identical tool sets.
+
+A run can replace the chat model by passing one as `chat_model` in the
+configurable section of its config, for example a ScriptedChatModel from
+`agents.common.fake_model` to run the agents offline.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+import httpx
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_openai import ChatOpenAI
+
+# Number of distinct (model, tools, options) bindings to keep around
+MAX_BOUND_MODELS = 128
+
+# Configurable key under which a run can pass its own chat model
+CHAT_MODEL_CONFIG_KEY = "chat_model"
+
+_bound_models: "OrderedDict[Tuple[Hashable, ...], Runnable]" = OrderedDict()
+
+
+@lru_cache(maxsize=None)
+def get_http_async_client() -> httpx.AsyncClient:
+    """
+    Returns the HTTP client shared by all chat models.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+
+@lru_cache(maxsize=None)
+def _openai_chat_model(model: str) -> ChatOpenAI:
+    return ChatOpenAI(model=model, http_async_client=get_http_async_client())
+
+
+def configured_chat_model(config: Optional[RunnableConfig]) -> Optional[BaseChatModel]:
+    """
+    Returns the chat model passed in the run config, if any.
+    """
+    if not config:
+        return None
+    return (config.get("configurable") or {}).get(CHAT_MODEL_CONFIG_KEY)
+
+
+def get_chat_model(model: str, config: Optional[RunnableConfig] = None) -> BaseChatModel:
+    """
+    Returns the chat model passed in the run config, or else the shared chat
+    model for a model name.
+    """
+    return configured_chat_model(config) or _openai_chat_model(model)
+
+
+def tools_hash(tools: Sequence[Any]) -> str:
+    """
+    Returns a content hash of a list of tool schemas.
+    """
+    serialized = json.dumps(list(tools), sort_keys=True, default=repr)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def bind_tools(
+    model: str,
+    tools: Sequence[Any],
+    config: Optional[RunnableConfig] = None,
+    **kwargs: Any
+) -> Runnable:
+    """
+    Returns the shared chat model for `model` with `tools` bound to it.
+
+    Bindings are cached by model name, the hash of the tool schemas and the
+    binding options, so the schemas are only converted once per tool set.
+    A chat model passed in the run config is bound directly instead.
+    """
+    configured = configured_chat_model(config)
+    if configured is not None:
+        return configured.bind_tools(list(tools), **kwargs)
+
+    key = (model, tools_hash(tools), _options_key(kwargs))
+    bound = _bound_models.get(key)
+    if bound is not None:
+        _bound_models.move_to_end(key)
+        return bound
+
+    bound = _openai_chat_model(model).bind_tools(list(tools), **kwargs)
+    _bound_models[key] = bound
+    if len(_bound_models) > MAX_BOUND_MODELS:
+        _bound_models.popitem(last=False)
+    return bound
+
+
+def _options_key(options: Dict[str, Any]) -> Tuple[Hashable, ...]:
+    return tuple(sorted((name, repr(value)) for name, value in options.items()))
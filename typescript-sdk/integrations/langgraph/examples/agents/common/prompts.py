@@ -0,0 +1,71 @@
+"""
+System prompts that include part of the agent state.
+
+Putting the state in front of the instructions changes the start of every
+request, so providers cannot reuse their cached prompt prefix. Prompts built
+here keep the instructions as a fixed first message and move the state to the
+end of the conversation.
+"""
+
+import json
+import textwrap
+from typing import Any, Callable, List, Optional, Sequence
+
+from langchain_core.messages import SystemMessage
+
+
+def render_json(value: Any) -> str:
+    """
+    Renders a value as indented JSON with a stable key order.
+    """
+    try:
+        return json.dumps(value, indent=2, sort_keys=True, ensure_ascii=False)
+    except (TypeError, ValueError) as e:
+        return f"Error serializing state: {str(e)}"
+
+
+class StatePrompt:
+    """
+    A system prompt made of fixed instructions and a rendering of some state.
+
+    The instructions are sent as the first message and never change, so the
+    provider can cache everything up to the latest conversation turn. The
+    state follows the conversation in a second system message, rendered with
+    `template` on every turn; the state arrives as new objects each turn, and
+    rendering it costs about as much as computing a key to cache it by.
+    """
+
+    def __init__(
+        self,
+        instructions: str,
+        template: str,
+        render: Callable[[Any], str] = render_json,
+        empty: Optional[str] = None
+    ):
+        self.instructions = SystemMessage(content=textwrap.dedent(instructions).strip())
+        self.template = textwrap.dedent(template).strip()
+        self.render = render
+        self.empty = empty
+
+    def state_message(self, value: Any) -> Optional[SystemMessage]:
+        """
+        Returns the system message describing `value`, or None if there is no
+        state and no `empty` text to send instead.
+        """
+        if value is None:
+            if self.empty is None:
+                return None
+            return SystemMessage(content=self.empty)
+
+        return SystemMessage(content=self.template.format(state=self.render(value)))
+
+    def messages(self, messages: Sequence[Any], value: Any) -> List[Any]:
+        """
+        Returns the messages to send to the model: the instructions, the
+        conversation and the current state, in that order.
+        """
+        state_message = self.state_message(value)
+        result: List[Any] = [self.instructions, *messages]
+        if state_message is not None:
+            result.append(state_message)
+        return result
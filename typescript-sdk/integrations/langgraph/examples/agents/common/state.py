@@ -0,0 +1,82 @@
+"""
+Incremental emission of intermediate state from LangGraph nodes.
+
+Dispatching the whole state on every update serializes the full message
+history each time. The StateEmitter sends the state once and then only JSON
+Patches against what it sent before, leaving the messages out unless they
+changed.
+"""
+
+import copy
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import jsonpatch
+from langchain_core.callbacks.manager import adispatch_custom_event
+from langchain_core.runnables import RunnableConfig
+
+# Custom events understood by the AG-UI LangGraph integration
+EMIT_STATE_EVENT = "manually_emit_state"
+EMIT_STATE_DELTA_EVENT = "manually_emit_state_delta"
+
+
+def _message_ids(messages: Optional[Sequence[Any]]) -> Optional[Tuple[Any, ...]]:
+    if messages is None:
+        return None
+    return tuple(
+        message.get("id", id(message)) if isinstance(message, dict)
+        else getattr(message, "id", None) or id(message)
+        for message in messages
+    )
+
+
+class StateEmitter:
+    """
+    Emits the intermediate state of a node incrementally.
+
+    Create one emitter per node invocation with the state the node received.
+    The first call to `emit` sends the state, without `exclude`d keys, as a
+    `manually_emit_state` event; every later call sends a
+    `manually_emit_state_delta` event with a JSON Patch against the state sent
+    before, and nothing at all if the state did not change. Messages are only
+    included when they differ from the ones the node received.
+    """
+
+    def __init__(
+        self,
+        state: Dict[str, Any],
+        config: RunnableConfig,
+        exclude: Sequence[str] = ("tools",)
+    ):
+        self.config = config
+        self.exclude = set(exclude)
+        self._emitted: Optional[Dict[str, Any]] = None
+        self._message_ids = _message_ids(state.get("messages"))
+
+    async def emit(self, state: Dict[str, Any]) -> None:
+        """
+        Emits the changes to `state` since the last emission.
+        """
+        # Copied, since the node keeps mutating its state after the dispatch
+        current = copy.deepcopy({
+            key: value for key, value in state.items()
+            if key not in self.exclude and key != "messages"
+        })
+
+        message_ids = _message_ids(state.get("messages"))
+        messages_changed = message_ids != self._message_ids
+        self._message_ids = message_ids
+
+        if self._emitted is None:
+            payload = dict(current)
+            if messages_changed:
+                payload["messages"] = state["messages"]
+            await adispatch_custom_event(EMIT_STATE_EVENT, payload, config=self.config)
+        else:
+            delta = jsonpatch.make_patch(self._emitted, current).patch
+            if messages_changed:
+                delta.append({"op": "replace", "path": "/messages", "value": state["messages"]})
+            if not delta:
+                return
+            await adispatch_custom_event(EMIT_STATE_DELTA_EVENT, delta, config=self.config)
+
+        self._emitted = current
@@ -0,0 +1,79 @@
+"""
+Concurrent execution of the independent steps of a plan.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+# Number of steps that run at the same time by default
+MAX_PARALLEL_STEPS = 4
+
+StepFunction = Callable[[int, Any], Awaitable[Any]]
+StepCallback = Callable[[int, Any], Awaitable[None]]
+
+
+class StepExecutor:
+    """
+    Runs the steps of a plan concurrently, up to `max_concurrency` at a time.
+
+    Each step is executed by `execute(index, step)`; as soon as one finishes,
+    `on_complete(index, result)` is awaited so its completion can be streamed
+    while the other steps are still running. Completion callbacks never
+    overlap, so they can safely update and emit shared state.
+
+    The steps run in an asyncio.TaskGroup: if one step fails or the run is
+    cancelled, the steps still running are cancelled and steps that did not
+    start yet are skipped. `cancel` stops a run from the outside the same way,
+    without cancelling the task that awaits it.
+    """
+
+    def __init__(self, max_concurrency: int = MAX_PARALLEL_STEPS):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(
+        self,
+        steps: Sequence[Any],
+        execute: StepFunction,
+        on_complete: Optional[StepCallback] = None
+    ) -> bool:
+        """
+        Executes all steps and waits for them to finish. Returns False if the
+        run was stopped with `cancel`.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        callback_lock = asyncio.Lock()
+
+        async def run_step(index: int, step: Any) -> None:
+            async with semaphore:
+                result = await execute(index, step)
+            if on_complete is not None:
+                async with callback_lock:
+                    await on_complete(index, result)
+
+        async def run_all() -> None:
+            async with asyncio.TaskGroup() as group:
+                for index, step in enumerate(steps):
+                    group.create_task(run_step(index, step))
+
+        self._task = asyncio.create_task(run_all())
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            # Only swallow the cancellation requested through `cancel`
+            if asyncio.current_task().cancelling():
+                raise
+            return False
+        finally:
+            self._task = None
+        return True
+
+    def cancel(self) -> bool:
+        """
+        Cancels the current run. Returns False if no run is in progress.
+        """
+        if self._task is None:
+            return False
+        return self._task.cancel()
@@ -0,0 +1,79 @@
+"""
+Handling of parallel tool calls in LangGraph chat nodes.
+
+The agents let the model call several tools in one response, which saves an
+LLM round trip per additional tool. A node handles every call it knows,
+answers each with a tool message, and merges the state updates of all calls
+into one update.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, NamedTuple
+
+
+class ToolCall(NamedTuple):
+    """
+    A tool call requested by the model.
+    """
+    id: str
+    name: str
+    args: Dict[str, Any]
+
+
+def get_tool_calls(response: Any) -> List[ToolCall]:
+    """
+    Returns the tool calls of a model response in the order the model made
+    them, whether they are dicts or objects and their arguments are parsed
+    or not.
+    """
+    tool_calls = []
+    for tool_call in getattr(response, "tool_calls", None) or []:
+        if isinstance(tool_call, dict):
+            tool_call_id = tool_call.get("id", "")
+            tool_call_name = tool_call.get("name", "")
+            args = tool_call.get("args", {})
+        else:
+            tool_call_id = tool_call.id
+            tool_call_name = tool_call.name
+            args = tool_call.args
+        if isinstance(args, str):
+            args = json.loads(args) if args else {}
+        tool_calls.append(ToolCall(tool_call_id, tool_call_name, args))
+    return tool_calls
+
+
+def tool_response(tool_call: ToolCall, content: str) -> Dict[str, Any]:
+    """
+    Returns the tool message answering a tool call.
+    """
+    return {
+        "role": "tool",
+        "content": content,
+        "tool_call_id": tool_call.id
+    }
+
+
+def merge_updates(updates: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merges the state updates of several tool calls into one.
+
+    Objects are merged key by key, so calls that change different fields of
+    the same object do not overwrite each other; for any other value the
+    later call wins. Updates are merged in the order of the tool calls, not
+    the order in which they finished, so the result is deterministic.
+    """
+    merged: Dict[str, Any] = {}
+    for update in updates:
+        _merge_into(merged, update)
+    return merged
+
+
+def _merge_into(target: Dict[str, Any], update: Dict[str, Any]) -> None:
+    for key, value in update.items():
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            merged = dict(current)
+            _merge_into(merged, value)
+            target[key] = merged
+        else:
+            target[key] = value
@@ -2,7 +2,6 @@
 A LangGraph implementation of the human-in-the-loop agent.
 """
 
-import json
 from typing import Dict, List, Any
 
 # LangGraph imports
@@ -14,8 +13,9 @@ from langgraph.graph import MessagesState
 from copilotkit.langgraph import copilotkit_emit_state, copilotkit_interrupt
 
 # LLM imports
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
+from agents.common.models import bind_tools, get_chat_model
+from agents.common.tool_calls import get_tool_calls, tool_response
 
 DEFINE_TASK_TOOL = {
     "type": "function",
@@ -84,9 +84,6 @@ async def chat_node(state: Dict[str, Any], config: RunnableConfig):
     Always make sure you will provide tasks based on the user query
     """
 
-    # Define the model
-    model = ChatOpenAI(model="gpt-4o-mini")
-    
     # Define config for the model
     if config is None:
         config = RunnableConfig(recursion_limit=25)
@@ -98,14 +95,14 @@ async def chat_node(state: Dict[str, Any], config: RunnableConfig):
         "tool_argument": "steps"
     }]
 
-    # Bind the tools to the model
-    model_with_tools = model.bind_tools(
+    # Bind the tools to the model (the binding is shared across runs)
+    model_with_tools = bind_tools(
+        "gpt-4o-mini",
         [
             *state["tools"],
             DEFINE_TASK_TOOL
         ],
-        # Disable parallel tool calls to avoid race conditions
-        parallel_tool_calls=False,
+        config=config,
     )
 
     # Run the model and generate a response
@@ -117,71 +114,61 @@ async def chat_node(state: Dict[str, Any], config: RunnableConfig):
     # Update messages with the response
     messages = state["messages"] + [response]
     
-    # Handle tool calls
-    if hasattr(response, "tool_calls") and response.tool_calls and len(response.tool_calls) > 0:
-        tool_call = response.tool_calls[0]
-        # Extract tool call information
-        if hasattr(tool_call, "id"):
-            tool_call_id = tool_call.id
-            tool_call_name = tool_call.name
-            tool_call_args = tool_call.args if not isinstance(tool_call.args, str) else json.loads(tool_call.args)
-        else:
-            tool_call_id = tool_call.get("id", "")
-            tool_call_name = tool_call.get("name", "")
-            args = tool_call.get("args", {})
-            tool_call_args = args if not isinstance(args, str) else json.loads(args)
-
-        if tool_call_name == "generate_task_steps":
-            # Get the steps from the tool call
-            steps_raw = tool_call_args.get("steps", [])
-            
-            # Set initial status to "enabled" for all steps
-            steps_data = []
-            
-            # Handle different potential formats of steps data
-            if isinstance(steps_raw, list):
-                for step in steps_raw:
-                    if isinstance(step, dict) and "description" in step:
-                        steps_data.append({
-                            "description": step["description"],
-                            "status": "enabled"
-                        })
-                    elif isinstance(step, str):
-                        steps_data.append({
-                            "description": step,
-                            "status": "enabled"
-                        })
-            
-            # If no steps were processed correctly, return to END with the updated messages
-            if not steps_data:
-                return Command(
-                    goto=END,
-                    update={
-                        "messages": messages,
-                        "steps": state["steps"],
-                    }
-                )
-            # Update steps in state and emit to frontend
-            state["steps"] = steps_data
-            
-            # Add a tool response to satisfy OpenAI's requirements
-            tool_response = {
-                "role": "tool",
-                "content": "Task steps generated.",
-                "tool_call_id": tool_call_id
-            }
-            
-            messages = messages + [tool_response]
+    # Handle tool calls; steps from every generate_task_steps call are combined
+    tool_calls = get_tool_calls(response)
+    step_calls = [
+        tool_call for tool_call in tool_calls
+        if tool_call.name == "generate_task_steps"
+    ]
+
+    if step_calls:
+        # Set initial status to "enabled" for all steps
+        steps_data = []
 
-            # Move to the process_steps_node which will handle the interrupt and final response
+        # Handle different potential formats of steps data
+        for tool_call in step_calls:
+            steps_raw = tool_call.args.get("steps", [])
+            if not isinstance(steps_raw, list):
+                continue
+            for step in steps_raw:
+                if isinstance(step, dict) and "description" in step:
+                    steps_data.append({
+                        "description": step["description"],
+                        "status": "enabled"
+                    })
+                elif isinstance(step, str):
+                    steps_data.append({
+                        "description": step,
+                        "status": "enabled"
+                    })
+
+        # If no steps were processed correctly, return to END with the updated messages
+        if not steps_data:
             return Command(
-                goto="process_steps_node",
+                goto=END,
                 update={
                     "messages": messages,
                     "steps": state["steps"],
                 }
             )
-    
+        # Update steps in state and emit to frontend
+        state["steps"] = steps_data
+
+        # Add a tool response for every call to satisfy OpenAI's requirements
+        messages = messages + [
+            tool_response(tool_call, "Task steps generated.") for tool_call in step_calls
+        ]
+
+        # Move to the process_steps_node which will handle the interrupt and final response;
+        # frontend tools called alongside the steps are answered by the client first
+        return Command(
+            goto="process_steps_node" if len(step_calls) == len(tool_calls) else END,
+            update={
+                "messages": messages,
+                "steps": state["steps"],
+            }
+        )
+
     # If no tool calls or not generate_task_steps, return to END with the updated messages
     return Command(
         goto=END,
@@ -217,7 +204,7 @@ async def process_steps_node(state: Dict[str, Any], config: RunnableConfig):
     Don't just repeat a list of steps, come up with a creative but short description (3 sentences max) of how you are performing the task.
     """
     
-    final_response = await ChatOpenAI(model="gpt-4o").ainvoke([
+    final_response = await get_chat_model("gpt-4o", config).ainvoke([
         SystemMessage(content=final_prompt),
         {"role": "user", "content": user_response}
     ], config)
@@ -12,8 +12,9 @@ from langgraph.graph import StateGraph, END, START
 from langgraph.types import Command
 from langgraph.graph import MessagesState
 # OpenAI imports
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage
+from agents.common.models import bind_tools
+from agents.common.prompts import StatePrompt
+from agents.common.tool_calls import get_tool_calls, merge_updates, tool_response
 
 WRITE_DOCUMENT_TOOL = {
     "type": "function",
@@ -58,23 +59,26 @@ async def start_flow(state: AgentState, config: RunnableConfig):
     )
 
 
-async def chat_node(state: AgentState, config: RunnableConfig):
-    """
-    Standard chat node.
-    """
-
-    system_prompt = f"""
-    You are a helpful assistant for writing documents. 
+# The instructions come first and never change, so the provider can cache the
+# prompt prefix; the document is rendered once per version and sent last
+SYSTEM_PROMPT = StatePrompt(
+    instructions="""
+    You are a helpful assistant for writing documents.
     To write the document, you MUST use the write_document tool.
     You MUST write the full document, even when changing only a few words.
-    When you wrote the document, DO NOT repeat it as a message. 
+    When you wrote the document, DO NOT repeat it as a message.
     Just briefly summarize the changes you made. 2 sentences max.
-    This is the current state of the document: ----\n {state.get('document')}\n-----
+    """,
+    template="This is the current state of the document: ----\n {state}\n-----",
+    render=str
+)
+
+
+async def chat_node(state: AgentState, config: RunnableConfig):
+    """
+    Standard chat node.
     """
 
-    # Define the model
-    model = ChatOpenAI(model="gpt-4o")
-    
     # Define config for the model with emit_intermediate_state to stream tool calls to frontend
     if config is None:
         config = RunnableConfig(recursion_limit=25)
@@ -86,72 +90,73 @@ async def chat_node(state: AgentState, config: RunnableConfig):
         "tool_argument": "document"
     }]
 
-    # Bind the tools to the model
-    model_with_tools = model.bind_tools(
+    # Bind the tools to the model (the binding is shared across runs)
+    model_with_tools = bind_tools(
+        "gpt-4o",
         [
             *state["tools"],
             WRITE_DOCUMENT_TOOL
         ],
-        # Disable parallel tool calls to avoid race conditions
-        parallel_tool_calls=False,
+        config=config,
     )
 
     # Run the model to generate a response
-    response = await model_with_tools.ainvoke([
-        SystemMessage(content=system_prompt),
-        *state["messages"],
-    ], config)
+    response = await model_with_tools.ainvoke(
+        SYSTEM_PROMPT.messages(state["messages"], state.get("document")),
+        config
+    )
 
     # Update messages with the response
     messages = state["messages"] + [response]
     
-    # Extract any tool calls from the response
-    if hasattr(response, "tool_calls") and response.tool_calls:
-        tool_call = response.tool_calls[0]
-        
-        # Handle tool_call as a dictionary or an object
-        if isinstance(tool_call, dict):
-            tool_call_id = tool_call["id"]
-            tool_call_name = tool_call["name"]
-            tool_call_args = tool_call["args"]
-        else:
-            # Handle as an object (backward compatibility)
-            tool_call_id = tool_call.id
-            tool_call_name = tool_call.name
-            tool_call_args = tool_call.args
-
-        if tool_call_name == "write_document":
-            # Add the tool response to messages
-            tool_response = {
-                "role": "tool",
-                "content": "Document written.",
-                "tool_call_id": tool_call_id
-            }
-            
-            # Add confirmation tool call
-            confirm_tool_call = {
-                "role": "assistant",
-                "content": "",
-                "tool_calls": [{
-                    "id": str(uuid.uuid4()),
-                    "function": {
-                        "name": "confirm_changes",
-                        "arguments": "{}"
-                    }
-                }]
-            }
-            
-            messages = messages + [tool_response, confirm_tool_call]
-            
-            # Return Command to route to end
+    # Extract the write_document calls from the response
+    tool_calls = get_tool_calls(response)
+    document_calls = [
+        tool_call for tool_call in tool_calls
+        if tool_call.name == "write_document"
+    ]
+
+    if document_calls:
+        # Add a tool response for every call to messages
+        tool_responses = [
+            tool_response(tool_call, "Document written.") for tool_call in document_calls
+        ]
+        document = merge_updates(
+            {"document": tool_call.args["document"]} for tool_call in document_calls
+        )
+
+        # Frontend tools called alongside the document are answered by the
+        # client, so no assistant message may follow them before it does
+        if len(document_calls) != len(tool_calls):
             return Command(
                 goto=END,
-                update={
-                    "messages": messages,
-                    "document": tool_call_args["document"]
-                }
+                update={"messages": messages + tool_responses, **document}
             )
-    
+
+        # Add confirmation tool call
+        confirm_tool_call = {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [{
+                "id": str(uuid.uuid4()),
+                "function": {
+                    "name": "confirm_changes",
+                    "arguments": "{}"
+                }
+            }]
+        }
+
+        messages = messages + tool_responses + [confirm_tool_call]
+
+        # Return Command to route to end; the last document written wins
+        return Command(
+            goto=END,
+            update={
+                "messages": messages,
+                **document
+            }
+        )
+
     # If no tool was called, go to end
     return Command(
         goto=END,
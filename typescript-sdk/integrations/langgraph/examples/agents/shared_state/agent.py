@@ -2,7 +2,6 @@
 A demo of shared state between the agent and CopilotKit using LangGraph.
 """
 
-import json
 from enum import Enum
 from typing import Dict, List, Any, Optional
 
@@ -10,11 +9,12 @@ from typing import Dict, List, Any, Optional
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END, START
 from langgraph.types import Command
-from langchain_core.callbacks.manager import adispatch_custom_event
 from langgraph.graph import MessagesState
 # OpenAI imports
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage
+from agents.common.models import bind_tools
+from agents.common.prompts import StatePrompt
+from agents.common.state import StateEmitter
+from agents.common.tool_calls import get_tool_calls, merge_updates, tool_response
 
 class SkillLevel(str, Enum):
     """
@@ -132,11 +132,7 @@ async def start_flow(state: Dict[str, Any], config: RunnableConfig):
             "instructions": ["First step instruction"]
         }
         # Emit the initial state to ensure it's properly shared with the frontend
-        await adispatch_custom_event(
-            "manually_emit_intermediate_state",
-            state,
-            config=config,
-        )
+        await StateEmitter(state, config).emit(state)
     
     return Command(
         goto="chat_node",
@@ -147,22 +143,13 @@ async def start_flow(state: Dict[str, Any], config: RunnableConfig):
     )
 
 
-async def chat_node(state: Dict[str, Any], config: RunnableConfig):
-    """
-    Standard chat node.
-    """
-    # Create a safer serialization of the recipe
-    recipe_json = "No recipe yet"
-    if "recipe" in state and state["recipe"] is not None:
-        try:
-            recipe_json = json.dumps(state["recipe"], indent=2)
-        except Exception as e:
-            recipe_json = f"Error serializing recipe: {str(e)}"
-    
-    system_prompt = f"""You are a helpful assistant for creating recipes. 
-    This is the current state of the recipe: {recipe_json}
+# The instructions come first and never change, so the provider can cache the
+# prompt prefix; the recipe is rendered once per version and sent last
+SYSTEM_PROMPT = StatePrompt(
+    instructions="""
+    You are a helpful assistant for creating recipes.
     You can improve the recipe by calling the generate_recipe tool.
-    
+
     IMPORTANT:
     1. Create a recipe using the existing ingredients and instructions. Make sure the recipe is complete.
     2. For ingredients, append new ingredients to the existing ones.
@@ -171,11 +158,16 @@ async def chat_node(state: Dict[str, Any], config: RunnableConfig):
     5. 'instructions' is always an array of strings
 
     If you have just created or modified the recipe, just answer in one sentence what you did. dont describe the recipe, just say what you did.
-    """
+    """,
+    template="This is the current state of the recipe: {state}",
+    empty="No recipe yet"
+)
 
-    # Define the model
-    model = ChatOpenAI(model="gpt-4o-mini")
-    
+
+async def chat_node(state: Dict[str, Any], config: RunnableConfig):
+    """
+    Standard chat node.
+    """
     # Define config for the model
     if config is None:
         config = RunnableConfig(recursion_limit=25)
@@ -187,93 +179,66 @@ async def chat_node(state: Dict[str, Any], config: RunnableConfig):
         "tool_argument": "recipe"
     }]
 
-    # Bind the tools to the model
-    model_with_tools = model.bind_tools(
+    # Bind the tools to the model (the binding is shared across runs)
+    model_with_tools = bind_tools(
+        "gpt-4o-mini",
         [
             *state["tools"],
             GENERATE_RECIPE_TOOL
         ],
-        # Disable parallel tool calls to avoid race conditions
-        parallel_tool_calls=False,
+        config=config,
     )
 
     # Run the model and generate a response
-    response = await model_with_tools.ainvoke([
-        SystemMessage(content=system_prompt),
-        *state["messages"],
-    ], config)
+    response = await model_with_tools.ainvoke(
+        SYSTEM_PROMPT.messages(state["messages"], state.get("recipe")),
+        config
+    )
 
     # Update messages with the response
     messages = state["messages"] + [response]
     
-    # Handle tool calls
-    if hasattr(response, "tool_calls") and response.tool_calls:
-        tool_call = response.tool_calls[0]
-        
-        # Handle tool_call as a dictionary or an object
-        if isinstance(tool_call, dict):
-            tool_call_id = tool_call["id"]
-            tool_call_name = tool_call["name"]
-            # Check if args is already a dict or needs to be parsed
-            if isinstance(tool_call["args"], dict):
-                tool_call_args = tool_call["args"]
-            else:
-                tool_call_args = json.loads(tool_call["args"])
-        else:
-            # Handle as an object
-            tool_call_id = tool_call.id
-            tool_call_name = tool_call.name
-            # Check if args is already a dict or needs to be parsed
-            if isinstance(tool_call.args, dict):
-                tool_call_args = tool_call.args
-            else:
-                tool_call_args = json.loads(tool_call.args)
-
-        if tool_call_name == "generate_recipe":
-            # Update recipe state with tool_call_args
-            recipe_data = tool_call_args["recipe"]
-            
-            # If we have an existing recipe, update it
-            if "recipe" in state and state["recipe"] is not None:
-                recipe = state["recipe"]
-                for key, value in recipe_data.items():
-                    if value is not None:  # Only update fields that were provided
-                        recipe[key] = value
-            else:
-                # Create a new recipe
-                recipe = {
-                    "skill_level": recipe_data.get("skill_level", SkillLevel.BEGINNER.value),
-                    "special_preferences": recipe_data.get("special_preferences", []),
-                    "cooking_time": recipe_data.get("cooking_time", CookingTime.FIFTEEN_MIN.value),
-                    "ingredients": recipe_data.get("ingredients", []),
-                    "instructions": recipe_data.get("instructions", [])
-                }
-            
-            # Add tool response to messages
-            tool_response = {
-                "role": "tool",
-                "content": "Recipe generated.",
-                "tool_call_id": tool_call_id
+    # Handle tool calls; every generate_recipe call updates the recipe
+    tool_calls = get_tool_calls(response)
+    recipe_calls = [
+        tool_call for tool_call in tool_calls
+        if tool_call.name == "generate_recipe"
+    ]
+
+    if recipe_calls:
+        # Start from the existing recipe, or from a new one with defaults
+        recipe = state.get("recipe") or {
+            "skill_level": SkillLevel.BEGINNER.value,
+            "special_preferences": [],
+            "cooking_time": CookingTime.FIFTEEN_MIN.value,
+            "ingredients": [],
+            "instructions": []
+        }
+
+        # Merge the fields provided by each call, in the order of the calls
+        recipe = merge_updates([recipe] + [
+            {key: value for key, value in tool_call.args["recipe"].items() if value is not None}
+            for tool_call in recipe_calls
+        ])
+
+        # Add a tool response for every call to messages
+        messages = messages + [
+            tool_response(tool_call, "Recipe generated.") for tool_call in recipe_calls
+        ]
+
+        # Explicitly emit the updated state to ensure it's shared with frontend
+        state["recipe"] = recipe
+        await StateEmitter(state, config).emit(state)
+
+        # Return command with updated recipe
+        return Command(
+            # Frontend tools called alongside the recipe are answered by the client
+            goto="start_flow" if len(recipe_calls) == len(tool_calls) else END,
+            update={
+                "messages": messages,
+                "recipe": recipe
             }
-            
-            messages = messages + [tool_response]
-            
-            # Explicitly emit the updated state to ensure it's shared with frontend
-            state["recipe"] = recipe
-            await adispatch_custom_event(
-                "manually_emit_intermediate_state",
-                state,
-                config=config,
-            )
-            
-            # Return command with updated recipe
-            return Command(
-                goto="start_flow",
-                update={
-                    "messages": messages,
-                    "recipe": recipe
-                }
-            )
+        )
 
     return Command(
         goto=END,
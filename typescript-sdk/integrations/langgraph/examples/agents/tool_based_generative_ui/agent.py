@@ -11,8 +11,8 @@ from langgraph.types import Command
 from langgraph.graph import MessagesState
 
 # OpenAI imports
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
+from agents.common.models import bind_tools
 
 # List of available images (modify path if needed)
 IMAGE_LIST = [
@@ -85,18 +85,15 @@ async def chat_node(state: AgentState, config: RunnableConfig):
         Dont provide the relavent image names in your final response to the user.
     """
 
-    # Define the model
-    model = ChatOpenAI(model="gpt-4o")
-    
     # Define config for the model
     if config is None:
         config = RunnableConfig(recursion_limit=25)
 
-    # Bind the tools to the model
-    model_with_tools = model.bind_tools(
+    # Bind the tools to the model (the binding is shared across runs)
+    model_with_tools = bind_tools(
+        "gpt-4o",
         [GENERATE_HAIKU_TOOL],
-        # Disable parallel tool calls to avoid race conditions
-        parallel_tool_calls=False,
+        config=config,
     )
 
     # Run the model to generate a response
@@ -12,6 +12,7 @@ import {
 } from "@langchain/langgraph-sdk";
 import { randomUUID } from "node:crypto";
 import { RemoveMessage } from "@langchain/core/messages";
+import { applyPatch, Operation } from "fast-json-patch";
 import {
   LangGraphPlatformMessage,
   CustomEventNames,
@@ -339,6 +340,10 @@ export class LangGraphAgent extends AbstractAgent {
         });
 
         this.handleSingleEvent(chunkData, state);
+        // The client received the manually emitted state with the event
+        if (this.activeRun!.manuallyEmittedState) {
+          state = this.activeRun!.manuallyEmittedState;
+        }
       }
 
       state = await this.client.threads.getState(threadId);
@@ -400,6 +405,12 @@ export class LangGraphAgent extends AbstractAgent {
         const isToolCallArgsEvent =
           hasCurrentStream && currentStream?.toolCallId && toolCallData.args;
         const isToolCallEndEvent = hasCurrentStream && currentStream?.toolCallId && !toolCallData;
+        // With parallel tool calls, the next call starts right after the previous one's arguments
+        const isNextToolCallEvent =
+          hasCurrentStream &&
+          currentStream?.toolCallId &&
+          toolCallData?.id &&
+          toolCallData.id !== currentStream.toolCallId;
 
         const isMessageStartEvent = !hasCurrentStream && !toolCallData;
         const isMessageContentEvent = hasCurrentStream && !toolCallData;
@@ -414,6 +425,40 @@ export class LangGraphAgent extends AbstractAgent {
           });
         }
 
+        if (isNextToolCallEvent) {
+          const ended = this.dispatchEvent({
+            type: EventType.TOOL_CALL_END,
+            toolCallId: currentStream.toolCallId!,
+            rawEvent: event,
+          });
+          if (ended) {
+            this.messagesInProcess[this.activeRun!.id] = null;
+          }
+          const resolved = this.dispatchEvent({
+            type: EventType.TOOL_CALL_START,
+            toolCallId: toolCallData.id,
+            toolCallName: toolCallData.name,
+            parentMessageId: event.data.chunk.id,
+            rawEvent: event,
+          });
+          if (resolved) {
+            this.setMessageInProgress(this.activeRun!.id, {
+              id: event.data.chunk.id,
+              toolCallId: toolCallData.id,
+              toolCallName: toolCallData.name,
+            });
+          }
+          if (toolCallData.args) {
+            this.dispatchEvent({
+              type: EventType.TOOL_CALL_ARGS,
+              toolCallId: toolCallData.id,
+              delta: toolCallData.args,
+              rawEvent: event,
+            });
+          }
+          break;
+        }
+
         if (isToolCallEndEvent) {
           const resolved = this.dispatchEvent({
             type: EventType.TOOL_CALL_END,
@@ -565,14 +610,46 @@ export class LangGraphAgent extends AbstractAgent {
         }
 
         if (event.name === CustomEventNames.ManuallyEmitState) {
-          this.activeRun!.manuallyEmittedState = event.data;
+          // Keys left out of the emitted state (e.g. unchanged messages) keep their current value
+          this.activeRun!.manuallyEmittedState = {
+            ...(this.activeRun!.manuallyEmittedState ?? state),
+            ...event.data,
+          };
           this.dispatchEvent({
             type: EventType.STATE_SNAPSHOT,
-            snapshot: this.getStateSnapshot(state),
+            snapshot: this.getStateSnapshot(this.activeRun!.manuallyEmittedState!),
             rawEvent: event,
           });
         }
 
+        if (event.name === CustomEventNames.ManuallyEmitStateDelta) {
+          // The delta is a JSON Patch against the state emitted before
+          const emittedState = this.activeRun!.manuallyEmittedState;
+          this.activeRun!.manuallyEmittedState = applyPatch(
+            emittedState ?? state,
+            event.data,
+            false,
+            false,
+          ).newDocument;
+          // The client already has the emitted state, unless this is the first emission of the node
+          const delta = emittedState ? this.getStateDelta(event.data) : null;
+          if (delta) {
+            if (delta.length) {
+              this.dispatchEvent({
+                type: EventType.STATE_DELTA,
+                delta,
+                rawEvent: event,
+              });
+            }
+          } else {
+            this.dispatchEvent({
+              type: EventType.STATE_SNAPSHOT,
+              snapshot: this.getStateSnapshot(this.activeRun!.manuallyEmittedState!),
+              rawEvent: event,
+            });
+          }
+        }
+
         this.dispatchEvent({
           type: EventType.CUSTOM,
           name: event.name,
@@ -593,6 +670,35 @@ export class LangGraphAgent extends AbstractAgent {
     return state;
   }
 
+  // Returns the operations of a delta that apply to the state snapshot, or null if the
+  // snapshot has to be sent again
+  getStateDelta(operations: Operation[]): Operation[] | null {
+    const schemaKeys = this.activeRun!.schemaKeys!;
+    if (!schemaKeys?.output) {
+      return operations;
+    }
+    const keys = [...DEFAULT_SCHEMA_KEYS, ...schemaKeys.output];
+    const inSnapshot = (path: string) => {
+      const key = (path.split("/")[1] ?? "").replace(/~1/g, "/").replace(/~0/g, "~");
+      return keys.includes(key);
+    };
+    const delta: Operation[] = [];
+    for (const operation of operations) {
+      if (operation.path === "") {
+        return null;
+      }
+      const from = "from" in operation ? operation.from : undefined;
+      if (from !== undefined && inSnapshot(from) !== inSnapshot(operation.path)) {
+        // Moves values across the snapshot's boundary
+        return null;
+      }
+      if (inSnapshot(operation.path)) {
+        delta.push(operation);
+      }
+    }
+    return delta;
+  }
+
   async getOrCreateThreadAndReturnState(threadId: string): Promise<ThreadState<{}>> {
     let agentState = { values: {} } as ThreadState;
     try {
@@ -81,6 +81,7 @@ export enum CustomEventNames {
   ManuallyEmitMessage = "manually_emit_message",
   ManuallyEmitToolCall = "manually_emit_tool_call",
   ManuallyEmitState = "manually_emit_state",
+  ManuallyEmitStateDelta = "manually_emit_state_delta",
   Exit = "exit",
 }
 
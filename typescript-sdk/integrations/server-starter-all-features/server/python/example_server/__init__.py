@@ -5,32 +5,37 @@ Example server for the AG-UI protocol.
 import os
 import uvicorn
 from fastapi import FastAPI
-from .agentic_chat import agentic_chat_endpoint
-from .human_in_the_loop import human_in_the_loop_endpoint
-from .agentic_generative_ui import agentic_generative_ui_endpoint
-from .tool_based_generative_ui import tool_based_generative_ui_endpoint
-from .shared_state import shared_state_endpoint
-from .predictive_state_updates import predictive_state_updates_endpoint
+from ag_ui.encoder import SnapshotCache
+from .router import AGUIRouter
+from .agentic_chat import agentic_chat_agent
+from .human_in_the_loop import human_in_the_loop_agent
+from .agentic_generative_ui import agentic_generative_ui_agent
+from .tool_based_generative_ui import tool_based_generative_ui_agent
+from .shared_state import shared_state_agent
+from .predictive_state_updates import predictive_state_updates_agent
 
 app = FastAPI(title="AG-UI Endpoint")
+router = AGUIRouter(snapshot_cache=SnapshotCache())
 
-# Register the agentic chat endpoint
-app.post("/agentic_chat")(agentic_chat_endpoint)
+# Register the agentic chat agent
+router.add_agent("/agentic_chat", agentic_chat_agent)
 
-# Register the human in the loop endpoint
-app.post("/human_in_the_loop")(human_in_the_loop_endpoint)
+# Register the human in the loop agent
+router.add_agent("/human_in_the_loop", human_in_the_loop_agent)
 
-# Register the agentic generative UI endpoint
-app.post("/agentic_generative_ui")(agentic_generative_ui_endpoint)
+# Register the agentic generative UI agent
+router.add_agent("/agentic_generative_ui", agentic_generative_ui_agent)
 
-# Register the tool-based generative UI endpoint
-app.post("/tool_based_generative_ui")(tool_based_generative_ui_endpoint)
+# Register the tool-based generative UI agent
+router.add_agent("/tool_based_generative_ui", tool_based_generative_ui_agent)
 
-# Register the shared state endpoint
-app.post("/shared_state")(shared_state_endpoint)
+# Register the shared state agent
+router.add_agent("/shared_state", shared_state_agent)
 
-# Register the predictive state updates endpoint
-app.post("/predictive_state_updates")(predictive_state_updates_endpoint)
+# Register the predictive state updates agent
+router.add_agent("/predictive_state_updates", predictive_state_updates_agent)
+
+app.include_router(router)
 
 
 def main():
@@ -1,17 +1,12 @@
 """
-Agentic chat endpoint for the AG-UI protocol.
+Agentic chat agent for the AG-UI protocol.
 """
 
-import uuid
-import asyncio
 import json
-from fastapi import Request
-from fastapi.responses import StreamingResponse
 from ag_ui.core import (
     RunAgentInput,
+    generate_id,
     EventType,
-    RunStartedEvent,
-    RunFinishedEvent,
     TextMessageStartEvent,
     TextMessageContentEvent,
     TextMessageEndEvent,
@@ -23,66 +18,35 @@ from ag_ui.core import (
     ToolCall,
     AssistantMessage
 )
-from ag_ui.encoder import EventEncoder
-
-async def agentic_chat_endpoint(input_data: RunAgentInput, request: Request):
-    """Agentic chat endpoint"""
-    # Get the accept header from the request
-    accept_header = request.headers.get("accept")
-
-    # Create an event encoder to properly format SSE events
-    encoder = EventEncoder(accept=accept_header)
-
-    async def event_generator():
-        # Get the last message content for conditional logic
-        last_message_content = None
-        last_message_role = None
-        if input_data.messages and len(input_data.messages) > 0:
-            last_message = input_data.messages[-1]
-            last_message_content = last_message.content
-            last_message_role = getattr(last_message, 'role', None)
-
-        # Send run started event
-        yield encoder.encode(
-            RunStartedEvent(
-                type=EventType.RUN_STARTED,
-                thread_id=input_data.thread_id,
-                run_id=input_data.run_id
-            ),
-        )
-
-        # Conditional logic based on last message
-        if last_message_role == "tool":
-            async for event in send_tool_result_message_events():
-                yield encoder.encode(event)
-        elif last_message_content == "tool":
-            async for event in send_tool_call_events():
-                yield encoder.encode(event)
-        elif last_message_content == "backend_tool":
-            async for event in send_backend_tool_call_events(input_data.messages):
-                yield encoder.encode(event)
-        else:
-            async for event in send_text_message_events():
-                yield encoder.encode(event)
-
-        # Send run finished event
-        yield encoder.encode(
-            RunFinishedEvent(
-                type=EventType.RUN_FINISHED,
-                thread_id=input_data.thread_id,
-                run_id=input_data.run_id
-            ),
-        )
-
-    return StreamingResponse(
-        event_generator(),
-        media_type=encoder.get_content_type()
-    )
+from .delays import simulate_delay
+
+async def agentic_chat_agent(input_data: RunAgentInput):
+    """Agentic chat agent"""
+    # Get the last message content for conditional logic
+    last_message_content = None
+    last_message_role = None
+    if input_data.messages and len(input_data.messages) > 0:
+        last_message = input_data.messages[-1]
+        last_message_content = last_message.content
+        last_message_role = getattr(last_message, 'role', None)
+
+    # Conditional logic based on last message
+    if last_message_role == "tool":
+        events = send_tool_result_message_events()
+    elif last_message_content == "tool":
+        events = send_tool_call_events()
+    elif last_message_content == "backend_tool":
+        events = send_backend_tool_call_events(input_data.messages)
+    else:
+        events = send_text_message_events()
+
+    async for event in events:
+        yield event
 
 
 async def send_text_message_events():
     """Send text message events with countdown"""
-    message_id = str(uuid.uuid4())
+    message_id = generate_id()
 
     # Start of message
     yield TextMessageStartEvent(
@@ -106,7 +70,7 @@ async def send_text_message_events():
             delta=f"{count}  "
         )
         # Sleep for 300ms
-        await asyncio.sleep(0.3)
+        await simulate_delay(0.3)
 
     # Final checkmark
     yield TextMessageContentEvent(
@@ -124,7 +88,7 @@ async def send_text_message_events():
 
 async def send_tool_result_message_events():
     """Send message for tool result"""
-    message_id = str(uuid.uuid4())
+    message_id = generate_id()
 
     # Start of message
     yield TextMessageStartEvent(
@@ -149,7 +113,7 @@ async def send_tool_result_message_events():
 
 async def send_tool_call_events():
     """Send tool call events"""
-    tool_call_id = str(uuid.uuid4())
+    tool_call_id = generate_id()
     tool_call_name = "change_background"
     tool_call_args = {
         "background": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)"
@@ -177,10 +141,10 @@ async def send_tool_call_events():
 
 async def send_backend_tool_call_events(messages):
     """Send backend tool call events"""
-    tool_call_id = str(uuid.uuid4())
+    tool_call_id = generate_id()
 
     new_message = AssistantMessage(
-        id=str(uuid.uuid4()),
+        id=generate_id(),
         role="assistant",
         tool_calls=[
             ToolCall(
@@ -195,7 +159,7 @@ async def send_backend_tool_call_events(messages):
     )
 
     result_message = ToolMessage(
-        id=str(uuid.uuid4()),
+        id=generate_id(),
         role="tool",
         content="The weather in San Francisco is sunny.",
         tool_call_id=tool_call_id
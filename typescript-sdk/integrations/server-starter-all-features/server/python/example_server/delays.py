@@ -0,0 +1,26 @@
+"""
+Simulated work in the example agents.
+"""
+
+import asyncio
+import os
+
+# Environment variable that scales every simulated delay, e.g. 0 to disable them
+DELAY_SCALE_ENV = "AG_UI_DELAY_SCALE"
+
+
+def delay_scale() -> float:
+    """
+    Returns the factor applied to simulated delays.
+    """
+    return float(os.getenv(DELAY_SCALE_ENV, "1"))
+
+
+async def simulate_delay(seconds: float) -> None:
+    """
+    Waits for `seconds` scaled by AG_UI_DELAY_SCALE.
+
+    With a scale of zero the agents still yield to the event loop between
+    events, so load tests measure the framework overhead only.
+    """
+    await asyncio.sleep(max(seconds * delay_scale(), 0))
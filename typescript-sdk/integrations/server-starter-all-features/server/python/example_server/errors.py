@@ -0,0 +1,98 @@
+"""
+Error reporting for agents served over the AG-UI protocol.
+"""
+
+from typing import Dict, List, Tuple
+from ag_ui.core import (
+    BaseEvent,
+    EventType,
+    TextMessageEndEvent,
+    ToolCallEndEvent,
+    StepFinishedEvent,
+    RunErrorEvent
+)
+from ag_ui.tools import ToolArgumentsError
+
+
+class AgentError(Exception):
+    """
+    An error raised by an agent that should be reported to the client.
+    """
+
+    def __init__(self, message: str, code: str = "AGENT_ERROR", retryable: bool = False):
+        super().__init__(message)
+        self.code = code
+        self.retryable = retryable
+
+
+def to_run_error(error: Exception) -> RunErrorEvent:
+    """
+    Converts an exception into a RunErrorEvent.
+
+    Agent errors carry their own code. Timeouts, connection failures and
+    invalid tool call arguments are usually transient and are marked as
+    retryable, everything else is not.
+
+    Only agent errors and invalid tool call arguments send their message to
+    the client. Other exceptions can reveal internals of the server, so they
+    are sent with a generic message and should be logged instead.
+    """
+    if isinstance(error, AgentError):
+        code, retryable, message = error.code, error.retryable, str(error)
+    elif isinstance(error, ToolArgumentsError):
+        code, retryable, message = "INVALID_TOOL_ARGUMENTS", True, str(error)
+    elif isinstance(error, (TimeoutError, ConnectionError)):
+        code, retryable, message = "UNAVAILABLE", True, "The agent is temporarily unavailable"
+    else:
+        code, retryable, message = "INTERNAL_ERROR", False, "The agent failed with an internal error"
+
+    return RunErrorEvent(
+        type=EventType.RUN_ERROR,
+        message=message or type(error).__name__,
+        code=code,
+        retryable=retryable
+    )
+
+
+class OpenSpans:
+    """
+    Tracks the text messages, tool calls and steps a run has started but not
+    yet finished, so they can be closed before the run errors.
+    """
+
+    def __init__(self):
+        # Maps (closing event type, id) to nothing; dicts keep insertion order
+        self._open: Dict[Tuple[EventType, str], None] = {}
+
+    def observe(self, event: BaseEvent) -> None:
+        """
+        Records an event sent to the client.
+        """
+        event_type = event.type
+        if event_type == EventType.TEXT_MESSAGE_START:
+            self._open[(EventType.TEXT_MESSAGE_END, event.message_id)] = None
+        elif event_type == EventType.TEXT_MESSAGE_END:
+            self._open.pop((EventType.TEXT_MESSAGE_END, event.message_id), None)
+        elif event_type == EventType.TOOL_CALL_START:
+            self._open[(EventType.TOOL_CALL_END, event.tool_call_id)] = None
+        elif event_type == EventType.TOOL_CALL_END:
+            self._open.pop((EventType.TOOL_CALL_END, event.tool_call_id), None)
+        elif event_type == EventType.STEP_STARTED:
+            self._open[(EventType.STEP_FINISHED, event.step_name)] = None
+        elif event_type == EventType.STEP_FINISHED:
+            self._open.pop((EventType.STEP_FINISHED, event.step_name), None)
+
+    def close(self) -> List[BaseEvent]:
+        """
+        Returns the events that close every open span, innermost first.
+        """
+        events: List[BaseEvent] = []
+        for event_type, span_id in reversed(self._open):
+            if event_type == EventType.TEXT_MESSAGE_END:
+                events.append(TextMessageEndEvent(type=event_type, message_id=span_id))
+            elif event_type == EventType.TOOL_CALL_END:
+                events.append(ToolCallEndEvent(type=event_type, tool_call_id=span_id))
+            else:
+                events.append(StepFinishedEvent(type=event_type, step_name=span_id))
+        self._open.clear()
+        return events
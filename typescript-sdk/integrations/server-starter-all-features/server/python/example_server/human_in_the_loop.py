@@ -1,17 +1,12 @@
 """
-Human in the loop endpoint for the AG-UI protocol.
+Human in the loop agent for the AG-UI protocol.
 """
 
-import uuid
-import asyncio
 import json
-from fastapi import Request
-from fastapi.responses import StreamingResponse
 from ag_ui.core import (
     RunAgentInput,
+    generate_id,
     EventType,
-    RunStartedEvent,
-    RunFinishedEvent,
     TextMessageStartEvent,
     TextMessageContentEvent,
     TextMessageEndEvent,
@@ -19,57 +14,28 @@ from ag_ui.core import (
     ToolCallArgsEvent,
     ToolCallEndEvent
 )
-from ag_ui.encoder import EventEncoder
-
-async def human_in_the_loop_endpoint(input_data: RunAgentInput, request: Request):
-    """Human in the loop endpoint"""
-    # Get the accept header from the request
-    accept_header = request.headers.get("accept")
-
-    # Create an event encoder to properly format SSE events
-    encoder = EventEncoder(accept=accept_header)
-
-    async def event_generator():
-        # Get the last message for conditional logic
-        last_message = None
-        if input_data.messages and len(input_data.messages) > 0:
-            last_message = input_data.messages[-1]
-
-        # Send run started event
-        yield encoder.encode(
-            RunStartedEvent(
-                type=EventType.RUN_STARTED,
-                thread_id=input_data.thread_id,
-                run_id=input_data.run_id
-            ),
-        )
+from ag_ui.threads import MessageIndex
+from .delays import simulate_delay
 
-        # Conditional logic based on last message role
-        if last_message and getattr(last_message, 'role', None) == "tool":
-            async for event in send_text_message_events():
-                yield encoder.encode(event)
-        else:
-            async for event in send_tool_call_events():
-                yield encoder.encode(event)
-
-        # Send run finished event
-        yield encoder.encode(
-            RunFinishedEvent(
-                type=EventType.RUN_FINISHED,
-                thread_id=input_data.thread_id,
-                run_id=input_data.run_id
-            ),
-        )
+async def human_in_the_loop_agent(input_data: RunAgentInput):
+    """Human in the loop agent"""
+    index = MessageIndex(input_data.messages)
 
-    return StreamingResponse(
-        event_generator(),
-        media_type=encoder.get_content_type()
-    )
+    # Resume once the client has answered every tool call, the last one with
+    # its result
+    last_message = index.last()
+    if last_message is not None and last_message.role == "tool" and not index.unanswered_tool_calls():
+        events = send_text_message_events()
+    else:
+        events = send_tool_call_events()
+
+    async for event in events:
+        yield event
 
 
 async def send_tool_call_events():
     """Send tool call events that generate task steps incrementally"""
-    tool_call_id = str(uuid.uuid4())
+    tool_call_id = generate_id()
     tool_call_name = "generate_task_steps"
 
     # Tool call start
@@ -103,7 +69,7 @@ async def send_tool_call_events():
         )
         
         # Sleep for 200ms
-        await asyncio.sleep(0.2)
+        await simulate_delay(0.2)
 
     # Close JSON structure
     yield ToolCallArgsEvent(
@@ -121,7 +87,7 @@ async def send_tool_call_events():
 
 async def send_text_message_events():
     """Send text message events with simple response"""
-    message_id = str(uuid.uuid4())
+    message_id = generate_id()
 
     # Start of message
     yield TextMessageStartEvent(
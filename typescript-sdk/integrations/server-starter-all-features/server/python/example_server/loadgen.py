@@ -0,0 +1,323 @@
+"""
+Load generator for the example server endpoints.
+
+Runs concurrent workers against the agents, either served in-process on an
+ephemeral port or on a running server, and reports time to first event,
+inter-event latency, events/s and bytes/s per worker:
+
+    python -m example_server.loadgen --concurrency 16 --requests 50 --delay-scale 0
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import uvicorn
+from .delays import DELAY_SCALE_ENV
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+ENDPOINTS = (
+    "agentic_chat",
+    "human_in_the_loop",
+    "agentic_generative_ui",
+    "tool_based_generative_ui",
+    "shared_state",
+    "predictive_state_updates",
+)
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+HISTOGRAM_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, float("inf"))
+
+
+@dataclass
+class Scenario:
+    """
+    What the workers send and how fast they read.
+    """
+    endpoints: Sequence[str] = ENDPOINTS
+    concurrency: int = 8
+    requests: int = 10
+    history: int = 1
+    tools: int = 0
+    state_size: int = 0
+    # Client read speed in bytes per second, None to read as fast as possible
+    read_rate: Optional[float] = None
+
+
+@dataclass
+class WorkerStats:
+    """
+    Measurements of one worker.
+    """
+    worker: int
+    requests: int = 0
+    errors: int = 0
+    events: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+    first_event: List[float] = field(default_factory=list)
+    inter_event: List[float] = field(default_factory=list)
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+
+def make_body(scenario: Scenario, index: int) -> Dict[str, Any]:
+    """
+    Returns a run input with the history, tools and state of the scenario.
+    """
+    messages = []
+    for number in range(scenario.history - 1):
+        messages.append({
+            "id": f"message-{number}",
+            "role": "user" if number % 2 == 0 else "assistant",
+            "content": f"Message {number} of the conversation so far."
+        })
+    messages.append({"id": f"message-{scenario.history}", "role": "user", "content": "Hello!"})
+
+    return {
+        "threadId": f"thread-{index}",
+        "runId": f"run-{index}",
+        "state": {
+            "items": [{"id": number, "name": f"Item {number}"} for number in range(scenario.state_size)]
+        },
+        "messages": messages,
+        "tools": [
+            {
+                "name": f"tool_{number}",
+                "description": f"Tool number {number}.",
+                "parameters": {"type": "object", "properties": {"value": {"type": "string"}}}
+            }
+            for number in range(scenario.tools)
+        ],
+        "context": [],
+        "forwardedProps": {}
+    }
+
+
+async def run_request(
+    client: "httpx.AsyncClient",
+    endpoint: str,
+    body: Dict[str, Any],
+    scenario: Scenario,
+    stats: WorkerStats
+) -> None:
+    """
+    Sends one run and records its events.
+    """
+    started = time.perf_counter()
+    last_event = None
+    buffer = b""
+    async with client.stream("POST", f"/{endpoint}", json=body) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            stats.bytes += len(chunk)
+            buffer += chunk
+            # Events are separated by a blank line
+            count = buffer.count(b"\n\n")
+            if count:
+                buffer = buffer[buffer.rindex(b"\n\n") + 2:]
+                now = time.perf_counter()
+                if last_event is None:
+                    stats.first_event.append(now - started)
+                else:
+                    stats.inter_event.append(now - last_event)
+                # Events that arrive in the same chunk are counted with no gap
+                stats.inter_event.extend([0.0] * (count - 1))
+                stats.events += count
+                last_event = now
+            if scenario.read_rate:
+                await asyncio.sleep(len(chunk) / scenario.read_rate)
+    stats.requests += 1
+
+
+async def run_worker(
+    client: "httpx.AsyncClient",
+    worker: int,
+    scenario: Scenario
+) -> WorkerStats:
+    """
+    Sends the worker's share of runs, cycling through the endpoints.
+    """
+    stats = WorkerStats(worker=worker)
+    started = time.perf_counter()
+    for number in range(scenario.requests):
+        index = worker * scenario.requests + number
+        endpoint = scenario.endpoints[index % len(scenario.endpoints)]
+        try:
+            await run_request(client, endpoint, make_body(scenario, index), scenario, stats)
+        except httpx.HTTPError:
+            stats.errors += 1
+    stats.elapsed = time.perf_counter() - started
+    return stats
+
+
+async def run_scenario(scenario: Scenario, url: Optional[str] = None) -> List[WorkerStats]:
+    """
+    Runs the scenario against `url`, or against the example app served in
+    this process.
+    """
+    if httpx is None:
+        raise RuntimeError("The load generator needs httpx: pip install httpx")
+
+    if url is not None:
+        return await _run_workers(scenario, url)
+
+    # The ASGI transport of httpx buffers whole responses, so serve the app
+    # on an ephemeral port to measure the stream as clients see it
+    from . import app
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    try:
+        while not server.started:
+            if serving.done():
+                serving.result()
+            await asyncio.sleep(0.01)
+        port = server.servers[0].sockets[0].getsockname()[1]
+        return await _run_workers(scenario, f"http://127.0.0.1:{port}")
+    finally:
+        server.should_exit = True
+        await serving
+
+
+async def _run_workers(scenario: Scenario, url: str) -> List[WorkerStats]:
+    limits = httpx.Limits(max_connections=scenario.concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=None) as client:
+        return list(await asyncio.gather(*(
+            run_worker(client, worker, scenario) for worker in range(scenario.concurrency)
+        )))
+
+
+def histogram(samples: Sequence[float]) -> Dict[str, int]:
+    """
+    Counts latencies, in seconds, per bucket of HISTOGRAM_BUCKETS_MS.
+    """
+    counts = [0] * len(HISTOGRAM_BUCKETS_MS)
+    for sample in samples:
+        counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, sample * 1000)] += 1
+    return {
+        (f"<={bound:g}ms" if bound != float("inf") else "inf"): count
+        for bound, count in zip(HISTOGRAM_BUCKETS_MS, counts)
+    }
+
+
+def percentiles(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    Returns the p50, p90 and p99 of latencies in milliseconds.
+    """
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else 0.0
+        return {"p50": value, "p90": value, "p99": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49] * 1000, "p90": cuts[89] * 1000, "p99": cuts[98] * 1000}
+
+
+def summarize(results: Sequence[WorkerStats]) -> Dict[str, Any]:
+    """
+    Returns the report of a run as JSON-compatible data.
+    """
+    first_event = [sample for stats in results for sample in stats.first_event]
+    inter_event = [sample for stats in results for sample in stats.inter_event]
+    return {
+        "workers": [
+            {
+                "worker": stats.worker,
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "events_per_second": stats.events_per_second,
+                "bytes_per_second": stats.bytes_per_second,
+                "first_event_ms": percentiles(stats.first_event),
+                "inter_event_ms": percentiles(stats.inter_event),
+            }
+            for stats in results
+        ],
+        "total": {
+            "requests": sum(stats.requests for stats in results),
+            "errors": sum(stats.errors for stats in results),
+            "events_per_second": sum(stats.events_per_second for stats in results),
+            "bytes_per_second": sum(stats.bytes_per_second for stats in results),
+            "first_event_ms": percentiles(first_event),
+            "inter_event_ms": percentiles(inter_event),
+            "inter_event_histogram": histogram(inter_event),
+        }
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    Formats a report as a table for the terminal.
+    """
+    lines = [
+        f"{'worker':>6} {'reqs':>5} {'errs':>5} {'events/s':>10} {'bytes/s':>12} "
+        f"{'ttfe p50':>9} {'ttfe p99':>9} {'gap p50':>8} {'gap p99':>8}"
+    ]
+    rows = report["workers"] + [{"worker": "total", **report["total"]}]
+    for row in rows:
+        lines.append(
+            f"{row['worker']:>6} {row['requests']:>5} {row['errors']:>5} "
+            f"{row['events_per_second']:>10.1f} {row['bytes_per_second']:>12.0f} "
+            f"{row['first_event_ms']['p50']:>9.2f} {row['first_event_ms']['p99']:>9.2f} "
+            f"{row['inter_event_ms']['p50']:>8.3f} {row['inter_event_ms']['p99']:>8.3f}"
+        )
+    lines.append("")
+    lines.append("inter-event latency histogram:")
+    for bucket, count in report["total"]["inter_event_histogram"].items():
+        lines.append(f"  {bucket:>9} {count}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the load generator from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="server to load, e.g. http://localhost:8000 (default: in-process)")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help="comma-separated endpoints")
+    parser.add_argument("--concurrency", type=int, default=8, help="number of concurrent workers")
+    parser.add_argument("--requests", type=int, default=10, help="runs per worker")
+    parser.add_argument("--history", type=int, default=1, help="messages per run input")
+    parser.add_argument("--tools", type=int, default=0, help="tools per run input")
+    parser.add_argument("--state-size", type=int, default=0, help="state items per run input")
+    parser.add_argument("--read-rate", type=float, help="client read speed in bytes/s")
+    parser.add_argument(
+        "--delay-scale", type=float,
+        help=f"scale of the agents' simulated delays, 0 to disable (sets {DELAY_SCALE_ENV}, in-process only)"
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.delay_scale is not None:
+        if args.url is not None:
+            print(f"--delay-scale only applies in-process; set {DELAY_SCALE_ENV} on the server",
+                  file=sys.stderr)
+        os.environ[DELAY_SCALE_ENV] = str(args.delay_scale)
+
+    scenario = Scenario(
+        endpoints=[endpoint.strip() for endpoint in args.endpoints.split(",") if endpoint.strip()],
+        concurrency=args.concurrency,
+        requests=args.requests,
+        history=max(args.history, 1),
+        tools=args.tools,
+        state_size=args.state_size,
+        read_rate=args.read_rate,
+    )
+    report = summarize(asyncio.run(run_scenario(scenario, args.url)))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,12 @@
 """
-Predictive state updates endpoint for the AG-UI protocol.
+Predictive state updates agent for the AG-UI protocol.
 """
 
-import uuid
-import asyncio
 import random
-from fastapi import Request
-from fastapi.responses import StreamingResponse
 from ag_ui.core import (
     RunAgentInput,
+    generate_id,
     EventType,
-    RunStartedEvent,
-    RunFinishedEvent,
     TextMessageStartEvent,
     TextMessageContentEvent,
     TextMessageEndEvent,
@@ -20,52 +15,23 @@ from ag_ui.core import (
     ToolCallEndEvent,
     CustomEvent
 )
-from ag_ui.encoder import EventEncoder
-
-async def predictive_state_updates_endpoint(input_data: RunAgentInput, request: Request):
-    """Predictive state updates endpoint"""
-    # Get the accept header from the request
-    accept_header = request.headers.get("accept")
-
-    # Create an event encoder to properly format SSE events
-    encoder = EventEncoder(accept=accept_header)
-
-    async def event_generator():
-        # Get the last message for conditional logic
-        last_message = None
-        if input_data.messages and len(input_data.messages) > 0:
-            last_message = input_data.messages[-1]
-
-        # Send run started event
-        yield encoder.encode(
-            RunStartedEvent(
-                type=EventType.RUN_STARTED,
-                thread_id=input_data.thread_id,
-                run_id=input_data.run_id
-            ),
-        )
+from .delays import simulate_delay
 
-        # Conditional logic based on last message role
-        if last_message and getattr(last_message, 'role', None) == "tool":
-            async for event in send_text_message_events():
-                yield encoder.encode(event)
-        else:
-            async for event in send_tool_call_events():
-                yield encoder.encode(event)
-
-        # Send run finished event
-        yield encoder.encode(
-            RunFinishedEvent(
-                type=EventType.RUN_FINISHED,
-                thread_id=input_data.thread_id,
-                run_id=input_data.run_id
-            ),
-        )
+async def predictive_state_updates_agent(input_data: RunAgentInput):
+    """Predictive state updates agent"""
+    # Get the last message for conditional logic
+    last_message = None
+    if input_data.messages and len(input_data.messages) > 0:
+        last_message = input_data.messages[-1]
 
-    return StreamingResponse(
-        event_generator(),
-        media_type=encoder.get_content_type()
-    )
+    # Conditional logic based on last message role
+    if last_message and getattr(last_message, 'role', None) == "tool":
+        events = send_text_message_events()
+    else:
+        events = send_tool_call_events()
+
+    async for event in events:
+        yield event
 
 
 def make_story(name: str) -> str:
@@ -79,7 +45,7 @@ dog_names = ["Rex", "Buddy", "Max", "Charlie", "Buddy", "Max", "Charlie"]
 
 async def send_tool_call_events():
     """Send tool call events with predictive state and incremental story generation"""
-    tool_call_id = str(uuid.uuid4())
+    tool_call_id = generate_id()
     tool_call_name = "write_document"
 
     # Generate a random story
@@ -120,7 +86,7 @@ async def send_tool_call_events():
             tool_call_id=tool_call_id,
             delta=chunk + " "
         )
-        await asyncio.sleep(0.2)  # 200ms delay
+        await simulate_delay(0.2)  # 200ms delay
 
     # Close JSON arguments
     yield ToolCallArgsEvent(
@@ -136,7 +102,7 @@ async def send_tool_call_events():
     )
 
     # Second tool call: confirm_changes
-    tool_call_id_2 = str(uuid.uuid4())
+    tool_call_id_2 = generate_id()
     tool_call_name_2 = "confirm_changes"
 
     yield ToolCallStartEvent(
@@ -159,7 +125,7 @@ async def send_tool_call_events():
 
 async def send_text_message_events():
     """Send simple text message events"""
-    message_id = str(uuid.uuid4())
+    message_id = generate_id()
 
     # Start of message
     yield TextMessageStartEvent(
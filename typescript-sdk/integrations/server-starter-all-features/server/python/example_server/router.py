@@ -0,0 +1,321 @@
+"""
+Router for serving agents over the AG-UI protocol.
+"""
+
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Union
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from ag_ui.core import (
+    RunAgentInput,
+    BaseEvent,
+    EventType,
+    RunStartedEvent,
+    RunFinishedEvent
+)
+from ag_ui.encoder import EventEncoder, Instrumentation, OffloadPolicy, SnapshotCache
+from ag_ui.eventlog import open_recording, replay
+from ag_ui.state import PredictiveStateEmitter
+from ag_ui.threads import ThreadStore, UnknownThreadVersionError
+from ag_ui.tools import (
+    TOOLS_REF_HEADER,
+    ToolCache,
+    ToolCallValidator,
+    UnknownToolsRefError,
+    compile_tool_schemas
+)
+from .errors import OpenSpans, to_run_error
+
+logger = logging.getLogger(__name__)
+
+# An agent receives the run input and yields the events of the run
+Agent = Callable[[RunAgentInput], AsyncIterator[BaseEvent]]
+
+_run_agent_input_body: Optional[Dict[str, Any]] = None
+
+
+def run_agent_input_body() -> Dict[str, Any]:
+    """
+    Returns the OpenAPI request body of the agent endpoints. The endpoints
+    parse their body themselves, so FastAPI does not document it.
+    """
+    global _run_agent_input_body
+    if _run_agent_input_body is None:
+        schema = RunAgentInput.model_json_schema(by_alias=True)
+        definitions = schema.pop("$defs", {})
+
+        def inline(value: Any) -> Any:
+            # The definitions are inlined, as "#/$defs" does not resolve in OpenAPI
+            if isinstance(value, dict):
+                ref = value.get("$ref")
+                if ref is not None and ref.startswith("#/$defs/"):
+                    return inline(definitions[ref[len("#/$defs/"):]])
+                return {key: inline(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [inline(item) for item in value]
+            return value
+
+        _run_agent_input_body = {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}},
+        }
+    return _run_agent_input_body
+
+
+def with_predicted_state(agent: Agent) -> Agent:
+    """
+    Wraps an agent so that the state it predicts is sent as STATE_DELTA events.
+    """
+    def run(input_data: RunAgentInput) -> AsyncIterator[BaseEvent]:
+        return PredictiveStateEmitter().stream(agent(input_data))
+
+    run.__name__ = getattr(agent, "__name__", "agent")
+    return run
+
+
+def with_validated_tool_calls(agent: Agent, tool_cache: Optional[ToolCache] = None) -> Agent:
+    """
+    Wraps an agent so that its run fails as soon as the arguments of a tool
+    call stop matching the schema of a tool in the run input. Schemas of
+    tool lists in `tool_cache` are compiled once for all runs.
+    """
+    def run(input_data: RunAgentInput) -> AsyncIterator[BaseEvent]:
+        cached = tool_cache.get(input_data.tools_ref) if tool_cache is not None else None
+        if cached is not None:
+            validator = ToolCallValidator(schemas=cached.derive("schemas", compile_tool_schemas))
+        else:
+            validator = ToolCallValidator(input_data.tools)
+        return validator.stream(agent(input_data))
+
+    run.__name__ = getattr(agent, "__name__", "agent")
+    return run
+
+
+class AGUIRouter(APIRouter):
+    """
+    A FastAPI router that serves agents over the AG-UI protocol.
+
+    Agents only yield the events of their run. The router negotiates the
+    encoding, sends the lifecycle events, turns exceptions into a
+    RunErrorEvent and streams the encoded events to the client.
+
+    When an agent fails mid-run, the messages, tool calls and steps it left
+    open are closed before the RunErrorEvent is sent, so the client receives
+    a well-formed stream and can decide whether retrying is worthwhile.
+
+    With `instrumentation`, the encoders of all runs report their measurements
+    to it, labelled with the name of the agent.
+
+    Tool lists are validated once and kept in `tool_cache`, shared by all
+    agents of the router. The reference of the tools of a run is returned
+    in the AG-UI-Tools-Ref response header, which browsers only see when
+    CORS exposes it, and clients can send it as `toolsRef` instead of the
+    same tools; an unknown reference is answered with 409 Conflict, after
+    which the client sends the tools again.
+
+    With `thread_store`, the message history of each thread is kept on the
+    server and clients can send only the messages added since their
+    `baseVersion`. A base the store does not have is answered with 409
+    Conflict as well, after which the client sends the whole history from
+    base version 0. Any client that knows a thread ID can run on its
+    history, so applications that enable the store must use unguessable
+    thread IDs or authorize them before the request reaches the router.
+
+    With `offload`, large events such as big state snapshots are encoded off
+    the event loop, so they do not stall the other streams of the server.
+    With `snapshot_cache`, state snapshots that agents send again, as the
+    same state frozen with `freeze_state`, are encoded once for all runs.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        instrumentation: Optional[Instrumentation] = None,
+        tool_cache: Optional[ToolCache] = None,
+        thread_store: Optional[ThreadStore] = None,
+        offload: Optional[OffloadPolicy] = None,
+        snapshot_cache: Optional[SnapshotCache] = None,
+        **kwargs: Any
+    ):
+        super().__init__(*args, **kwargs)
+        self.instrumentation = instrumentation
+        self.tool_cache = tool_cache if tool_cache is not None else ToolCache()
+        self.thread_store = thread_store
+        self.offload = offload
+        self.snapshot_cache = snapshot_cache
+
+    def add_agent(
+        self,
+        path: str,
+        agent: Agent,
+        predict_state: bool = False,
+        validate_tool_calls: bool = False
+    ) -> None:
+        """
+        Registers an agent under the given path.
+
+        With `predict_state`, predicted state is derived from the agent's tool
+        call arguments on the server and sent as STATE_DELTA events.
+
+        With `validate_tool_calls`, tool call arguments are checked against
+        the tool schemas while they stream, and the run is stopped with a
+        retryable RunErrorEvent as soon as they become invalid.
+        """
+        name = getattr(agent, "__name__", None)
+        if validate_tool_calls:
+            agent = with_validated_tool_calls(agent, self.tool_cache)
+        if predict_state:
+            agent = with_predicted_state(agent)
+
+        async def endpoint(request: Request):
+            # Runs are measured from the arrival of the request
+            started = time.perf_counter()
+            input_data = await self.parse_input(request)
+
+            # Create an event encoder for the format accepted by the client
+            encoder = EventEncoder(
+                accept=request.headers.get("accept"),
+                instrumentation=self.instrumentation,
+                agent=name,
+                offload=self.offload,
+                snapshot_cache=self.snapshot_cache,
+                started=started
+            )
+
+            headers = {}
+            if input_data.tools_ref is not None:
+                headers[TOOLS_REF_HEADER] = input_data.tools_ref
+
+            return StreamingResponse(
+                self.stream(agent, input_data, encoder),
+                media_type=encoder.get_content_type(),
+                headers=headers
+            )
+
+        self.add_api_route(
+            path,
+            endpoint,
+            methods=["POST"],
+            name=name,
+            openapi_extra={"requestBody": run_agent_input_body()}
+        )
+
+    def add_recording(
+        self,
+        path: str,
+        recording_path: Union[str, os.PathLike],
+        speed: Optional[float] = 1.0
+    ) -> None:
+        """
+        Registers a recorded run, an event log or a JSON lines file, under the
+        given path. Every request replays it at `speed` times the recorded
+        pace, or as fast as possible if `speed` is None; the request body is
+        ignored.
+        """
+        async def endpoint(request: Request):
+            encoder = EventEncoder(
+                accept=request.headers.get("accept"),
+                instrumentation=self.instrumentation,
+                agent=os.path.basename(recording_path)
+            )
+
+            async def stream() -> AsyncIterator[bytes]:
+                with open_recording(recording_path) as recording:
+                    async for data in replay(recording, encoder, speed=speed):
+                        yield data
+
+            return StreamingResponse(stream(), media_type=encoder.get_content_type())
+
+        self.add_api_route(path, endpoint, methods=["POST"])
+
+    def agent(
+        self,
+        path: str,
+        predict_state: bool = False,
+        validate_tool_calls: bool = False
+    ) -> Callable[[Agent], Agent]:
+        """
+        Decorator that registers an agent under the given path.
+        """
+        def decorator(agent: Agent) -> Agent:
+            self.add_agent(
+                path,
+                agent,
+                predict_state=predict_state,
+                validate_tool_calls=validate_tool_calls
+            )
+            return agent
+        return decorator
+
+    async def parse_input(self, request: Request) -> RunAgentInput:
+        """
+        Validates the run input of a request, with its tools from the tool
+        cache and its history from the thread store.
+        """
+        try:
+            input_data = self.tool_cache.parse_run_agent_input(await request.body())
+            if self.thread_store is not None:
+                return await self.thread_store.resolve_async(input_data)
+            # Without a store, a run from base version 0 holds the whole history
+            if input_data.base_version:
+                raise UnknownThreadVersionError(input_data.thread_id, input_data.base_version)
+            return input_data
+        except ValidationError as error:
+            # Located in the body, like the errors of FastAPI's own validation
+            raise RequestValidationError([
+                {**details, "loc": ("body", *details["loc"])}
+                for details in error.errors(include_url=False)
+            ]) from None
+        except ValueError as error:
+            # Body that is not JSON
+            raise RequestValidationError(
+                [{"type": "json_invalid", "loc": ("body",), "msg": str(error), "input": None}]
+            ) from None
+        except (UnknownToolsRefError, UnknownThreadVersionError) as error:
+            raise HTTPException(status_code=409, detail=str(error)) from None
+
+    async def stream(
+        self,
+        agent: Agent,
+        input_data: RunAgentInput,
+        encoder: EventEncoder
+    ) -> AsyncIterator[str]:
+        """
+        Runs an agent and yields its encoded events, wrapped in the run lifecycle.
+        """
+        spans = OpenSpans()
+
+        # Send run started event
+        yield encoder.encode(
+            RunStartedEvent(
+                type=EventType.RUN_STARTED,
+                thread_id=input_data.thread_id,
+                run_id=input_data.run_id
+            )
+        )
+
+        try:
+            async for event in agent(input_data):
+                spans.observe(event)
+                yield await encoder.encode_async(event)
+        except Exception as error:
+            logger.exception("Agent run %s failed", input_data.run_id)
+
+            # Let the client know the run failed instead of dropping the connection
+            for event in spans.close():
+                yield encoder.encode(event)
+            yield encoder.encode(to_run_error(error))
+            return
+
+        # Send run finished event
+        yield encoder.encode(
+            RunFinishedEvent(
+                type=EventType.RUN_FINISHED,
+                thread_id=input_data.thread_id,
+                run_id=input_data.run_id
+            )
+        )
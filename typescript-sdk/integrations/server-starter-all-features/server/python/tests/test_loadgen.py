@@ -0,0 +1,62 @@
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+from example_server.delays import DELAY_SCALE_ENV
+from example_server.loadgen import (
+    ENDPOINTS,
+    Scenario,
+    format_report,
+    histogram,
+    make_body,
+    percentiles,
+    run_scenario,
+    summarize
+)
+
+
+class TestLoadgen(unittest.TestCase):
+    """Test suite for the load generator"""
+
+    def test_run_scenario(self):
+        """Test that one worker runs every endpoint in-process and is reported"""
+        scenario = Scenario(concurrency=1, requests=len(ENDPOINTS), history=3, tools=2, state_size=5)
+        with mock.patch.dict(os.environ, {DELAY_SCALE_ENV: "0"}):
+            results = asyncio.run(run_scenario(scenario))
+        report = summarize(results)
+
+        total = report["total"]
+        self.assertEqual(len(report["workers"]), 1)
+        self.assertEqual(total["errors"], 0)
+        self.assertEqual(total["requests"], len(ENDPOINTS))
+        self.assertGreater(total["events_per_second"], 0)
+        self.assertGreater(total["first_event_ms"]["p50"], 0)
+        self.assertEqual(sum(total["inter_event_histogram"].values()), len(results[0].inter_event))
+        self.assertIn("total", format_report(report))
+
+    def test_make_body(self):
+        """Test that run inputs have the size of the scenario"""
+        body = make_body(Scenario(history=4, tools=3, state_size=7), index=2)
+        self.assertEqual(body["threadId"], "thread-2")
+        self.assertEqual(len(body["messages"]), 4)
+        self.assertEqual(body["messages"][-1]["role"], "user")
+        self.assertEqual(len(body["tools"]), 3)
+        self.assertEqual(len(body["state"]["items"]), 7)
+
+    def test_percentiles_and_histogram(self):
+        """Test that latencies in seconds are reported in milliseconds"""
+        self.assertEqual(percentiles([]), {"p50": 0.0, "p90": 0.0, "p99": 0.0})
+        self.assertEqual(percentiles([0.002])["p99"], 2.0)
+        samples = [index / 1000 for index in range(1, 101)]
+        self.assertAlmostEqual(percentiles(samples)["p50"], 50.5)
+
+        counts = histogram([0.00005, 0.003, 0.003, 2.0])
+        self.assertEqual(counts["<=0.1ms"], 1)
+        self.assertEqual(counts["<=5ms"], 2)
+        self.assertEqual(counts["inf"], 1)
+        self.assertEqual(sum(counts.values()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ag_ui.core import EventType, TextMessageChunkEvent
+from ag_ui.threads import ThreadStore
+from ag_ui.tools import TOOLS_REF_HEADER
+from example_server.router import AGUIRouter
+
+
+async def echo_agent(input_data):
+    """Answers with the IDs of the messages of the run"""
+    yield TextMessageChunkEvent(
+        type=EventType.TEXT_MESSAGE_CHUNK,
+        message_id="reply",
+        role="assistant",
+        delta=",".join(message.id for message in input_data.messages)
+    )
+
+
+def make_body(message_ids, base_version=None):
+    body = {
+        "threadId": "thread",
+        "runId": "run",
+        "state": {},
+        "messages": [
+            {"id": message_id, "role": "user", "content": "Hello"} for message_id in message_ids
+        ],
+        "tools": [],
+        "context": [],
+        "forwardedProps": {}
+    }
+    if base_version is not None:
+        body["baseVersion"] = base_version
+    return body
+
+
+def make_client(thread_store=None):
+    router = AGUIRouter(thread_store=thread_store)
+    router.add_agent("/echo", echo_agent)
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+class TestBaseVersion(unittest.TestCase):
+    """Test suite for runs that build on a base version of their thread"""
+
+    def test_base_version_zero_without_store(self):
+        """Test that a whole history sent from base version 0 is run without a thread store"""
+        response = make_client().post("/echo", json=make_body(["m1", "m2"], base_version=0))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('"delta":"m1,m2"', response.text)
+
+    def test_unknown_base_version_without_store(self):
+        """Test that a run on top of messages the server does not have is answered with 409"""
+        response = make_client().post("/echo", json=make_body(["m3"], base_version=2))
+        self.assertEqual(response.status_code, 409)
+
+    def test_negative_base_version(self):
+        """Test that a negative base version is rejected as invalid input"""
+        response = make_client().post("/echo", json=make_body(["m1"], base_version=-1))
+        self.assertEqual(response.status_code, 422)
+
+    def test_base_version_with_store(self):
+        """Test that runs with a thread store only send the new messages"""
+        client = make_client(ThreadStore())
+        client.post("/echo", json=make_body(["m1"], base_version=0))
+        response = client.post("/echo", json=make_body(["m2"], base_version=1))
+        self.assertIn('"delta":"m1,m2"', response.text)
+
+
+class TestToolsRef(unittest.TestCase):
+    """Test suite for sending tools by reference"""
+
+    def test_reference_is_returned(self):
+        """Test that the reference of the tools is returned, and accepted in their place"""
+        client = make_client()
+        # Numbers and escapes that JSON.stringify writes differently from Python
+        tools = [{
+            "name": "weather",
+            "description": "Gets the weather in °C\u2028",
+            "parameters": {"type": "object", "properties": {"days": {"type": "number", "maximum": 1.0}}}
+        }]
+        response = client.post("/echo", json={**make_body(["m1"]), "tools": tools})
+        ref = response.headers[TOOLS_REF_HEADER]
+
+        response = client.post("/echo", json={**make_body(["m2"]), "tools": [], "toolsRef": ref})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers[TOOLS_REF_HEADER], ref)
+
+    def test_no_reference_without_tools(self):
+        """Test that runs without tools get no reference"""
+        response = make_client().post("/echo", json=make_body(["m1"]))
+        self.assertNotIn(TOOLS_REF_HEADER, response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -367,4 +367,75 @@ describe("defaultApplyEvents with tool calls", () => {
     expect(finalState.messages[1]?.toolCalls?.[0]?.id).toBe("tool2");
     expect(finalState.messages[1]?.toolCalls?.[0]?.function?.name).toBe("calculate");
   });
+
+  it("should route interleaved tool call args by tool call ID", async () => {
+    // Create a subject and state for events
+    const events$ = new Subject<BaseEvent>();
+    const initialState: AgentState = {
+      messages: [],
+      state: {},
+    };
+
+    // Create the observable stream
+    const result$ = defaultApplyEvents(initialState, events$);
+
+    // Collect all emitted state updates in an array
+    const stateUpdatesPromise = firstValueFrom(result$.pipe(toArray()));
+
+    // Start two tool calls in the same message and interleave their args
+    events$.next({ type: EventType.RUN_STARTED } as RunStartedEvent);
+    events$.next({
+      type: EventType.TOOL_CALL_START,
+      toolCallId: "tool1",
+      toolCallName: "search",
+      parentMessageId: "message1",
+    } as ToolCallStartEvent);
+    events$.next({
+      type: EventType.TOOL_CALL_START,
+      toolCallId: "tool2",
+      toolCallName: "calculate",
+      parentMessageId: "message1",
+    } as ToolCallStartEvent);
+    events$.next({
+      type: EventType.TOOL_CALL_ARGS,
+      toolCallId: "tool1",
+      delta: '{"query": ',
+    } as ToolCallArgsEvent);
+    events$.next({
+      type: EventType.TOOL_CALL_ARGS,
+      toolCallId: "tool2",
+      delta: '{"expression": "1+1"}',
+    } as ToolCallArgsEvent);
+    events$.next({
+      type: EventType.TOOL_CALL_ARGS,
+      toolCallId: "tool1",
+      delta: '"test"}',
+    } as ToolCallArgsEvent);
+    events$.next({
+      type: EventType.TOOL_CALL_END,
+      toolCallId: "tool1",
+    } as ToolCallEndEvent);
+    events$.next({
+      type: EventType.TOOL_CALL_END,
+      toolCallId: "tool2",
+    } as ToolCallEndEvent);
+
+    // Add a small delay to ensure any potential updates would be processed
+    await new Promise((resolve) => setTimeout(resolve, 10));
+
+    // Complete the events stream
+    events$.complete();
+
+    // Wait for all state updates
+    const stateUpdates = await stateUpdatesPromise;
+
+    // Both tool calls belong to the same message and keep their own arguments
+    const finalState = stateUpdates[stateUpdates.length - 1];
+    expect(finalState.messages.length).toBe(1);
+    expect(finalState.messages[0]?.toolCalls?.length).toBe(2);
+    expect(finalState.messages[0]?.toolCalls?.[0]?.function?.arguments).toBe('{"query": "test"}');
+    expect(finalState.messages[0]?.toolCalls?.[1]?.function?.arguments).toBe(
+      '{"expression": "1+1"}',
+    );
+  });
 });
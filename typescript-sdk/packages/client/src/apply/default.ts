@@ -12,6 +12,7 @@ import {
   CustomEvent,
   BaseEvent,
   AssistantMessage,
+  ToolCall,
 } from "@ag-ui/core";
 import { mergeMap } from "rxjs/operators";
 import { structuredClone_ } from "../utils";
@@ -26,6 +27,21 @@ interface PredictStateValue {
   tool_argument: string;
 }
 
+// Finds a tool call by ID, searching the most recent messages first
+const findToolCall = (messages: Message[], toolCallId: string): ToolCall | undefined => {
+  for (let i = messages.length - 1; i >= 0; i--) {
+    const message = messages[i];
+    if (message.role !== "assistant" || !message.toolCalls) {
+      continue;
+    }
+    const toolCall = message.toolCalls.find((toolCall) => toolCall.id === toolCallId);
+    if (toolCall) {
+      return toolCall;
+    }
+  }
+  return undefined;
+};
+
 export const defaultApplyEvents = (...args: Parameters<ApplyEvents>): ReturnType<ApplyEvents> => {
   const [input, events$] = args;
 
@@ -109,34 +125,34 @@ export const defaultApplyEvents = (...args: Parameters<ApplyEvents>): ReturnType
         }
 
         case EventType.TOOL_CALL_ARGS: {
-          const { delta } = event as ToolCallArgsEvent;
-
-          // Get the last message
-          const lastMessage = messages[messages.length - 1];
+          const { toolCallId, delta } = event as ToolCallArgsEvent;
 
-          // Get the last tool call
-          const lastToolCall = lastMessage.toolCalls[lastMessage.toolCalls.length - 1];
+          // Tool calls may be interleaved, so find the one the arguments belong to
+          const targetToolCall = findToolCall(messages, toolCallId);
+          if (!targetToolCall) {
+            return emitNoUpdate();
+          }
 
           // Append the arguments
-          lastToolCall.function.arguments += delta;
+          targetToolCall.function.arguments += delta;
 
           if (predictState) {
-            const config = predictState.find((p) => p.tool === lastToolCall.function.name);
+            const config = predictState.find((p) => p.tool === targetToolCall.function.name);
             if (config) {
               try {
-                const lastToolCallArguments = JSON.parse(
-                  untruncateJson(lastToolCall.function.arguments),
+                const toolCallArguments = JSON.parse(
+                  untruncateJson(targetToolCall.function.arguments),
                 );
-                if (config.tool_argument && config.tool_argument in lastToolCallArguments) {
+                if (config.tool_argument && config.tool_argument in toolCallArguments) {
                   state = {
                     ...state,
-                    [config.state_key]: lastToolCallArguments[config.tool_argument],
+                    [config.state_key]: toolCallArguments[config.tool_argument],
                   };
                   return emitUpdate({ messages, state });
                 } else {
                   state = {
                     ...state,
-                    [config.state_key]: lastToolCallArguments,
+                    [config.state_key]: toolCallArguments,
                   };
                   return emitUpdate({ messages, state });
                 }
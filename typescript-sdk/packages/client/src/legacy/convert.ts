@@ -121,7 +121,13 @@ export const convertToLegacyEvents =
           case EventType.TOOL_CALL_ARGS: {
             const argsEvent = event as ToolCallArgsEvent;
 
-            const currentToolCall = currentToolCalls[currentToolCalls.length - 1];
+            // Tool calls may be interleaved, so find the one the arguments belong to
+            const currentToolCall = currentToolCalls.find(
+              (toolCall) => toolCall.id === argsEvent.toolCallId,
+            );
+            if (!currentToolCall) {
+              return [];
+            }
             currentToolCall.function.arguments += argsEvent.delta;
             let didUpdateState = false;
 
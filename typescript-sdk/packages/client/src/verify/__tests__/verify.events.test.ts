@@ -31,7 +31,7 @@ describe("verifyEvents general validation", () => {
     const events: BaseEvent[] = [];
 
     // Create a subscription that will complete only after an error
-    const subscription = verifyEvents(source$).subscribe({
+    const subscription = verifyEvents(false)(source$).subscribe({
       next: (event) => events.push(event),
       error: (err) => {
         expect(err).toBeInstanceOf(AGUIError);
@@ -75,7 +75,7 @@ describe("verifyEvents general validation", () => {
     const events: BaseEvent[] = [];
 
     // Create a subscription that will complete only after an error
-    const subscription = verifyEvents(source$).subscribe({
+    const subscription = verifyEvents(false)(source$).subscribe({
       next: (event) => events.push(event),
       error: (err) => {
         expect(err).toBeInstanceOf(AGUIError);
@@ -114,7 +114,7 @@ describe("verifyEvents general validation", () => {
     const events: BaseEvent[] = [];
 
     // Create a subscription that will complete only after an error
-    const subscription = verifyEvents(source$).subscribe({
+    const subscription = verifyEvents(false)(source$).subscribe({
       next: (event) => events.push(event),
       error: (err) => {
         expect(err).toBeInstanceOf(AGUIError);
@@ -159,7 +159,7 @@ describe("verifyEvents general validation", () => {
     const events: BaseEvent[] = [];
 
     // Create a subscription that will complete only after an error
-    const subscription = verifyEvents(source$).subscribe({
+    const subscription = verifyEvents(false)(source$).subscribe({
       next: (event) => events.push(event),
       error: (err) => {
         expect(err).toBeInstanceOf(AGUIError);
@@ -198,7 +198,7 @@ describe("verifyEvents general validation", () => {
 
     // Set up subscription and collect events
     const promise = firstValueFrom(
-      verifyEvents(source$).pipe(
+      verifyEvents(false)(source$).pipe(
         toArray(),
         catchError((err) => {
           throw err;
@@ -252,7 +252,7 @@ describe("verifyEvents general validation", () => {
 
     // Set up subscription and collect events
     const promise = firstValueFrom(
-      verifyEvents(source$).pipe(
+      verifyEvents(false)(source$).pipe(
         toArray(),
         catchError((err) => {
           throw err;
@@ -310,7 +310,7 @@ describe("verifyEvents general validation", () => {
 
     // Set up subscription and collect events
     const promise = firstValueFrom(
-      verifyEvents(source$).pipe(
+      verifyEvents(false)(source$).pipe(
         toArray(),
         catchError((err) => {
           throw err;
@@ -394,7 +394,7 @@ describe("verifyEvents events", () => {
     const events: BaseEvent[] = [];
 
     // Create a subscription that will complete only after an error
-    const subscription = verifyEvents(source$).subscribe({
+    const subscription = verifyEvents(false)(source$).subscribe({
       next: (event) => events.push(event),
       error: (err) => {
         expect(err).toBeInstanceOf(AGUIError);
@@ -438,7 +438,7 @@ describe("verifyEvents events", () => {
     const events: BaseEvent[] = [];
 
     // Create a subscription that will complete only after an error
-    const subscription = verifyEvents(source$).subscribe({
+    const subscription = verifyEvents(false)(source$).subscribe({
       next: (event) => events.push(event),
       error: (err) => {
         expect(err).toBeInstanceOf(AGUIError);
@@ -477,7 +477,7 @@ describe("verifyEvents events", () => {
     const events: BaseEvent[] = [];
 
     // Create a subscription that will complete only after an error
-    const subscription = verifyEvents(source$).subscribe({
+    const subscription = verifyEvents(false)(source$).subscribe({
       next: (event) => events.push(event),
       error: (err) => {
         expect(err).toBeInstanceOf(AGUIError);
@@ -522,7 +522,7 @@ describe("verifyEvents events", () => {
     const events: BaseEvent[] = [];
 
     // Create a subscription that will complete only after an error
-    const subscription = verifyEvents(source$).subscribe({
+    const subscription = verifyEvents(false)(source$).subscribe({
       next: (event) => events.push(event),
       error: (err) => {
         expect(err).toBeInstanceOf(AGUIError);
@@ -561,7 +561,7 @@ describe("verifyEvents events", () => {
 
     // Set up subscription and collect events
     const promise = firstValueFrom(
-      verifyEvents(source$).pipe(
+      verifyEvents(false)(source$).pipe(
         toArray(),
         catchError((err) => {
           throw err;
@@ -620,7 +620,7 @@ describe("verifyEvents events", () => {
 
     // Set up subscription and collect events
     const promise = firstValueFrom(
-      verifyEvents(source$).pipe(
+      verifyEvents(false)(source$).pipe(
         toArray(),
         catchError((err) => {
           throw err;
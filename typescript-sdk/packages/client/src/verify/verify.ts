@@ -2,12 +2,19 @@ import { BaseEvent, EventType, AGUIError } from "@ag-ui/core";
 import { Observable, throwError, of } from "rxjs";
 import { mergeMap } from "rxjs/operators";
 
+// Formats a set of IDs for error messages, e.g. 't1' or 't1', 't2'
+const formatIds = (ids: Set<string>) =>
+  Array.from(ids)
+    .map((id) => `'${id}'`)
+    .join(", ");
+
 export const verifyEvents =
   (debug: boolean) =>
   (source$: Observable<BaseEvent>): Observable<BaseEvent> => {
     // Declare variables in closure to maintain state across events
     let activeMessageId: string | undefined;
-    let activeToolCallId: string | undefined;
+    // Tool calls may be interleaved, so several can be active at once
+    let activeToolCallIds = new Set<string>();
     let runFinished = false;
     let runError = false; // New flag to track if RUN_ERROR has been sent
     // New flags to track first/last event requirements
@@ -65,9 +72,10 @@ export const verifyEvents =
         }
 
         // Forbid lifecycle events and text message events inside a tool call
-        if (activeToolCallId !== undefined) {
-          // Define allowed event types inside a tool call
+        if (activeToolCallIds.size > 0) {
+          // Define allowed event types inside a tool call; other tool calls may interleave
           const allowedEventTypes = [
+            EventType.TOOL_CALL_START,
             EventType.TOOL_CALL_ARGS,
             EventType.TOOL_CALL_END,
             EventType.RAW,
@@ -75,16 +83,6 @@ export const verifyEvents =
 
           // If the event type is not in the allowed list, throw an error
           if (!allowedEventTypes.includes(eventType)) {
-            // Special handling for nested tool calls for better error message
-            if (eventType === EventType.TOOL_CALL_START) {
-              return throwError(
-                () =>
-                  new AGUIError(
-                    `Cannot send 'TOOL_CALL_START' event: A tool call is already in progress. Complete it with 'TOOL_CALL_END' first.`,
-                  ),
-              );
-            }
-
             return throwError(
               () =>
                 new AGUIError(
@@ -178,23 +176,24 @@ export const verifyEvents =
 
           // Tool call flow
           case EventType.TOOL_CALL_START: {
-            // Can't start a tool call if one is already in progress
-            if (activeToolCallId !== undefined) {
+            // Can't start a tool call that is already in progress
+            const toolCallId = (event as any).toolCallId;
+            if (activeToolCallIds.has(toolCallId)) {
               return throwError(
                 () =>
                   new AGUIError(
-                    `Cannot send 'TOOL_CALL_START' event: A tool call is already in progress. Complete it with 'TOOL_CALL_END' first.`,
+                    `Cannot send 'TOOL_CALL_START' event: A tool call with ID '${toolCallId}' is already in progress. Complete it with 'TOOL_CALL_END' first.`,
                   ),
               );
             }
 
-            activeToolCallId = (event as any).toolCallId;
+            activeToolCallIds.add(toolCallId);
             return of(event);
           }
 
           case EventType.TOOL_CALL_ARGS: {
-            // Must be in a tool call and IDs must match
-            if (activeToolCallId === undefined) {
+            // Must be in a tool call and the ID must be one of the active tool calls
+            if (activeToolCallIds.size === 0) {
               return throwError(
                 () =>
                   new AGUIError(
@@ -203,11 +202,11 @@ export const verifyEvents =
               );
             }
 
-            if ((event as any).toolCallId !== activeToolCallId) {
+            if (!activeToolCallIds.has((event as any).toolCallId)) {
               return throwError(
                 () =>
                   new AGUIError(
-                    `Cannot send 'TOOL_CALL_ARGS' event: Tool call ID mismatch. The ID '${(event as any).toolCallId}' doesn't match the active tool call ID '${activeToolCallId}'.`,
+                    `Cannot send 'TOOL_CALL_ARGS' event: Tool call ID mismatch. The ID '${(event as any).toolCallId}' doesn't match the active tool call ID ${formatIds(activeToolCallIds)}.`,
                   ),
               );
             }
@@ -216,8 +215,8 @@ export const verifyEvents =
           }
 
           case EventType.TOOL_CALL_END: {
-            // Must be in a tool call and IDs must match
-            if (activeToolCallId === undefined) {
+            // Must be in a tool call and the ID must be one of the active tool calls
+            if (activeToolCallIds.size === 0) {
               return throwError(
                 () =>
                   new AGUIError(
@@ -226,17 +225,17 @@ export const verifyEvents =
               );
             }
 
-            if ((event as any).toolCallId !== activeToolCallId) {
+            if (!activeToolCallIds.has((event as any).toolCallId)) {
               return throwError(
                 () =>
                   new AGUIError(
-                    `Cannot send 'TOOL_CALL_END' event: Tool call ID mismatch. The ID '${(event as any).toolCallId}' doesn't match the active tool call ID '${activeToolCallId}'.`,
+                    `Cannot send 'TOOL_CALL_END' event: Tool call ID mismatch. The ID '${(event as any).toolCallId}' doesn't match the active tool call ID ${formatIds(activeToolCallIds)}.`,
                   ),
               );
             }
 
             // Reset tool call state
-            activeToolCallId = undefined;
+            activeToolCallIds.delete((event as any).toolCallId);
             return of(event);
           }
 
@@ -44,6 +44,7 @@ export const RunErrorSchema = BaseEventSchema.extend({
   type: z.literal(EventType.RUN_ERROR),
   message: z.string(),
   code: z.string().optional(),
+  retryable: z.boolean().optional(),
 });
 
 export const StepStartedSchema = BaseEventSchema.extend({
@@ -149,6 +150,7 @@ export const RunErrorEventSchema = BaseEventSchema.extend({
   type: z.literal(EventType.RUN_ERROR),
   message: z.string(),
   code: z.string().optional(),
+  retryable: z.boolean().optional(),
 });
 
 export const StepStartedEventSchema = BaseEventSchema.extend({
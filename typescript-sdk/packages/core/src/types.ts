@@ -81,6 +81,8 @@ export const RunAgentInputSchema = z.object({
   tools: z.array(ToolSchema),
   context: z.array(ContextSchema),
   forwardedProps: z.any(),
+  toolsRef: z.string().optional(), // From the AG-UI-Tools-Ref header of an earlier run, sent with empty tools
+  baseVersion: z.number().int().nonnegative().optional(), // Number of messages of the thread the server already has; messages then only holds the ones that follow
 });
 
 export const StateSchema = z.any();